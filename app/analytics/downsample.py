@@ -0,0 +1,132 @@
+import numpy as np
+from core.config import CHART_MAX_POINTS, CHART_DOWNSAMPLING
+
+# =====================================================
+# CHART DOWNSAMPLING
+# =====================================================
+# A 15-year daily trace has far more points than a chart has pixels, and
+# Plotly serializes and draws all of them. Traces longer than max_points
+# are reduced on the server before they reach the figure:
+#   "lttb"    Largest-Triangle-Three-Buckets: one point per bucket, the one
+#             forming the largest triangle with its neighbours; keeps the
+#             shape of the line
+#   "minmax"  the lowest and highest point of every bucket; keeps every
+#             visible extreme exactly
+# Shorter traces (narrow date ranges) are returned at full resolution.
+
+
+def lttb(x, y, n):
+    """
+    Indices of the n points LTTB keeps (first and last always included)
+    """
+
+    size = len(y)
+
+    if n >= size:
+        return np.arange(size)
+
+    if n < 3:
+        return np.array([0, size - 1])
+
+    # n - 2 buckets between the fixed first and last point
+    edges = np.linspace(1, size - 1, n - 1).astype(np.int64)
+    bounds = np.append(edges, size)
+
+    # mean of each bucket, the final point standing in for the last one
+    counts = np.diff(bounds)
+    mean_x = (np.add.reduceat(x, bounds[:-1]) / counts).tolist()
+    mean_y = (np.add.reduceat(y, bounds[:-1]) / counts).tolist()
+
+    # buckets hold a few points each, where plain floats beat NumPy calls
+    xs, ys, edges = x.tolist(), y.tolist(), edges.tolist()
+
+    idx = [0]
+    a = 0
+
+    for i in range(n - 2):
+        xa, ya = xs[a], ys[a]
+        dx, dy = xa - mean_x[i + 1], mean_y[i + 1] - ya
+        best = -1.0
+
+        # doubled triangle area between the previous pick, the candidate
+        # and the next bucket's mean
+        for j in range(edges[i], edges[i + 1]):
+            area = abs(dx * (ys[j] - ya) - (xa - xs[j]) * dy)
+            if area > best:
+                best, a = area, j
+
+        idx.append(a)
+
+    idx.append(size - 1)
+
+    return np.array(idx)
+
+
+def minmax(y, n):
+    """
+    Indices of each bucket's minimum and maximum, at most n points
+    """
+
+    size = len(y)
+
+    if n >= size:
+        return np.arange(size)
+
+    buckets = max((n - 2) // 2, 1)
+
+    width = -(-size // buckets)
+    buckets = -(-size // width)
+
+    # equal-width rows; the padding of the last row never wins
+    rows = np.full(buckets * width, np.nan)
+    rows[:size] = y
+    rows = rows.reshape(buckets, width)
+
+    offsets = np.arange(buckets) * width
+    picks = np.concatenate([
+        [0, size - 1],
+        offsets + np.nanargmin(rows, axis=1),
+        offsets + np.nanargmax(rows, axis=1),
+    ])
+
+    return np.unique(picks)
+
+
+def downsample(x, y, max_points=CHART_MAX_POINTS, method=CHART_DOWNSAMPLING):
+    """
+    (x, y) reduced to about max_points for plotting; unchanged when the
+    trace is already short enough. Missing values are dropped before
+    reducing, so long traces are drawn without gaps.
+    """
+
+    x = np.asarray(x)
+    y = np.asarray(y)
+
+    if not max_points or len(y) <= max_points:
+        return x, y
+
+    # selection runs in float64, the trace keeps the column's dtype
+    values = y.astype("float64")
+
+    valid = ~np.isnan(values)
+    if not valid.all():
+        x, y, values = x[valid], y[valid], values[valid]
+
+    if method == "minmax":
+        idx = minmax(values, max_points)
+    else:
+        # LTTB needs numeric x; dates as nanoseconds
+        xs = x.astype("datetime64[ns]").astype("int64") if np.issubdtype(x.dtype, np.datetime64) else x
+        idx = lttb(xs.astype("float64"), values, max_points)
+
+    return x[idx], y[idx]
+
+
+def chart_points(df, column, x="Date", **kwargs):
+    """
+    x / y arguments of a Plotly trace for one column, downsampled
+    """
+
+    xs, ys = downsample(df[x], df[column], **kwargs)
+
+    return dict(x=xs, y=ys)
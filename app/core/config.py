@@ -1,7 +1,34 @@
+import sys
 from pathlib import Path
 
 PROJECT_ROOT = Path(__file__).resolve().parents[2]
 
-DATA_PATH = PROJECT_ROOT / "data" / "processed" / "nifty50_processed.csv"
+# the dataset store lives in src/, shared with the training pipeline
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.append(str(PROJECT_ROOT))
+
+PROCESSED_DATASET = "processed"
+TECHNICAL_DATASET = "technical"
 LSTM_MODEL_DIR = PROJECT_ROOT / "models" / "lstm"
-PROPHET_MODEL_DIR = PROJECT_ROOT / "models" / "prophet"
\ No newline at end of file
+PROPHET_MODEL_DIR = PROJECT_ROOT / "models" / "prophet"
+ARIMA_MODEL_DIR = PROJECT_ROOT / "models"
+
+# memory budget of the process-wide model cache (app/models/registry.py)
+MODEL_CACHE_MB = 512
+
+# serve short-term forecasts from the single multi-stock LSTM when it is trained
+USE_GLOBAL_LSTM = False
+
+# serve short-term forecasts from the direct multi-horizon LSTM when it is trained
+# (one forward pass for the whole window instead of a recursive rollout)
+USE_DIRECT_LSTM = False
+
+# import the forecasting backends (statsmodels, Prophet) in a background thread
+# once the Prediction page has rendered, instead of on the first Predict click
+PRELOAD_MODEL_BACKENDS = True
+
+# long chart traces are downsampled to about this many points per trace
+# (app/analytics/downsample.py); "minmax" keeps every bucket's high and low,
+# "lttb" the line shape. Shorter ranges are drawn at full resolution.
+CHART_MAX_POINTS = 1000
+CHART_DOWNSAMPLING = "minmax"
\ No newline at end of file
@@ -1,7 +1,168 @@
+import threading
+import numpy as np
 import pandas as pd
-from core.config import DATA_PATH
+from core.config import PROCESSED_DATASET, TECHNICAL_DATASET
+from src.price_arrays import INDEX_NAME, arrays_dir, open_arrays
+from src.forecast_store import open_forecasts
+from src.market_summary import build_summary, read_summary, summary_path
 
-def load_data():
-    df = pd.read_csv(DATA_PATH)
-    df["Date"] = pd.to_datetime(df["Date"])
-    return df
\ No newline at end of file
+# =====================================================
+# SCHEMA
+# =====================================================
+# Columns each dataset serves. Date is the row key and always comes
+# first; Stock is added only when requested. Dtypes are not declared here:
+# callers receive the dtypes the pipeline stored, as recorded in the array
+# index, so columns are served uncopied and models see exactly the values
+# they were fitted on.
+
+PRICE_SCHEMA = ["Date", "Open", "High", "Low", "Close", "Volume"]
+
+SCHEMAS = {
+    PROCESSED_DATASET: PRICE_SCHEMA,
+    TECHNICAL_DATASET: PRICE_SCHEMA + ["Returns", "SMA_20", "SMA_50", "Volatility_20", "RSI_14"],
+}
+
+KEY_COLUMN = "Date"
+STOCK_COLUMN = "Stock"
+
+# =====================================================
+# DATASET SERVICE
+# =====================================================
+# One process-wide entry point for every page. Reads go to the
+# memory-mapped arrays (src/price_arrays.py), so a request for Date/Close
+# of one stock slices two arrays over that stock's rows and never touches
+# the other columns or stocks. A dataset is re-mapped when its arrays are
+# rebuilt (the daily update), checked with one stat of the index file.
+
+
+class DatasetService:
+
+    def __init__(self, schemas=SCHEMAS):
+        self.schemas = schemas
+        self._arrays = {}                   # dataset -> (PriceArrays, index mtime)
+        self._lock = threading.Lock()
+
+    def _open(self, dataset):
+
+        if dataset not in self.schemas:
+            raise ValueError(f"Unknown dataset: {dataset} (expected one of {', '.join(self.schemas)})")
+
+        path = arrays_dir(dataset) / INDEX_NAME
+        mtime = path.stat().st_mtime_ns if path.exists() else None
+
+        with self._lock:
+
+            cached = self._arrays.get(dataset)
+            if cached is not None and cached[1] == mtime:
+                return cached[0]
+
+            # the last built arrays; rebuilding is the pipeline's job
+            arrays = open_arrays(dataset, rebuild=False)
+
+            missing = [c for c in self.schemas[dataset] if c not in arrays.arrays]
+            if missing:
+                raise ValueError(
+                    f"{dataset} arrays lack {', '.join(missing)}\n"
+                    f"Rebuild: python -m src.price_arrays"
+                )
+
+            self._arrays[dataset] = (arrays, mtime)
+
+            return arrays
+
+    def _columns(self, dataset, columns):
+        """
+        (value columns with Date first, whether Stock was requested);
+        rejects columns outside the schema
+        """
+
+        schema = self.schemas[dataset]
+        unknown = [c for c in columns if c not in schema and c != STOCK_COLUMN]
+
+        if unknown:
+            raise ValueError(f"Unknown columns for {dataset}: {', '.join(unknown)}")
+
+        values = [KEY_COLUMN] + [c for c in columns if c not in (KEY_COLUMN, STOCK_COLUMN)]
+
+        return values, STOCK_COLUMN in columns
+
+    def schema(self, dataset=PROCESSED_DATASET) -> dict:
+        """
+        Column -> dtype served for a dataset, as stored in its arrays
+        """
+
+        dtypes = self._open(dataset).index["columns"]
+
+        return {col: dtypes[col] for col in self.schemas[dataset]}
+
+    def stocks(self, dataset=PROCESSED_DATASET) -> list:
+        return self._open(dataset).stocks
+
+    def frame(self, dataset, stock, columns) -> pd.DataFrame:
+        """
+        One stock's history (sorted by date), decoding only `columns`
+        """
+
+        arrays = self._open(dataset)
+        values, with_stock = self._columns(dataset, columns)
+
+        # zero-copy views in the stored dtypes
+        df = pd.DataFrame(arrays.columns(stock, values), copy=False)
+
+        if with_stock:
+            df[STOCK_COLUMN] = pd.Categorical.from_codes(
+                np.zeros(len(df), dtype="int8"), categories=[stock]
+            )
+
+        return df
+
+    def read(self, dataset, columns, stocks=None) -> pd.DataFrame:
+        """
+        Several stocks stacked (sorted by stock, then date) with a
+        categorical Stock column; every stock when `stocks` is None
+        """
+
+        stocks = self.stocks(dataset) if stocks is None else list(stocks)
+        values, _ = self._columns(dataset, columns)
+
+        frames = [self.frame(dataset, stock, values) for stock in stocks]
+
+        if frames:
+            df = pd.concat(frames, ignore_index=True)
+        else:
+            dtypes = self.schema(dataset)
+            df = pd.DataFrame({c: pd.Series(dtype=dtypes[c]) for c in values})
+
+        codes = np.repeat(np.arange(len(stocks), dtype="int32"), [len(f) for f in frames])
+        df[STOCK_COLUMN] = pd.Categorical.from_codes(codes, categories=stocks)
+
+        return df
+
+    def summary(self) -> pd.DataFrame:
+        """
+        Per-stock market summary (first/last close, return, volatility,
+        records) as last written by the pipeline; computed without saving
+        if it has not been written yet
+        """
+
+        summary = read_summary()
+
+        return build_summary(save=False) if summary is None else summary
+
+    def summary_version(self):
+        """
+        Modification time of the stored summary (None when missing), to key page caches on
+        """
+
+        path = summary_path()
+
+        return path.stat().st_mtime_ns if path.exists() else None
+
+    def forecasts(self):
+        """
+        Precomputed forecast table (src/forecast_store.py), None until the batch job has run
+        """
+        return open_forecasts()
+
+
+datasets = DatasetService()
\ No newline at end of file
@@ -0,0 +1,222 @@
+import time
+import uuid
+import pickle
+import threading
+import warnings
+import joblib
+import numpy as np
+from statsmodels.tsa.arima.model import ARIMA
+from core.config import ARIMA_MODEL_DIR
+from models.registry import registry
+from src.model_cache import artifact_key, load_artifacts, update_entry
+
+# =====================================================
+# CONFIGURATION
+# =====================================================
+# The app only extends a model's state with new observations, in memory
+# (a Kalman filter pass over the new rows, parameters fixed). The nightly
+# forecast batch (src/forecast_store.py) re-estimates the parameters with
+# the same order, and saves them, when either trips:
+REESTIMATE_EVERY_DAYS = 30      # schedule: age of the last full fit
+DRIFT_WINDOW = 20               # latest one-step errors checked for drift
+DRIFT_MIN_OBS = 5
+DRIFT_THRESHOLD = 2.0           # RMS of standardized one-step errors (~1 when the model holds)
+
+INTERVAL_ALPHA = 0.05           # 95% forecast intervals
+
+# only models saved by the order search are served: they are fitted on
+# the business-day level series this service extends
+SOURCE = "arima_search"
+
+_lock = threading.Lock()
+
+# service state per stock, kept outside the model registry so evicting a
+# model does not drop it: {"fitted_at", "errors", "errors_through"}
+_state = {}
+
+
+def model_path(stock):
+    return ARIMA_MODEL_DIR / f"arima_{stock}.pkl"
+
+
+def to_series(stock_df):
+    """
+    Same business-day, forward-filled Close series the models were fitted on
+    """
+
+    series = stock_df.set_index("Date")["Close"].astype("float64")
+
+    return series.asfreq("B").ffill().dropna()
+
+
+def _artifact(stock, results):
+    """
+    The model's entry in models/_artifacts.json; raises unless the order
+    search wrote it and the saved model still has the recorded order
+    """
+
+    entry = load_artifacts().get(artifact_key("arima", stock))
+    order = list(results.model.order)
+
+    if entry is None or entry.get("source") != SOURCE or entry.get("order") != order:
+        raise RuntimeError(
+            f"ARIMA model for {stock} has no order-search record for ARIMA{tuple(order)}\n"
+            f"Retrain: python -m src.models.classical.arima_search"
+        )
+
+    return entry
+
+
+def _load(stock):
+    """
+    Fitted results, cached in the model registry. An evicted model is
+    reloaded from disk and re-extended with the new rows on its next
+    update; its service state is kept.
+    """
+
+    path = model_path(stock)
+
+    def load():
+
+        if not path.exists():
+            raise FileNotFoundError(
+                f"ARIMA model not found for {stock}\nExpected: {path}"
+            )
+
+        results = joblib.load(path)
+        fitted_at = _artifact(stock, results)["fitted_at"]
+
+        state = _state.setdefault(stock, {
+            "errors": [],
+            "errors_through": results.fittedvalues.index[-1],
+        })
+        state["fitted_at"] = fitted_at
+
+        return results
+
+    return registry.get("arima", stock, load, [path])
+
+
+def _charge(stock, results):
+    """
+    Re-cache a replaced results object at its pickled size: an extended
+    model holds only the new rows, a refit the full history
+    """
+    registry.put("arima", stock, results, len(pickle.dumps(results)), [model_path(stock)])
+
+# =====================================================
+# STATE UPDATES (NO RE-ESTIMATION)
+# =====================================================
+
+def update(stock, stock_df):
+    """
+    Extend the model with observations newer than its last date,
+    keeping the fitted parameters; returns the current results
+    """
+
+    series = to_series(stock_df)
+
+    with _lock:
+
+        results = _load(stock)
+        state = _state[stock]
+
+        new = series[series.index > results.fittedvalues.index[-1]]
+
+        if len(new):
+            results = results.extend(new)
+            _charge(stock, results)
+
+            # a reloaded model re-extends rows whose errors were counted
+            z = results.filter_results.standardized_forecasts_error[0]
+            z = z[new.index > state["errors_through"]]
+
+            state["errors"] = (state["errors"] + z.tolist())[-DRIFT_WINDOW:]
+            state["errors_through"] = new.index[-1]
+
+    return results
+
+
+def drift_detected(stock):
+
+    z = np.asarray(_state[stock]["errors"])
+
+    if len(z) < DRIFT_MIN_OBS:
+        return False
+
+    return float(np.sqrt(np.mean(z ** 2))) > DRIFT_THRESHOLD
+
+
+def reestimation_due(stock):
+
+    age_days = (time.time() - _state[stock]["fitted_at"]) / 86400
+
+    return age_days >= REESTIMATE_EVERY_DAYS or drift_detected(stock)
+
+# =====================================================
+# FULL RE-ESTIMATION
+# =====================================================
+
+def reestimate(stock, stock_df):
+    """
+    Refit the same order on the full history, starting from the current
+    parameters; replaces both the saved model and the in-process copy.
+    Run by the batch job, not the app. Returns None, saving nothing, when
+    the order search replaced the model meanwhile.
+    """
+
+    series = to_series(stock_df)
+
+    with _lock:
+        results = _load(stock)
+
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        refit = ARIMA(series, order=results.model.order).fit(
+            start_params=results.params
+        )
+
+    path = model_path(stock)
+    tmp = path.with_name(f"{path.name}.{uuid.uuid4().hex[:12]}.tmp")
+    joblib.dump(refit, tmp)
+
+    # swapped in only if the entry still records the order that was refit
+    fitted_at = time.time()
+    order = list(results.model.order)
+
+    if not update_entry(
+        "arima", stock, expect={"source": SOURCE, "order": order},
+        replace={tmp: path}, fitted_at=fitted_at
+    ):
+        tmp.unlink(missing_ok=True)
+        return None
+
+    with _lock:
+        _charge(stock, refit)
+        _state[stock].update(fitted_at=fitted_at, errors=[], errors_through=series.index[-1])
+
+    return refit
+
+
+# =====================================================
+# FORECAST
+# =====================================================
+
+def predict_arima(stock_df, stock, future_days, alpha=INTERVAL_ALPHA):
+    """
+    Multi-step forecast with (1 - alpha) intervals.
+    Returns (dates, mean, lower, upper).
+    """
+
+    # state extended in memory; parameters are re-estimated by the batch job
+    results = update(stock, stock_df)
+
+    forecast = results.get_forecast(future_days)
+    interval = forecast.conf_int(alpha=alpha)
+
+    return (
+        forecast.predicted_mean.index,
+        forecast.predicted_mean.to_numpy(),
+        interval.iloc[:, 0].to_numpy(),
+        interval.iloc[:, 1].to_numpy(),
+    )
@@ -0,0 +1,63 @@
+import importlib
+import sys
+import threading
+
+# =====================================================
+# LAZY MODEL BACKENDS
+# =====================================================
+# Each service module pulls in its framework at import (statsmodels for
+# ARIMA, Prophet/cmdstanpy for Prophet). Pages import them through
+# `backend()` when a forecast is actually requested, so opening a page
+# does not pay for frameworks the user never selects. `preload()` imports
+# them in a daemon thread after the first render; Python's per-module
+# import locks make a concurrent `backend()` call wait for that import
+# instead of running it twice.
+
+BACKENDS = {
+    "lstm": "models.lstm_service",
+    "arima": "models.arima_service",
+    "prophet": "models.prophet_service",
+}
+
+LOG = "[BACKENDS]"
+
+_preload_thread = None
+_preload_lock = threading.Lock()
+
+
+def backend(name):
+    """
+    Service module of a model backend, imported on first use
+    """
+
+    return importlib.import_module(BACKENDS[name])
+
+
+def loaded():
+    return {name: module in sys.modules for name, module in BACKENDS.items()}
+
+
+def preload(names=None):
+    """
+    Import the backends in a background thread, once per process; returns
+    the thread so callers can wait for it
+    """
+
+    global _preload_thread
+
+    with _preload_lock:
+
+        if _preload_thread is None:
+
+            def run():
+                for name in names or BACKENDS:
+                    try:
+                        backend(name)
+                    except Exception as e:
+                        # the foreground import raises it again when used
+                        print(f"{LOG} Preload of {name} failed: {e}")
+
+            _preload_thread = threading.Thread(target=run, name="backend-preload", daemon=True)
+            _preload_thread.start()
+
+    return _preload_thread
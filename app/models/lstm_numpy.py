@@ -0,0 +1,182 @@
+import numpy as np
+
+# =====================================================
+# PURE-NUMPY LSTM RUNTIME
+# =====================================================
+# Forward pass of the trainers' networks from exported weights
+# (src/train_lstm_model.export_weights), so serving needs no TensorFlow:
+#
+#   per-stock:  LSTM(64, seq) -> LSTM(64) -> Dense(1), or Dense(horizon)
+#               for the direct multi-horizon model, whose outputs are
+#               offsets from the window's last close
+#   global:     [window ++ stock embedding] -> LSTM(64, seq) -> LSTM(64) -> Dense(1)
+#
+# Keras LSTM semantics: gates packed [input, forget, cell, output],
+# sigmoid recurrent activation, tanh activation. Dropout is inactive at
+# inference. All math runs in float32, like Keras. Both layers advance in
+# the same time loop since layer 2 only needs layer 1's current output.
+
+
+def sigmoid(x):
+    return 1.0 / (1.0 + np.exp(-x))
+
+
+def gate_order(units):
+    """
+    Column permutation [i, f, c, o] -> [i, f, o, c]: the three sigmoid
+    gates become one contiguous block
+    """
+
+    i, f, c, o = (np.arange(k * units, (k + 1) * units) for k in range(4))
+    return np.concatenate([i, f, o, c])
+
+
+def cell(z, c, units):
+    """
+    One LSTM cell update from reordered pre-activations z -> (h, c)
+    """
+
+    s = sigmoid(z[..., :3 * units])
+    c = s[..., units:2 * units] * c + s[..., :units] * np.tanh(z[..., 3 * units:])
+
+    return s[..., 2 * units:] * np.tanh(c), c
+
+
+class NumpyLSTM:
+    """
+    Exported network + MinMax scaling for one stock, or for every stock of
+    the global model (rows of scaler_min / scaler_scale follow `stocks`)
+    """
+
+    def __init__(self, weights):
+        self.w = {k: weights[k] for k in weights.files if k != "stocks"}
+        self.stocks = [str(s) for s in weights["stocks"]] if "stocks" in weights.files else []
+        self.ids = {s: i for i, s in enumerate(self.stocks)}
+        self._fuse()
+
+    @classmethod
+    def load(cls, path):
+        with np.load(path) as weights:
+            return cls(weights)
+
+    def _fuse(self):
+        """
+        Inference layout of the weights: gates reordered, and layer 2's
+        kernel stacked on its recurrent kernel so [h1, h2] @ wu2 is one
+        matmul per step
+        """
+
+        w = self.w
+        self.units = units = w["lstm1_recurrent"].shape[0]
+        order = gate_order(units)
+
+        self.k1 = w["lstm1_kernel"][:, order]
+        self.u1 = w["lstm1_recurrent"][:, order]
+        self.b1 = w["lstm1_bias"][order]
+        self.wu2 = np.vstack([w["lstm2_kernel"], w["lstm2_recurrent"]])[:, order]
+        self.b2 = w["lstm2_bias"][order]
+
+        # days per forward pass: 1, or the horizon of a direct model
+        self.horizon = w["dense_kernel"].shape[1]
+
+    def _row(self, stock):
+        return self.ids[stock] if stock is not None else 0
+
+    # -------- MinMaxScaler ---------
+    def scale(self, values, stock=None):
+        i = self._row(stock)
+        return values * self.w["scaler_scale"][i] + self.w["scaler_min"][i]
+
+    def unscale(self, values, stock=None):
+        i = self._row(stock)
+        return (values - self.w["scaler_min"][i]) / self.w["scaler_scale"][i]
+
+    # -------- forward pass ---------
+    def _offset(self, batch, ids):
+        """
+        Part of layer 1's input projection that is the same at every step:
+        the bias, plus the stock embedding's share for the global model
+        """
+
+        if "embedding" in self.w:
+            return self.w["embedding"][np.asarray(ids)] @ self.k1[1:] + self.b1
+
+        return np.broadcast_to(self.b1, (batch, self.b1.shape[0]))
+
+    def predict(self, windows, ids=None):
+        """
+        One forward pass. windows: (batch, lookback, 1) scaled closes;
+        ids: (batch,) stock ids for the global model.
+        Returns (batch, horizon).
+        """
+
+        x = np.asarray(windows, dtype=np.float32)
+        batch, lookback, _ = x.shape
+        units = self.units
+
+        xw1 = x @ self.k1[:1] + self._offset(batch, ids)[:, None]
+
+        h = np.zeros((batch, 2 * units), dtype=np.float32)     # [h1, h2]
+        c1 = np.zeros((batch, units), dtype=np.float32)
+        c2 = np.zeros((batch, units), dtype=np.float32)
+
+        for t in range(lookback):
+            h[:, :units], c1 = cell(xw1[:, t] + h[:, :units] @ self.u1, c1, units)
+            h[:, units:], c2 = cell(h @ self.wu2 + self.b2, c2, units)
+
+        out = h[:, units:] @ self.w["dense_kernel"] + self.w["dense_bias"]
+
+        return out + x[:, -1] if self.horizon > 1 else out
+
+    def rollout(self, windows, steps, ids=None):
+        """
+        Recursive multi-step forecast in one call (one-step models); each
+        prediction is fed back as the newest close.
+        Returns (batch, steps) scaled predictions.
+
+        Forecast k reads closes k .. k+lookback-1 from zero state, and only
+        its last input is forecast k-1's output. Starting forecast k one
+        tick after forecast k-1 therefore gives every running forecast the
+        same input at each tick: tick t feeds close t to all of them as one
+        batched cell update, and the oldest one finishes and appends its
+        prediction as close t+1. N steps take N + lookback - 1 ticks
+        instead of N * lookback sequential cell updates.
+        """
+
+        x = np.asarray(windows, dtype=np.float32)
+        batch, lookback, _ = x.shape
+        units = self.units
+
+        offset = self._offset(batch, ids)
+        kernel = self.k1[:1]
+
+        # layer-1 input projection of every close, known and predicted
+        xw1 = np.empty((batch, lookback + steps, kernel.shape[1]), dtype=np.float32)
+        xw1[:, :lookback] = x @ kernel + offset[:, None]
+
+        # per-forecast state: [h1, h2], c1, c2
+        h = np.zeros((batch, steps, 2 * units), dtype=np.float32)
+        c1 = np.zeros((batch, steps, units), dtype=np.float32)
+        c2 = np.zeros((batch, steps, units), dtype=np.float32)
+
+        out = np.empty((batch, steps), dtype=np.float32)
+
+        for t in range(lookback + steps - 1):
+
+            # forecasts that have started and not yet finished
+            first = max(0, t - lookback + 1)
+            run = slice(first, min(t, steps - 1) + 1)
+
+            h[:, run, :units], c1[:, run] = cell(
+                xw1[:, t, None] + h[:, run, :units] @ self.u1, c1[:, run], units
+            )
+            h[:, run, units:], c2[:, run] = cell(
+                h[:, run] @ self.wu2 + self.b2, c2[:, run], units
+            )
+
+            if t >= lookback - 1:
+                p = h[:, first, units:] @ self.w["dense_kernel"] + self.w["dense_bias"]
+                out[:, first] = p[:, 0]
+                xw1[:, t + 1] = p @ kernel + offset
+
+        return out
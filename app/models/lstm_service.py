@@ -1,39 +1,130 @@
 import numpy as np
 import pandas as pd
-import joblib
 from pathlib import Path
-from tensorflow.keras.models import load_model
+from core.config import USE_GLOBAL_LSTM, USE_DIRECT_LSTM
+from models.lstm_numpy import NumpyLSTM
+from models.registry import registry
 
 PROJECT_ROOT = Path(__file__).resolve().parents[2]
 MODEL_DIR = PROJECT_ROOT/ "models" / "lstm"
 LOOKBACK = 60
 
+# exported weights (src/train_lstm_model.export_weights); serving runs on
+# NumPy alone, TensorFlow is only needed for training
+GLOBAL_WEIGHTS_PATH = MODEL_DIR / "global.npz"
+
+
+def load_weights(path):
+    """
+    NumpyLSTM for an exported .npz, cached in the model registry
+    """
+
+    def load():
+
+        if not path.exists():
+            raise FileNotFoundError(
+                f"LSTM weights not exported\nExpected: {path}\n"
+                "Run: python -c \"from src.train_lstm_model import export_existing; export_existing()\""
+            )
+
+        return NumpyLSTM.load(path)
+
+    return registry.get("lstm", path.stem, load, [path])
+
+
+def load_global():
+    """
+    Global multi-stock model; None if not trained
+    """
+
+    if not GLOBAL_WEIGHTS_PATH.exists():
+        return None
+
+    return load_weights(GLOBAL_WEIGHTS_PATH)
+
+
+def load_direct(stock, future_days):
+    """
+    Direct multi-horizon model if trained and it covers future_days, else None
+    """
+
+    path = MODEL_DIR / f"{stock.replace('.NS','')}_direct.npz"
+
+    if not path.exists():
+        return None
+
+    model = load_weights(path)
+
+    return model if model.horizon >= future_days else None
+
+
+def future_dates(stock_df, future_days):
+
+    return pd.bdate_range(
+        start=stock_df["Date"].iloc[-1],
+        periods=future_days+1
+    )[1:]
+
+
 def predict_lstm(stock_df, stock, future_days):
 
+    if USE_GLOBAL_LSTM:
+        model = load_global()
+        if model is not None and stock in model.ids:
+            preds = predict_lstm_all({stock: stock_df["Close"].values}, future_days)[stock]
+            return future_dates(stock_df, future_days), preds.reshape(-1,1)
+
     name = stock.replace(".NS","")
 
-    model = load_model(MODEL_DIR / f"{name}.keras")
-    scaler = joblib.load(MODEL_DIR / f"{name}_scaler.pkl")
+    direct = load_direct(stock, future_days) if USE_DIRECT_LSTM else None
+    model = direct or load_weights(MODEL_DIR / f"{name}.npz")
 
     series = stock_df["Close"].values.reshape(-1,1)
-    scaled = scaler.transform(series)
+    scaled = model.scale(series)
 
     window = scaled[-LOOKBACK:].reshape(1,LOOKBACK,1)
 
-    preds = []
-
-    for _ in range(future_days):
-        p = model.predict(window, verbose=0)[0][0]
-        preds.append(p)
-        window = np.append(window[:,1:,:], [[[p]]], axis=1)
+    if direct is not None:
+        # every day from one forward pass
+        preds = model.predict(window)[0, :future_days]
+    else:
+        # all future_days steps in one recursive rollout
+        preds = model.rollout(window, future_days)[0]
 
-    preds = scaler.inverse_transform(
-        np.array(preds).reshape(-1,1)
+    preds = model.unscale(
+        preds.astype("float64").reshape(-1,1)
     )
 
-    dates = pd.bdate_range(
-        start=stock_df["Date"].iloc[-1],
-        periods=future_days+1
-    )[1:]
+    dates = future_dates(stock_df, future_days)
 
     return dates, preds
+
+
+def predict_lstm_all(closes, future_days=1):
+    """
+    Forecast many stocks at once with the global model: one batched
+    rollout over all of them.
+    closes: {stock: close history}. Returns {stock: array of future_days prices}.
+    """
+
+    model = load_global()
+
+    if model is None:
+        raise FileNotFoundError(
+            f"Global LSTM not trained\nExpected: {GLOBAL_WEIGHTS_PATH}"
+        )
+
+    stocks = list(closes)
+
+    window = np.stack([
+        model.scale(np.asarray(closes[s], dtype="float64")[-LOOKBACK:].reshape(-1,1), s)
+        for s in stocks
+    ]).astype("float32")
+    ids = np.array([model.ids[s] for s in stocks], dtype="int32")
+
+    steps = model.rollout(window, future_days, ids)
+
+    return {
+        s: model.unscale(steps[i].astype("float64"), s)
+        for i, s in enumerate(stocks)
+    }
@@ -1,28 +1,61 @@
 import joblib
+import pandas as pd
+from prophet.serialize import model_from_json
 from core.config import PROPHET_MODEL_DIR
+from models.registry import registry
 
 
-def predict_prophet(stock, years):
+def load_prophet(stock):
+    """
+    Slim JSON artifact (history stripped) when exported, else the full
+    pickle; cached in the model registry
+    """
 
+    slim_path = PROPHET_MODEL_DIR / f"{stock}.json"
     model_path = PROPHET_MODEL_DIR / f"{stock}.pkl"
 
-    if not model_path.exists():
+    def load():
+
+        if slim_path.exists():
+            return model_from_json(slim_path.read_text())
+
+        if model_path.exists():
+            return joblib.load(model_path)
+
         raise FileNotFoundError(
-            f"Prophet model not found for {stock}\nExpected: {model_path}"
+            f"Prophet model not found for {stock}\nExpected: {slim_path}"
         )
 
-    model = joblib.load(model_path)
+    return registry.get("prophet", stock, load, [slim_path if slim_path.exists() else model_path])
+
+
+def future_dates(model, periods, freq="B"):
+    """
+    The dates make_future_dataframe would append after the history, without the history
+    """
+
+    last = model.history_dates.max()
+    dates = pd.date_range(start=last, periods=periods + 1, freq=freq)
+
+    return dates[dates > last][:periods]
+
+
+def predict_prophet(stock, years):
+
+    model = load_prophet(stock)
 
     days = years * 365
 
-    future = model.make_future_dataframe(
-        periods=days,
-        freq="B"   # business days (important for stocks)
-    )
+    future = pd.DataFrame({
+        "ds": future_dates(model, days, freq="B")   # business days (important for stocks)
+    })
+
+    # only yhat is served: skip the trend/noise sampling behind the intervals
+    model.uncertainty_samples = 0
 
     forecast = model.predict(future)
 
     return (
-        forecast["ds"].tail(days),
-        forecast["yhat"].tail(days)
+        forecast["ds"],
+        forecast["yhat"]
     )
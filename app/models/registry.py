@@ -0,0 +1,152 @@
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from core.config import MODEL_CACHE_MB
+
+# =====================================================
+# PROCESS-WIDE MODEL REGISTRY
+# =====================================================
+# Every service loads its models through `registry`, so all Streamlit
+# sessions of the process share one cache: switching back to a recently
+# used stock costs no disk I/O. Least recently used models are evicted
+# once their total size passes the budget. A model is charged its
+# artifacts' size on disk, which tracks its size in memory closely for
+# the .npz / .json / .pkl formats served here.
+#
+# Every hit stats the model's artifacts: when a trainer has rewritten
+# them (modification time or size changed), the model is reloaded, so a
+# long-running app serves the same weights as a fresh process.
+
+
+def _signature(paths):
+    """
+    (path, mtime, size) of each artifact; None for a missing one
+    """
+
+    signature = []
+
+    for p in paths:
+        try:
+            st = Path(p).stat()
+            signature.append((str(p), st.st_mtime_ns, st.st_size))
+        except OSError:
+            signature.append((str(p), None))
+
+    return tuple(signature)
+
+
+class ModelRegistry:
+
+    def __init__(self, budget_bytes):
+        self.budget = budget_bytes
+        self._entries = OrderedDict()       # (kind, key) -> (model, size, signature)
+        self._loading = {}                  # (kind, key) -> lock held while loading
+        self._lock = threading.Lock()
+        self.bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.reloads = 0
+
+    def _lookup(self, name, signature):
+        """
+        Cached model (refreshed as most recent) or None, also when its
+        artifacts changed since it was loaded; caller holds _lock
+        """
+
+        entry = self._entries.get(name)
+
+        if entry is None:
+            return None
+
+        if entry[2] != signature:
+            self.bytes -= self._entries.pop(name)[1]
+            self.reloads += 1
+            return None
+
+        self._entries.move_to_end(name)
+        self.hits += 1
+
+        return entry[0]
+
+    def get(self, kind, key, loader, paths=()):
+        """
+        Cached model for (kind, key), else loader() and cache it; reloaded
+        when `paths` changed on disk. Concurrent requests for the same
+        model load it once; loader errors propagate and nothing is cached.
+        """
+
+        name = (kind, key)
+        signature = _signature(paths)
+
+        with self._lock:
+            model = self._lookup(name, signature)
+            if model is not None:
+                return model
+            loading = self._loading.setdefault(name, threading.Lock())
+
+        with loading:
+
+            # loaded by another session while this one waited
+            with self._lock:
+                model = self._lookup(name, signature)
+                if model is not None:
+                    return model
+                self.misses += 1
+
+            try:
+                model = loader()
+                size = sum(Path(p).stat().st_size for p in paths if Path(p).exists())
+                self._put(name, model, size, signature)
+            finally:
+                with self._lock:
+                    self._loading.pop(name, None)
+
+        return model
+
+    def put(self, kind, key, model, size, paths=()):
+        """
+        Replace a cached model with a new version (e.g. after an in-place
+        update) and charge its new size; `paths` as passed to get()
+        """
+        self._put((kind, key), model, size, _signature(paths))
+
+    def _put(self, name, model, size, signature):
+
+        with self._lock:
+
+            if name in self._entries:
+                self.bytes -= self._entries.pop(name)[1]
+
+            self._entries[name] = (model, size, signature)
+            self.bytes += size
+
+            # the newest model stays even if it alone exceeds the budget
+            while self.bytes > self.budget and len(self._entries) > 1:
+                _, (_, evicted, _) = self._entries.popitem(last=False)
+                self.bytes -= evicted
+                self.evictions += 1
+
+    def clear(self):
+
+        with self._lock:
+            self._entries.clear()
+            self.bytes = 0
+
+    def stats(self):
+
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "models": len(self._entries),
+                "mb": round(self.bytes / 1024**2, 2),
+                "budget_mb": round(self.budget / 1024**2, 2),
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "reloads": self.reloads,
+                "hit_rate": round(self.hits / lookups, 3) if lookups else None,
+            }
+
+
+registry = ModelRegistry(MODEL_CACHE_MB * 1024**2)
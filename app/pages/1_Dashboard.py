@@ -1,6 +1,9 @@
 import streamlit as st
 import pandas as pd
 import plotly.express as px
+from core.config import PROCESSED_DATASET
+from data.loader import datasets
+from analytics.downsample import chart_points
 from utils.stock_utils import clean_name, model_name
 
 # ----------------------------------
@@ -16,20 +19,22 @@ st.markdown("Real-time overview of NIFTY50 stock data and model coverage")
 # ----------------------------------
 # LOAD DATA
 # ----------------------------------
-@st.cache_data
-def load_data():
-    return pd.read_csv("data/processed/nifty50_processed.csv")
+# per-stock statistics maintained by the data pipeline (src/market_summary.py);
+# cached per version of the stored file, so a pipeline update is picked up
+@st.cache_data(max_entries=2)
+def load_market_summary(version):
+    return datasets.summary()
 
-df = load_data()
+summary = load_market_summary(datasets.summary_version())
 
 # ----------------------------------
 # TOP METRICS ROW
 # ----------------------------------
 col1, col2, col3, col4 = st.columns(4)
 
-total_stocks = df["Stock"].nunique()
-total_records = len(df)
-latest_date = df["Date"].max()
+total_stocks = len(summary)
+total_records = int(summary["Records"].sum())
+latest_date = str(summary["Last_Date"].max().date())
 
 col1.metric("Tracked Stocks", total_stocks)
 col2.metric("Total Records", f"{total_records:,}")
@@ -43,16 +48,16 @@ st.divider()
 # ----------------------------------
 st.subheader(" Stock Price Trends")
 
-display_names = sorted(df["Stock"].apply(clean_name).unique())
+display_names = sorted(summary["Stock"].apply(clean_name).unique())
 selected_display = st.selectbox("Stock", display_names)
 selected_stock = model_name(selected_display)
 
-stock_df = df[df["Stock"] == selected_stock]
+stock_df = datasets.frame(PROCESSED_DATASET, selected_stock, ["Close"])
 
+# full history is downsampled to about one point per pixel
 fig = px.line(
-    stock_df,
-    x="Date",
-    y="Close",
+    **chart_points(stock_df, "Close"),
+    labels={"x": "Date", "y": "Close"},
     title=f"{selected_display} Price Movement",
 )
 
@@ -81,10 +86,10 @@ st.plotly_chart(fig2, use_container_width=True)
 # ----------------------------------
 # SECTOR DISTRIBUTION (optional if available)
 # ----------------------------------
-if "Sector" in df.columns:
+if "Sector" in summary.columns:
     st.subheader("🏢 Sector Distribution")
 
-    sector_counts = df[["Stock", "Sector"]].drop_duplicates()["Sector"].value_counts()
+    sector_counts = summary["Sector"].value_counts()
 
     fig3 = px.pie(
         values=sector_counts.values,
@@ -102,19 +107,11 @@ st.subheader(" Market Insights")
 colA, colB = st.columns(2)
 
 with colA:
-    top_gainer = (
-        df.groupby("Stock")["Close"]
-        .apply(lambda x: (x.iloc[-1] - x.iloc[0]) / x.iloc[0])
-        .idxmax()
-    )
+    top_gainer = summary.loc[summary["Return"].idxmax(), "Stock"]
     st.success(f"Top Performing Stock: {top_gainer}")
 
 with colB:
-    most_volatile = (
-        df.groupby("Stock")["Close"]
-        .std()
-        .idxmax()
-    )
+    most_volatile = summary.loc[summary["Volatility"].idxmax(), "Stock"]
     st.warning(f"Most Volatile Stock: {most_volatile}")
 
 st.divider()
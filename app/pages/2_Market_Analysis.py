@@ -1,7 +1,9 @@
 import streamlit as st
 import pandas as pd
 import plotly.graph_objects as go
-from pathlib import Path
+from core.config import TECHNICAL_DATASET, CHART_MAX_POINTS
+from data.loader import datasets
+from analytics.downsample import chart_points
 
 # =====================================================
 # PAGE CONFIG
@@ -17,28 +19,20 @@ st.title(" Market Technical Analysis")
 # LOAD DATA
 # =====================================================
 
-PROJECT_ROOT = Path(__file__).resolve().parents[2]
-DATA_PATH = PROJECT_ROOT / "data" / "processed" / "nifty50_technical.csv"
-
-@st.cache_data
-def load_data():
-    df = pd.read_csv(DATA_PATH)
-    df["Date"] = pd.to_datetime(df["Date"])
-    return df
-
-df = load_data()
+# only what the charts and signals below use
+COLUMNS = ["Close", "SMA_20", "SMA_50", "RSI_14", "Volatility_20"]
 
 # =====================================================
 # STOCK SELECTION (CLEAN DISPLAY)
 # =====================================================
 
-stocks = sorted(df["Stock"].unique())
+stocks = datasets.stocks(TECHNICAL_DATASET)
 display_map = {s.replace(".NS", ""): s for s in stocks}
 
 selected_display = st.selectbox("Select Stock", list(display_map.keys()))
 selected_stock = display_map[selected_display]
 
-stock_df = df[df["Stock"] == selected_stock].sort_values("Date")
+stock_df = datasets.frame(TECHNICAL_DATASET, selected_stock, COLUMNS)
 
 # =====================================================
 # DATA DATE INFO
@@ -88,6 +82,13 @@ if len(selected_range) == 2:
 
     st.caption(f"Showing data from {start_date.date()} to {end_date.date()}")
 
+    # long ranges are downsampled for the charts; metrics use every row
+    if len(stock_df) > CHART_MAX_POINTS:
+        st.caption(
+            f"Charts show about {CHART_MAX_POINTS} of {len(stock_df)} daily points, "
+            "narrow the range for full resolution"
+        )
+
 else:
     st.warning("Please select both start and end date.")
     st.stop()
@@ -152,22 +153,19 @@ st.subheader("Price Trend & Moving Averages")
 fig = go.Figure()
 
 fig.add_trace(go.Scatter(
-    x=stock_df["Date"],
-    y=stock_df["Close"],
+    **chart_points(stock_df, "Close"),
     name="Close",
     line=dict(width=2)
 ))
 
 fig.add_trace(go.Scatter(
-    x=stock_df["Date"],
-    y=stock_df["SMA_20"],
+    **chart_points(stock_df, "SMA_20"),
     name="SMA 20",
     line=dict(dash="dot")
 ))
 
 fig.add_trace(go.Scatter(
-    x=stock_df["Date"],
-    y=stock_df["SMA_50"],
+    **chart_points(stock_df, "SMA_50"),
     name="SMA 50",
     line=dict(dash="dash")
 ))
@@ -184,8 +182,7 @@ st.subheader("RSI Indicator")
 fig_rsi = go.Figure()
 
 fig_rsi.add_trace(go.Scatter(
-    x=stock_df["Date"],
-    y=stock_df["RSI_14"],
+    **chart_points(stock_df, "RSI_14"),
     name="RSI"
 ))
 
@@ -204,8 +201,7 @@ st.subheader("Volatility (Risk Level)")
 fig_vol = go.Figure()
 
 fig_vol.add_trace(go.Scatter(
-    x=stock_df["Date"],
-    y=stock_df["Volatility_20"],
+    **chart_points(stock_df, "Volatility_20"),
     name="Volatility"
 ))
 
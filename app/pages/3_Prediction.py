@@ -2,9 +2,10 @@ import streamlit as st
 import pandas as pd
 import plotly.graph_objects as go
 import numpy as np
-from data.loader import load_data
-from models.lstm_service import predict_lstm
-from models.prophet_service import predict_prophet
+from core.config import PROCESSED_DATASET, PRELOAD_MODEL_BACKENDS
+from data.loader import datasets
+from models.backends import backend, preload
+from models.registry import registry
 
 st.set_page_config(
     page_title="Prediction",
@@ -21,23 +22,21 @@ st.header(" Forecasting Engine")
 # LOAD DATA
 # =====================================================
 
-df = load_data()
-
 # clean display (remove .NS)
-display_map = {s.replace(".NS", ""): s for s in sorted(df["Stock"].unique())}
+display_map = {s.replace(".NS", ""): s for s in datasets.stocks()}
 
 selected_display = st.selectbox("Stock", list(display_map.keys()))
 stock = display_map[selected_display]
 
-sdf = df[df["Stock"] == stock].sort_values("Date")
+sdf = datasets.frame(PROCESSED_DATASET, stock, ["Close"])
 
 # =====================================================
 # FORECAST MODE
 # =====================================================
 
-mode = st.radio("Forecast Horizon", ["Short Term", "Long Term"], horizontal=True)
+mode = st.radio("Forecast Horizon", ["Short Term", "Long Term", "Statistical (ARIMA)"], horizontal=True)
 
-if mode == "Short Term":
+if mode in ("Short Term", "Statistical (ARIMA)"):
     days = st.slider("Prediction Window (Days)", 5, 90, 30)
 else:
     years = st.slider("Prediction Horizon (Years)", 1, 10, 3)
@@ -48,26 +47,72 @@ st.divider()
 # RUN FORECAST
 # =====================================================
 
+def stored_forecast():
+    """
+    (dates, preds, lower, upper, generated) from the nightly forecast table,
+    or None when it has no fresh forecast for this stock and horizon
+    """
+
+    if mode == "Short Term":
+        model, steps = "lstm", days
+    elif mode == "Statistical (ARIMA)":
+        model, steps = "arima", days
+    else:
+        model, steps = "prophet", years * 365
+
+    try:
+        table = datasets.forecasts()
+        stored = table.get(model, stock, steps, sdf["Date"].iloc[-1]) if table else None
+    except Exception:
+        return None
+
+    if stored is None:
+        return None
+
+    lower = stored["Lower"].to_numpy() if model == "arima" else None
+    upper = stored["Upper"].to_numpy() if model == "arima" else None
+    generated = table.entries[f"{model}/{stock}"]["generated"]
+
+    return stored["Date"], stored["Forecast"], lower, upper, generated
+
+
 if st.button("Predict", use_container_width=True):
 
     with st.spinner("Running model..."):
 
         try:
 
+            stored = stored_forecast()
+
+            # -----------------------------------------
+            # PRECOMPUTED (nightly batch job)
+            # -----------------------------------------
+            if stored is not None:
+
+                dates, preds, lower, upper, generated = stored
+                st.caption(f"Precomputed forecast, generated {generated}")
+
             # -----------------------------------------
             # LSTM
             # -----------------------------------------
-            if mode == "Short Term":
+            elif mode == "Short Term":
 
-                dates, preds = predict_lstm(sdf, stock, days)
+                dates, preds = backend("lstm").predict_lstm(sdf, stock, days)
                 lower = None
                 upper = None
 
+            # -----------------------------------------
+            # ARIMA (state updated, intervals)
+            # -----------------------------------------
+            elif mode == "Statistical (ARIMA)":
+
+                dates, preds, lower, upper = backend("arima").predict_arima(sdf, stock, days)
+
             # -----------------------------------------
             # PROPHET
             # -----------------------------------------
             else:
-                dates, preds = predict_prophet(stock, years)
+                dates, preds = backend("prophet").predict_prophet(stock, years)
                 lower = None
                 upper = None
 
@@ -96,7 +141,7 @@ if st.button("Predict", use_container_width=True):
                 line=dict(color="red", width=3)
             ))
 
-            # confidence interval (prophet)
+            # confidence interval (arima)
             if lower is not None:
                 fig.add_trace(go.Scatter(
                     x=dates,
@@ -145,3 +190,15 @@ if st.button("Predict", use_container_width=True):
             st.error("Prediction failed")
             st.exception(e)
 
+# =====================================================
+# MODEL CACHE
+# =====================================================
+
+with st.expander("Model cache"):
+    st.json(registry.stats())
+
+# backends (statsmodels, Prophet) are imported on first use; warm them up
+# now that the page is on screen
+if PRELOAD_MODEL_BACKENDS:
+    preload()
+
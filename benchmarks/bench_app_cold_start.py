@@ -0,0 +1,119 @@
+"""
+Streamlit cold-start benchmark: time to first render and memory per page.
+
+Each page runs in a fresh interpreter through Streamlit's headless AppTest
+runner, as the first script of a new server process. Streamlit itself is
+imported before the clock starts (a running server already has it), so
+the time covers what the page imports and loads. RSS is the process
+peak, reported with the increase over the bare Streamlit process.
+
+The Prediction page is measured three ways:
+  eager     model backends imported with the page (before lazy loading)
+  lazy      backends imported on first use only
+  preload   lazy, then the background preload; also reports when the
+            backends are ready and the RSS once they are
+
+Uses the real data store, so run the data pipeline (or src.ingest) first.
+
+Run from the project root:
+    python -m benchmarks.bench_app_cold_start
+"""
+
+import json
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+APP_DIR = PROJECT_ROOT / "app"
+
+REPEATS = 3
+TIMEOUT_S = 300
+
+SCENARIOS = [
+    ("Home", "Home.py", "lazy"),
+    ("Dashboard", "pages/1_Dashboard.py", "lazy"),
+    ("Market Analysis", "pages/2_Market_Analysis.py", "lazy"),
+    ("Prediction (eager)", "pages/3_Prediction.py", "eager"),
+    ("Prediction (lazy)", "pages/3_Prediction.py", "lazy"),
+    ("Prediction (preload)", "pages/3_Prediction.py", "preload"),
+]
+
+# runs in the fresh interpreter; prints one JSON line
+CHILD = """
+import json, resource, sys, time
+app_dir, page, variant = sys.argv[1:4]
+sys.path.insert(0, app_dir)
+
+from streamlit.testing.v1 import AppTest
+import core.config
+
+def rss_mb():
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+base_mb = rss_mb()
+core.config.PRELOAD_MODEL_BACKENDS = variant == "preload"
+
+started = time.perf_counter()
+
+if variant == "eager":
+    from models.backends import BACKENDS, backend
+    for name in BACKENDS:
+        backend(name)
+
+at = AppTest.from_file(f"{app_dir}/{page}", default_timeout=300).run()
+render_s = time.perf_counter() - started
+result = {"render_s": render_s, "base_mb": base_mb, "rss_mb": rss_mb(), "errors": len(at.exception)}
+
+if variant == "preload":
+    from models.backends import preload
+    preload().join()
+    result["ready_s"] = time.perf_counter() - started
+    result["ready_mb"] = rss_mb()
+
+print(json.dumps(result))
+"""
+
+
+def measure(page, variant):
+
+    out = subprocess.run(
+        [sys.executable, "-c", CHILD, str(APP_DIR), page, variant],
+        cwd=PROJECT_ROOT,
+        capture_output=True,
+        text=True,
+        timeout=TIMEOUT_S,
+        check=True,
+    )
+
+    return json.loads(out.stdout.strip().splitlines()[-1])
+
+
+def run():
+
+    results = []
+
+    for label, page, variant in SCENARIOS:
+        runs = [measure(page, variant) for _ in range(REPEATS)]
+        results.append((label, {
+            key: statistics.median(r[key] for r in runs) for key in runs[0]
+        }))
+
+    print("\n==============================")
+    print(f"APP COLD START BENCHMARK (median of {REPEATS} fresh processes)")
+    print("==============================")
+    print(f"{'page':<24}{'first render':>14}{'peak RSS':>11}{'over base':>11}")
+
+    for label, r in results:
+        errors = f"  ({r['errors']:.0f} page errors)" if r["errors"] else ""
+        print(f"{label:<24}{r['render_s'] * 1e3:>12.0f}ms{r['rss_mb']:>9.0f}MB{r['rss_mb'] - r['base_mb']:>9.0f}MB{errors}")
+
+        if "ready_s" in r:
+            print(f"{'  backends preloaded':<24}{r['ready_s'] * 1e3:>12.0f}ms{r['ready_mb']:>9.0f}MB{r['ready_mb'] - r['base_mb']:>9.0f}MB")
+
+    print(f"Bare Streamlit process: {results[0][1]['base_mb']:.0f}MB")
+
+
+if __name__ == "__main__":
+    run()
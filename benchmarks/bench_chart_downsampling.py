@@ -0,0 +1,169 @@
+"""
+Chart downsampling benchmark: full-resolution traces vs LTTB and min/max
+bucketing, on the charts of the Market Analysis page.
+
+Builds 15 years of synthetic daily prices with the pipeline's indicators.
+For each method it builds the page's three figures (Close + SMA 20 / 50,
+RSI, volatility) and reports:
+  - points and serialized payload, through the same plotly.io.to_json call
+    st.plotly_chart makes
+  - server-side render time: downsampling, figure construction and
+    serialization
+  - fidelity: whether each trace's global high/low survives, and the
+    envelope error: per pixel column of a PIXELS-wide chart, how far the
+    drawn line's high and low are from the true ones (mean and worst
+    column, as % of the trace's range)
+A one-year window is included to show narrow ranges pass through at full
+resolution. Browser draw time scales with the points sent; it is not
+measured here.
+
+Run from the project root:
+    python -m benchmarks.bench_chart_downsampling
+"""
+
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+import plotly.graph_objects as go
+import plotly.io as pio
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(PROJECT_ROOT / "app"))
+
+from analytics.downsample import downsample             # noqa: E402
+from benchmarks.bench_indicators import synthetic_prices  # noqa: E402
+from src.features import build_all_indicators            # noqa: E402
+
+N_DAYS = 15 * 250
+MAX_POINTS = 1000
+PIXELS = 1000
+REPEATS = 5
+
+FIGURES = [["Close", "SMA_20", "SMA_50"], ["RSI_14"], ["Volatility_20"]]
+
+METHODS = [
+    ("full", None),
+    ("lttb", "lttb"),
+    ("minmax", "minmax"),
+]
+
+
+def figures(df, method):
+
+    out = []
+
+    for columns in FIGURES:
+        fig = go.Figure()
+
+        for col in columns:
+            if method is None:
+                x, y = df["Date"].to_numpy(), df[col].to_numpy()
+            else:
+                x, y = downsample(df["Date"], df[col], MAX_POINTS, method)
+            fig.add_trace(go.Scatter(x=x, y=y, name=col))
+
+        out.append(fig)
+
+    return out
+
+
+def render(df, method):
+    """
+    Figures and their payloads, as the pages build and send them
+    """
+
+    figs = figures(df, method)
+    return figs, [pio.to_json(fig, validate=False) for fig in figs]
+
+
+def envelope(x, y, columns):
+    """
+    High and low of y in each of `columns` equal-width x ranges
+    """
+
+    col = np.minimum(((x - x[0]) / (x[-1] - x[0]) * columns).astype(np.int64), columns - 1)
+    starts = np.flatnonzero(np.r_[True, col[1:] != col[:-1]])
+
+    return np.maximum.reduceat(y, starts), np.minimum.reduceat(y, starts)
+
+
+def fidelity(df, figs):
+    """
+    (all extremes kept, mean / worst envelope error in % of range) over
+    every trace
+    """
+
+    kept = True
+    errors = []
+    true_x = df["Date"].to_numpy().astype("datetime64[ns]").astype("int64")
+
+    for fig in figs:
+        for trace in fig.data:
+            y_true = df[trace.name].to_numpy("float64")
+            valid = ~np.isnan(y_true)
+            x_true, y_true = true_x[valid], y_true[valid]
+
+            x = np.asarray(trace.x).astype("datetime64[ns]").astype("int64")
+            y = np.asarray(trace.y, dtype="float64")
+
+            kept &= bool(y.max() == y_true.max() and y.min() == y_true.min())
+
+            # the drawn line, evaluated at every true date
+            drawn = np.interp(x_true, x, y)
+            hi, lo = envelope(x_true, y_true, PIXELS)
+            drawn_hi, drawn_lo = envelope(x_true, drawn, PIXELS)
+
+            span = y_true.max() - y_true.min()
+            errors.append(np.r_[np.abs(hi - drawn_hi), np.abs(lo - drawn_lo)] / span)
+
+    errors = np.concatenate(errors) * 100
+
+    return kept, errors.mean(), errors.max()
+
+
+def timed(fn):
+
+    best = float("inf")
+
+    for _ in range(REPEATS):
+        started = time.perf_counter()
+        out = fn()
+        best = min(best, time.perf_counter() - started)
+
+    return out, best
+
+
+def run():
+
+    prices = synthetic_prices(1, N_DAYS)
+    df = build_all_indicators(prices).reset_index(drop=True)
+    windows = [("15 years", df), ("1 year", df.tail(250))]
+
+    results = []
+
+    for window, frame in windows:
+        for label, method in METHODS:
+            (figs, payloads), seconds = timed(lambda: render(frame, method))
+            points = sum(len(trace.x) for fig in figs for trace in fig.data)
+            kept, mean_error, max_error = fidelity(frame, figs)
+            results.append((window, label, points, sum(map(len, payloads)), seconds, kept, mean_error, max_error))
+
+    print("\n==============================")
+    print(f"CHART DOWNSAMPLING BENCHMARK (5 traces, max {MAX_POINTS} points per trace, {PIXELS}px)")
+    print("==============================")
+    print(
+        f"{'range':<10}{'method':<8}{'points':>8}{'payload':>10}{'render':>10}"
+        f"{'extremes':>10}{'envelope mean / max':>22}"
+    )
+
+    for window, label, points, size, seconds, kept, mean_error, max_error in results:
+        print(
+            f"{window:<10}{label:<8}{points:>8}{size / 1024:>8.0f}KB{seconds * 1e3:>8.1f}ms"
+            f"{'kept' if kept else 'lost':>10}{mean_error:>12.2f}% / {max_error:.2f}%"
+        )
+
+
+if __name__ == "__main__":
+    run()
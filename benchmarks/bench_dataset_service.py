@@ -0,0 +1,127 @@
+"""
+Dataset service benchmark: how much each way of loading one stock for a
+page reads and how long it takes.
+
+Writes a synthetic technical dataset (N_SYMBOLS stocks, 15 years, the
+pipeline's indicators) to a temporary store and loads one stock's data
+for the Prediction page (Date/Close) and the Market Analysis page (Date
+plus five indicator columns):
+  full dataset    read every partition and column, then filter (the old
+                  load_data / load_technical)
+  parquet stock   one partition, every column
+  arrays, all     memory-mapped arrays, every column of the stock
+  service         data.loader.datasets.frame with the page's columns
+Reports the time per load and the bytes of column data decoded (or, for
+the arrays, sliced from the mapping).
+
+Run from the project root:
+    python -m benchmarks.bench_dataset_service
+"""
+
+import contextlib
+import io
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(PROJECT_ROOT / "app"))
+
+import src.store as store                                   # noqa: E402
+from benchmarks.bench_indicators import synthetic_prices    # noqa: E402
+from data.loader import DatasetService                      # noqa: E402
+from src.features import build_all_indicators               # noqa: E402
+from src.price_arrays import open_arrays                    # noqa: E402
+
+N_SYMBOLS = 50
+N_DAYS = 15 * 250
+REPEATS = 20
+
+DATASET = "technical"
+
+PAGES = [
+    ("Prediction", ["Close"]),
+    ("Market Analysis", ["Close", "SMA_20", "SMA_50", "RSI_14", "Volatility_20"]),
+]
+
+
+def technical_dataset():
+
+    df = synthetic_prices(N_SYMBOLS, N_DAYS)
+    rng = np.random.default_rng(1)
+
+    df["Open"] = df["Close"] * (1 + rng.normal(0, 0.005, len(df))).astype("float32")
+    df["High"] = np.maximum(df["Open"], df["Close"]) * 1.01
+    df["Low"] = np.minimum(df["Open"], df["Close"]) * 0.99
+    df["Volume"] = rng.integers(10_000, 1_000_000, len(df))
+
+    return build_all_indicators(df)
+
+
+def frame_bytes(df):
+    return sum(df[col].to_numpy().nbytes for col in df.columns if col != "Stock")
+
+
+def timed(fn, repeats=REPEATS):
+
+    best = float("inf")
+
+    for _ in range(repeats):
+        started = time.perf_counter()
+        out = fn()
+        best = min(best, time.perf_counter() - started)
+
+    return out, best
+
+
+def run():
+
+    df = technical_dataset()
+    results = []
+
+    with tempfile.TemporaryDirectory() as tmp:
+
+        store.STORE_DIR = Path(tmp)
+
+        with contextlib.redirect_stdout(io.StringIO()):
+            store.write_dataset(df, DATASET)
+            arrays = open_arrays(DATASET)
+
+        service = DatasetService()
+        stock = arrays.stocks[0]
+
+        def full_dataset():
+            data = store.read_dataset(DATASET)
+            return data[data["Stock"] == stock], frame_bytes(data)
+
+        def loaded(df):
+            return df, frame_bytes(df)
+
+        loaders = [
+            ("full dataset", lambda columns: full_dataset()),
+            ("parquet stock", lambda columns: loaded(store.read_stock(DATASET, stock))),
+            ("arrays, all", lambda columns: loaded(arrays.frame(stock))),
+            ("service", lambda columns: loaded(service.frame(DATASET, stock, columns))),
+        ]
+
+        for page, columns in PAGES:
+            for label, load in loaders:
+                # the full read is slow and the same for every page
+                repeats = 2 if label == "full dataset" else REPEATS
+                (out, size), seconds = timed(lambda: load(columns), repeats)
+                results.append((page, label, seconds, size, len(out.columns)))
+
+    print("\n==============================")
+    print(f"DATASET SERVICE BENCHMARK ({N_SYMBOLS} stocks x {N_DAYS} days, one stock loaded)")
+    print("==============================")
+    print(f"{'page':<18}{'loader':<16}{'time':>12}{'columns':>9}{'decoded':>11}")
+
+    for page, label, seconds, size, n_columns in results:
+        print(f"{page:<18}{label:<16}{seconds * 1e3:>10.2f}ms{n_columns:>9}{size / 1024:>9.0f}KB")
+
+
+if __name__ == "__main__":
+    run()
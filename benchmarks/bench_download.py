@@ -0,0 +1,101 @@
+"""
+Downloader benchmark against the local synthetic source.
+
+Compares the old one-at-a-time behaviour (1 worker, ~1 request/s) with the
+concurrent engine at a few rate limits. Nothing touches the real data store.
+
+Also checks the daily-update path on a checkout that still has the legacy
+CSV: an incremental download must migrate it and append after it, keeping
+every migrated row.
+
+Run from the project root:
+    python -m benchmarks.bench_download
+"""
+
+import contextlib
+import io
+import tempfile
+from pathlib import Path
+
+import src.store as store
+from src.data_loader import NIFTY50_SYMBOLS, START_DATE, SyntheticSource, download_all_stock_data
+
+LATENCY = 0.3        # seconds per simulated request
+FAILURE_RATE = 0.05  # transient errors, exercised through retry/backoff
+
+SCENARIOS = [
+    ("serial (old)", dict(max_workers=1, rate=1.0, burst=1)),
+    ("8 workers, 2 req/s", dict(max_workers=8, rate=2.0, burst=4)),
+    ("8 workers, 5 req/s", dict(max_workers=8, rate=5.0, burst=8)),
+    ("16 workers, 10 req/s", dict(max_workers=16, rate=10.0, burst=16)),
+]
+
+MIGRATE_SYMBOLS = NIFTY50_SYMBOLS[:5]
+CSV_END = "2012-01-01"
+APPEND_END = "2012-02-01"
+
+
+def check_migrate_then_append(tmp):
+    """
+    (rows per stock after the incremental update, rows of a full download
+    to the same date); equal when the migrated history was kept
+    """
+
+    fast = dict(fetch=SyntheticSource(), rate=1000.0, burst=1000)
+
+    with contextlib.redirect_stdout(io.StringIO()):
+
+        download_all_stock_data(MIGRATE_SYMBOLS, START_DATE, CSV_END, dataset="legacy_src", **fast)
+        csv_path = Path(tmp) / "legacy.csv"
+        store.read_dataset("legacy_src").to_csv(csv_path, index=False)
+
+        store.LEGACY_CSV["legacy"] = csv_path
+        try:
+            download_all_stock_data(MIGRATE_SYMBOLS, START_DATE, APPEND_END, dataset="legacy", incremental=True, **fast)
+        finally:
+            del store.LEGACY_CSV["legacy"]
+
+        download_all_stock_data(MIGRATE_SYMBOLS, START_DATE, APPEND_END, dataset="full", **fast)
+
+    def rows(name):
+        return {s: p["rows"] for s, p in store.load_manifest(name)["partitions"].items()}
+
+    return rows("legacy"), rows("full")
+
+
+def run():
+
+    results = []
+
+    with tempfile.TemporaryDirectory() as tmp:
+
+        store.STORE_DIR = Path(tmp)
+
+        for label, kwargs in SCENARIOS:
+            source = SyntheticSource(latency=LATENCY, failure_rate=FAILURE_RATE)
+
+            summary = download_all_stock_data(
+                NIFTY50_SYMBOLS,
+                fetch=source,
+                dataset=f"bench_{len(results)}",
+                **kwargs
+            )
+            results.append((label, summary["seconds"], source.calls, len(summary["failed"])))
+
+        appended, expected = check_migrate_then_append(tmp)
+
+    print("\n==============================")
+    print("DOWNLOAD BENCHMARK (50 symbols)")
+    print("==============================")
+    print(f"{'scenario':<24}{'seconds':>10}{'requests':>10}{'failed':>8}")
+    for label, seconds, calls, failed in results:
+        print(f"{label:<24}{seconds:>10.2f}{calls:>10}{failed:>8}")
+
+    print(f"Legacy CSV migrated, then appended: {sum(appended.values())} rows (full download: {sum(expected.values())})")
+
+    if appended != expected:
+        raise AssertionError(f"Incremental update after migration lost rows: {appended} vs {expected}")
+
+
+if __name__ == "__main__":
+    run()
@@ -0,0 +1,106 @@
+"""
+Global multi-stock LSTM vs per-stock LSTMs.
+
+Trains one per-stock model per synthetic stock and one global model with
+a stock embedding, both on the first 80% of every series. Reports the
+one-step-ahead holdout MAE of each side by side, then the cost of scoring
+every stock: loading N artifacts and running N forward passes vs loading
+one and running a single batched pass.
+
+Run from the project root:
+    python -m benchmarks.bench_global_lstm
+"""
+
+import tempfile
+import time
+from pathlib import Path
+
+import joblib
+import numpy as np
+from tensorflow.keras.models import load_model
+
+from benchmarks.bench_indicators import synthetic_prices
+from src.train_lstm_model import LOOKBACK, train_single_stock
+from src.train_global_lstm import (
+    train_global, evaluate_global, predict_next, holdout_windows
+)
+
+N_STOCKS = 8
+N_DAYS = 1_200
+SPLIT = 0.8
+
+
+def per_stock_mae(model, scaler, series):
+
+    windows, targets = holdout_windows(series, int(len(series) * SPLIT))
+
+    X = scaler.transform(windows.reshape(-1, 1)).reshape(len(windows), LOOKBACK, 1)
+    preds = scaler.inverse_transform(model.predict(X, verbose=0)).ravel()
+
+    return float(np.mean(np.abs(preds - targets)))
+
+
+def run():
+
+    prices = synthetic_prices(N_STOCKS, N_DAYS)
+    series_by_stock = {
+        stock: g["Close"].to_numpy("float64").reshape(-1, 1)
+        for stock, g in prices.groupby("Stock", observed=True)
+    }
+    train_by_stock = {s: v[:int(len(v) * SPLIT)] for s, v in series_by_stock.items()}
+
+    # -------- per-stock ---------
+    started = time.perf_counter()
+    per_stock = {s: train_single_stock(v) for s, v in train_by_stock.items()}
+    per_stock_train_s = time.perf_counter() - started
+
+    # -------- global ------------
+    started = time.perf_counter()
+    model, meta = train_global(train_by_stock)
+    global_train_s = time.perf_counter() - started
+
+    global_mae = evaluate_global(model, meta, series_by_stock, SPLIT)
+    local_mae = {
+        s: per_stock_mae(m, scaler, series_by_stock[s])
+        for s, (m, scaler) in per_stock.items()
+    }
+
+    # -------- scoring all stocks --
+    windows = {s: v[-LOOKBACK:, 0] for s, v in series_by_stock.items()}
+
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp = Path(tmp)
+
+        for s, (m, scaler) in per_stock.items():
+            m.save(tmp / f"{s}.keras")
+            joblib.dump(scaler, tmp / f"{s}_scaler.pkl")
+        model.save(tmp / "global.keras")
+        joblib.dump(meta, tmp / "global_meta.pkl")
+
+        started = time.perf_counter()
+        for s in windows:
+            m = load_model(tmp / f"{s}.keras")
+            scaler = joblib.load(tmp / f"{s}_scaler.pkl")
+            x = scaler.transform(windows[s].reshape(-1, 1)).reshape(1, LOOKBACK, 1)
+            m.predict(x, verbose=0)
+        per_stock_score_s = time.perf_counter() - started
+
+        started = time.perf_counter()
+        g = load_model(tmp / "global.keras")
+        predict_next(g, joblib.load(tmp / "global_meta.pkl"), windows)
+        global_score_s = time.perf_counter() - started
+
+    print("\n==============================")
+    print("GLOBAL LSTM BENCHMARK")
+    print("==============================")
+    print(f"Stocks: {N_STOCKS}, days per stock: {N_DAYS}, holdout: last {1 - SPLIT:.0%}")
+    print(f"{'stock':<8}{'per-stock MAE':>15}{'global MAE':>12}")
+    for s in sorted(local_mae):
+        print(f"{s:<8}{local_mae[s]:>15.3f}{global_mae[s]:>12.3f}")
+    print(f"{'mean':<8}{np.mean(list(local_mae.values())):>15.3f}{np.mean(list(global_mae.values())):>12.3f}")
+    print(f"Training       : per-stock {per_stock_train_s:.1f}s, global {global_train_s:.1f}s")
+    print(f"Score all (load + predict): per-stock {per_stock_score_s:.2f}s, global {global_score_s:.2f}s")
+
+
+if __name__ == "__main__":
+    run()
@@ -0,0 +1,122 @@
+"""
+Direct multi-horizon LSTM vs recursive one-step LSTM.
+
+Trains both models per synthetic stock on the first 80% of its series.
+From origins spread over the holdout it forecasts HORIZON days both ways:
+the one-step model rolled out recursively, and the direct model in one
+forward pass. Reports MAE by horizon bucket next to a last-close
+baseline, plus the latency of one full-horizon forecast.
+
+Run from the project root:
+    python -m benchmarks.bench_lstm_direct
+"""
+
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+
+from app.models.lstm_numpy import NumpyLSTM
+from benchmarks.bench_indicators import synthetic_prices
+from src.train_lstm_model import LOOKBACK, HORIZON, train_single_stock, export_weights
+
+N_STOCKS = 3
+N_DAYS = 1_500
+SPLIT = 0.8
+ORIGIN_STEP = 5
+BUCKETS = [(1, 5), (6, 30), (31, HORIZON)]
+REPEATS = 5
+
+
+def trained(series, horizon, path):
+
+    model, scaler = train_single_stock(series, horizon)
+    export_weights(model, path, scaler.min_, scaler.scale_)
+
+    return NumpyLSTM.load(path)
+
+
+def holdout(series, split=SPLIT):
+    """
+    Windows ending at each holdout origin and the HORIZON closes after it
+    """
+
+    origins = np.arange(int(len(series) * split), len(series) - HORIZON + 1, ORIGIN_STEP)
+    windows = np.stack([series[o - LOOKBACK:o] for o in origins])
+    targets = np.stack([series[o:o + HORIZON, 0] for o in origins])
+
+    return windows, targets
+
+
+def best_of(fn, *args):
+
+    times = []
+    for _ in range(REPEATS):
+        started = time.perf_counter()
+        fn(*args)
+        times.append(time.perf_counter() - started)
+
+    return min(times)
+
+
+def run():
+
+    prices = synthetic_prices(N_STOCKS, N_DAYS)
+    series_by_stock = {
+        stock: g["Close"].to_numpy("float64").reshape(-1, 1)
+        for stock, g in prices.groupby("Stock", observed=True)
+    }
+
+    errors = {"recursive": [], "direct": [], "last close": []}
+    train_s = {"recursive": 0.0, "direct": 0.0}
+
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp = Path(tmp)
+
+        for stock, series in series_by_stock.items():
+
+            train = series[:int(len(series) * SPLIT)]
+
+            started = time.perf_counter()
+            recursive = trained(train, 1, tmp / f"{stock}.npz")
+            train_s["recursive"] += time.perf_counter() - started
+
+            started = time.perf_counter()
+            direct = trained(train, HORIZON, tmp / f"{stock}_direct.npz")
+            train_s["direct"] += time.perf_counter() - started
+
+            windows, targets = holdout(series)
+
+            rec = recursive.unscale(recursive.rollout(recursive.scale(windows), HORIZON).astype("float64"))
+            dir_ = direct.unscale(direct.predict(direct.scale(windows)).astype("float64"))
+
+            errors["recursive"].append(np.abs(rec - targets))
+            errors["direct"].append(np.abs(dir_ - targets))
+            errors["last close"].append(np.abs(windows[:, -1] - targets))
+
+    # latency of one full-horizon forecast (last stock's models)
+    window = recursive.scale(series[-LOOKBACK:]).reshape(1, LOOKBACK, 1)
+    recursive_s = best_of(recursive.rollout, window, HORIZON)
+    direct_s = best_of(direct.predict, window)
+
+    print("\n==============================")
+    print("DIRECT VS RECURSIVE LSTM BENCHMARK")
+    print("==============================")
+    print(f"Stocks: {N_STOCKS}, days per stock: {N_DAYS}, holdout: last {1 - SPLIT:.0%}, horizon: {HORIZON} days")
+    print(f"Forecast origins: every {ORIGIN_STEP} days, {sum(len(e) for e in errors['direct'])} in total")
+
+    header = "".join(f"{f'days {lo}-{hi}':>14}" for lo, hi in BUCKETS)
+    print(f"{'MAE':<12}{header}{'all':>10}")
+
+    for name, errs in errors.items():
+        errs = np.concatenate(errs)
+        cells = "".join(f"{errs[:, lo - 1:hi].mean():>14.3f}" for lo, hi in BUCKETS)
+        print(f"{name:<12}{cells}{errs.mean():>10.3f}")
+
+    print(f"Training    : recursive {train_s['recursive']:.1f}s, direct {train_s['direct']:.1f}s")
+    print(f"{HORIZON}-day forecast: recursive rollout {recursive_s * 1000:.1f}ms, direct {direct_s * 1000:.1f}ms")
+
+
+if __name__ == "__main__":
+    run()
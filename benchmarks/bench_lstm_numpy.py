@@ -0,0 +1,144 @@
+"""
+LSTM serving benchmark: Keras vs the pure-NumPy runtime.
+
+Trains a per-stock LSTM and a small global LSTM on synthetic prices,
+exports their weights and runs the same inputs through Keras and through
+app/models/lstm_numpy.py. Reports the largest output difference (scaled
+and in price units, one step and over a 30-day recursive forecast), the
+latency of that forecast, and the cost of importing the app's LSTM
+service vs importing TensorFlow.
+
+Run from the project root:
+    python -m benchmarks.bench_lstm_numpy
+"""
+
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+
+from app.models.lstm_numpy import NumpyLSTM
+from benchmarks.bench_indicators import synthetic_prices
+from src.train_lstm_model import LOOKBACK, train_single_stock, export_weights
+from src.train_global_lstm import train_global, export_global
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+
+N_STOCKS = 4
+N_DAYS = 1_200
+FUTURE_DAYS = 30
+TOLERANCE = 1e-4            # scaled units
+
+
+def keras_rollout(model, window, days):
+
+    preds = []
+    for _ in range(days):
+        p = model.predict(window, verbose=0)[0][0]
+        preds.append(p)
+        window = np.append(window[:, 1:, :], [[[p]]], axis=1)
+
+    return np.array(preds)
+
+
+def numpy_rollout(model, window, days):
+
+    preds = []
+    for _ in range(days):
+        p = model.predict(window)[0][0]
+        preds.append(p)
+        window = np.append(window[:, 1:, :], [[[p]]], axis=1)
+
+    return np.array(preds)
+
+
+def timed(fn, *args):
+    started = time.perf_counter()
+    out = fn(*args)
+    return out, time.perf_counter() - started
+
+
+def import_seconds(statement):
+    """
+    Wall time of one import in a fresh interpreter started in app/,
+    and whether TensorFlow ended up loaded
+    """
+
+    code = (
+        "import sys, time\n"
+        "started = time.perf_counter()\n"
+        f"{statement}\n"
+        "print(time.perf_counter() - started, 'tensorflow' in sys.modules)"
+    )
+    out = subprocess.run(
+        [sys.executable, "-c", code], cwd=PROJECT_ROOT / "app",
+        capture_output=True, text=True, check=True
+    ).stdout.split()
+
+    return float(out[0]), out[1] == "True"
+
+
+def run():
+
+    prices = synthetic_prices(N_STOCKS, N_DAYS)
+    series_by_stock = {
+        stock: g["Close"].to_numpy("float64").reshape(-1, 1)
+        for stock, g in prices.groupby("Stock", observed=True)
+    }
+    stock = sorted(series_by_stock)[0]
+    series = series_by_stock[stock]
+
+    keras_model, scaler = train_single_stock(series)
+    global_model, meta = train_global(series_by_stock, epochs=1)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp = Path(tmp)
+        export_weights(keras_model, tmp / "stock.npz", scaler.min_, scaler.scale_)
+        export_global(global_model, meta, tmp / "global.npz")
+        np_model = NumpyLSTM.load(tmp / "stock.npz")
+        np_global = NumpyLSTM.load(tmp / "global.npz")
+
+    # -------- one step, every window --
+    scaled = scaler.transform(series).astype("float32")
+    windows = np.lib.stride_tricks.sliding_window_view(scaled[:, 0], LOOKBACK)[..., None]
+
+    step_diff = np.max(np.abs(keras_model.predict(windows, verbose=0) - np_model.predict(windows)))
+
+    ids = np.full(len(windows), meta["ids"][stock], dtype="int32")
+    global_diff = np.max(np.abs(
+        global_model.predict({"window": windows, "stock_id": ids}, verbose=0)
+        - np_global.predict(windows, ids)
+    ))
+
+    # -------- recursive forecast ------
+    window = scaled[-LOOKBACK:].reshape(1, LOOKBACK, 1)
+    keras_preds, keras_s = timed(keras_rollout, keras_model, window, FUTURE_DAYS)
+    numpy_preds, numpy_s = timed(numpy_rollout, np_model, window, FUTURE_DAYS)
+
+    rollout_diff = np.max(np.abs(keras_preds - numpy_preds))
+    price_diff = np.max(np.abs(
+        scaler.inverse_transform(keras_preds.reshape(-1, 1))
+        - np_model.unscale(numpy_preds.reshape(-1, 1).astype("float64"))
+    ))
+
+    # -------- import cost -------------
+    service_import_s, service_tf = import_seconds("import models.lstm_service")
+    tf_import_s, _ = import_seconds("from tensorflow.keras.models import load_model")
+
+    print("\n==============================")
+    print("NUMPY LSTM RUNTIME BENCHMARK")
+    print("==============================")
+    print(f"Windows compared: {len(windows)} (per-stock and global), tolerance {TOLERANCE:g}")
+    print(f"{'Max |Keras - NumPy|, one step':<32}: per-stock {step_diff:.2e}, global {global_diff:.2e}")
+    print(f"{f'Max |Keras - NumPy|, {FUTURE_DAYS}-day':<32}: {rollout_diff:.2e} scaled, {price_diff:.2e} in price")
+    print(f"{f'{FUTURE_DAYS}-day forecast latency':<32}: Keras {keras_s * 1000:.0f}ms, NumPy {numpy_s * 1000:.0f}ms")
+    print(f"{'Import lstm_service':<32}: {service_import_s:.2f}s (TensorFlow loaded: {service_tf})")
+    print(f"{'Import TensorFlow load_model':<32}: {tf_import_s:.2f}s")
+    print("Parity:", "OK" if max(step_diff, global_diff, rollout_diff) < TOLERANCE else "FAILED")
+
+
+if __name__ == "__main__":
+    run()
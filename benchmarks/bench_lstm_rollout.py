@@ -0,0 +1,84 @@
+"""
+LSTM multi-step forecast latency: per-step predict vs one-call rollout.
+
+Trains one per-stock LSTM on a synthetic series and forecasts 5, 30 and
+90 days three ways: one Keras model.predict per day (the original app
+path), one NumPy forward pass per day with a re-allocated window, and
+NumpyLSTM.rollout, which produces every step in a single call. Reports
+the latency of each and the largest difference from the Keras forecast.
+
+Run from the project root:
+    python -m benchmarks.bench_lstm_rollout
+"""
+
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+
+from app.models.lstm_numpy import NumpyLSTM
+from benchmarks.bench_indicators import synthetic_prices
+from benchmarks.bench_lstm_numpy import keras_rollout, numpy_rollout
+from src.train_lstm_model import LOOKBACK, train_single_stock, export_weights
+
+N_DAYS = 1_200
+HORIZONS = [5, 30, 90]
+REPEATS = 3
+
+
+def best_of(fn, *args, repeats=REPEATS):
+
+    times = []
+    for _ in range(repeats):
+        started = time.perf_counter()
+        out = fn(*args)
+        times.append(time.perf_counter() - started)
+
+    return out, min(times)
+
+
+def run():
+
+    prices = synthetic_prices(1, N_DAYS)
+    series = prices["Close"].to_numpy("float64").reshape(-1, 1)
+
+    keras_model, scaler = train_single_stock(series)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = export_weights(keras_model, Path(tmp) / "stock.npz", scaler.min_, scaler.scale_)
+        model = NumpyLSTM.load(path)
+
+    window = scaler.transform(series)[-LOOKBACK:].reshape(1, LOOKBACK, 1).astype("float32")
+
+    # first predict call builds the Keras graph; keep it out of the timings
+    keras_model.predict(window, verbose=0)
+
+    rows = []
+
+    for days in HORIZONS:
+
+        keras_preds, keras_s = best_of(keras_rollout, keras_model, window, days, repeats=1)
+        _, step_s = best_of(numpy_rollout, model, window, days)
+        preds, rollout_s = best_of(model.rollout, window, days)
+
+        diff = np.max(np.abs(
+            scaler.inverse_transform(keras_preds.reshape(-1, 1)).ravel()
+            - model.unscale(preds[0].astype("float64"))
+        ))
+        rows.append((days, keras_s, step_s, rollout_s, diff))
+
+    print("\n==============================")
+    print("LSTM ROLLOUT BENCHMARK")
+    print("==============================")
+    print(f"Lookback: {LOOKBACK}, best of {REPEATS} for the NumPy paths")
+    print(f"{'days':>5}{'Keras/step':>13}{'NumPy/step':>13}{'rollout':>10}{'speedup':>10}{'max |diff|':>13}")
+    for days, keras_s, step_s, rollout_s, diff in rows:
+        print(
+            f"{days:>5}{keras_s * 1000:>11.0f}ms{step_s * 1000:>11.1f}ms{rollout_s * 1000:>8.1f}ms"
+            f"{keras_s / rollout_s:>9.0f}x{diff:>13.2e}"
+        )
+
+
+if __name__ == "__main__":
+    run()
@@ -0,0 +1,83 @@
+"""
+LSTM windowing benchmark: list-of-copies windows vs strided views.
+
+Builds a synthetic scaled Close series per stock, constructs the 60-step
+training windows both ways, checks they are identical and reports build
+time and bytes allocated. Also times one pass of the tf.data pipeline.
+
+Run from the project root:
+    python -m benchmarks.bench_lstm_windows
+"""
+
+import time
+import tracemalloc
+
+import numpy as np
+
+from src.train_lstm_model import LOOKBACK, BATCH_SIZE, create_sequences, make_dataset
+
+N_STOCKS = 50
+N_DAYS = 3_700
+
+
+def create_sequences_copy(data, lookback):
+    """
+    Previous implementation: one Python list entry per window, then a copy
+    """
+    X, y = [], []
+    for i in range(lookback, len(data)):
+        X.append(data[i-lookback:i])
+        y.append(data[i])
+    return np.array(X), np.array(y)
+
+
+def measure(fn, series):
+
+    tracemalloc.start()
+    started = time.perf_counter()
+
+    for data in series:
+        X, y = fn(data, LOOKBACK)
+
+    seconds = time.perf_counter() - started
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return seconds, peak
+
+
+def run():
+
+    rng = np.random.default_rng(0)
+    series = [rng.random((N_DAYS, 1)) for _ in range(N_STOCKS)]
+    raw_bytes = series[0].nbytes
+
+    for data in series[:3]:
+        X_old, y_old = create_sequences_copy(data, LOOKBACK)
+        X_new, y_new = create_sequences(data, LOOKBACK)
+        assert np.array_equal(X_old, X_new) and np.array_equal(y_old, y_new)
+        assert np.shares_memory(X_new, data)
+
+    copy_s, copy_peak = measure(create_sequences_copy, series)
+    view_s, view_peak = measure(create_sequences, series)
+
+    # one epoch through the streaming pipeline
+    dataset = make_dataset(series[0], LOOKBACK, BATCH_SIZE)
+    started = time.perf_counter()
+    batches = sum(1 for _ in dataset)
+    epoch_s = time.perf_counter() - started
+
+    print("\n==============================")
+    print("LSTM WINDOW BENCHMARK")
+    print("==============================")
+    print(f"Stocks: {N_STOCKS}, days per stock: {N_DAYS}, lookback: {LOOKBACK}")
+    print(f"Raw series per stock:    {raw_bytes / 1e3:>10.1f} KB")
+    print(f"{'':<12}{'total s':>10}{'peak KB':>12}")
+    print(f"{'copy':<12}{copy_s:>10.3f}{copy_peak / 1e3:>12.1f}")
+    print(f"{'views':<12}{view_s:>10.3f}{view_peak / 1e3:>12.1f}")
+    print(f"tf.data epoch: {batches} batches in {epoch_s:.2f}s")
+    print("Windows identical: yes")
+
+
+if __name__ == "__main__":
+    run()
@@ -0,0 +1,124 @@
+"""
+Market summary benchmark: the Dashboard's old per-rerun aggregation over
+the full processed history vs reading the materialized summary table.
+
+Writes a synthetic processed dataset to a temporary store, then times
+  - old:     read every row, groupby return / std / nunique / max
+  - build:   full summary build (feature pipeline)
+  - read:    what the Dashboard now does on a rerun
+  - update:  one appended day per stock, merged into the summary
+and checks the merged summary against a full rebuild.
+
+Run from the project root:
+    python -m benchmarks.bench_market_summary
+"""
+
+import contextlib
+import io
+import tempfile
+import time
+from pathlib import Path
+
+import pandas as pd
+
+import src.store as store
+from benchmarks.bench_indicators import synthetic_prices
+from src.market_summary import build_summary, read_summary, update_summary
+
+N_SYMBOLS = 50
+N_DAYS = 4_000
+REPEATS = 5
+
+
+def old_dashboard(df):
+    """
+    Aggregations 1_Dashboard.py ran on every rerun
+    """
+
+    return (
+        df["Stock"].nunique(),
+        len(df),
+        df["Date"].max(),
+        df.groupby("Stock")["Close"].apply(lambda x: (x.iloc[-1] - x.iloc[0]) / x.iloc[0]).idxmax(),
+        df.groupby("Stock")["Close"].std().idxmax(),
+    )
+
+
+def new_dashboard(summary):
+
+    return (
+        len(summary),
+        int(summary["Records"].sum()),
+        summary["Last_Date"].max(),
+        summary.loc[summary["Return"].idxmax(), "Stock"],
+        summary.loc[summary["Volatility"].idxmax(), "Stock"],
+    )
+
+
+def timed(fn, repeats=REPEATS):
+
+    best = float("inf")
+
+    for _ in range(repeats):
+        started = time.perf_counter()
+        with contextlib.redirect_stdout(io.StringIO()):
+            out = fn()
+        best = min(best, time.perf_counter() - started)
+
+    return out, best
+
+
+def append_day(df):
+    """
+    One new trading day per stock, appended through the store
+    """
+
+    last = df.groupby("Stock", observed=True).tail(1).copy()
+    last["Date"] = last["Date"] + pd.offsets.BDay(1)
+    last["Close"] = (last["Close"] * 1.01).astype("float32")
+
+    manifest = store.open_dataset("processed")
+    for stock, rows in last.groupby("Stock", observed=True):
+        store.append_partition(rows.reset_index(drop=True), "processed", stock, manifest)
+    store.save_manifest("processed", manifest)
+
+
+def run():
+
+    df = synthetic_prices(N_SYMBOLS, N_DAYS)
+
+    with tempfile.TemporaryDirectory() as tmp:
+
+        store.STORE_DIR = Path(tmp)
+
+        with contextlib.redirect_stdout(io.StringIO()):
+            store.write_dataset(df, "processed")
+
+        old, old_s = timed(lambda: old_dashboard(store.read_dataset("processed")))
+        _, build_s = timed(build_summary)
+        new, read_s = timed(lambda: new_dashboard(read_summary()))
+
+        append_day(df)
+        merged, update_s = timed(update_summary, repeats=1)
+        _, noop_s = timed(update_summary)
+        with contextlib.redirect_stdout(io.StringIO()):
+            rebuilt = build_summary()
+
+    numeric = ["Return", "Volatility", "Records", "Mean", "M2"]
+    drift = (merged[numeric] - rebuilt[numeric]).abs().max().max()
+
+    print("\n==============================")
+    print("MARKET SUMMARY BENCHMARK")
+    print("==============================")
+    print(f"Processed rows: {len(df):,} ({N_SYMBOLS} stocks x {N_DAYS} days)")
+    print(f"Old rerun (read + groupby) : {old_s * 1e3:>8.1f}ms")
+    print(f"Summary read (new rerun)   : {read_s * 1e3:>8.1f}ms ({old_s / read_s:.0f}x)")
+    print(f"Full summary build         : {build_s * 1e3:>8.1f}ms")
+    print(f"Update, +1 day per stock   : {update_s * 1e3:>8.1f}ms")
+    print(f"Update, nothing appended   : {noop_s * 1e3:>8.1f}ms")
+    print(f"Same insights as before    : {old[0] == new[0] and old[1] == new[1] and old[3:] == new[3:]}")
+    print(f"Merged vs rebuilt summary  : max abs diff {drift:.2e}")
+
+
+if __name__ == "__main__":
+    run()
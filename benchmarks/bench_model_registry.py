@@ -0,0 +1,120 @@
+"""
+Model registry benchmark: loading from disk on every request vs the
+process-wide LRU registry.
+
+Writes N_MODELS exported LSTM weight files and replays a request stream
+in which most requests go to a few recently used stocks. The budget holds
+BUDGET_MODELS of them. Reports the time per request, the hit rate and the
+number of evictions. Then many threads request one uncached model at once,
+to check that it is loaded a single time.
+
+Run from the project root:
+    python -m benchmarks.bench_model_registry
+"""
+
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+import numpy as np
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(PROJECT_ROOT / "app"))
+
+from models.lstm_numpy import NumpyLSTM             # noqa: E402
+from models.registry import ModelRegistry           # noqa: E402
+
+N_MODELS = 40
+BUDGET_MODELS = 12
+HOT_STOCKS = 8
+HOT_SHARE = 0.8
+REQUESTS = 2_000
+THREADS = 16
+UNITS = 64
+
+
+def write_weights(path, rng):
+    """
+    Random weights in the layout src/train_lstm_model.export_weights writes
+    """
+
+    shapes = {
+        "lstm1_kernel": (1, 4 * UNITS), "lstm1_recurrent": (UNITS, 4 * UNITS), "lstm1_bias": (4 * UNITS,),
+        "lstm2_kernel": (UNITS, 4 * UNITS), "lstm2_recurrent": (UNITS, 4 * UNITS), "lstm2_bias": (4 * UNITS,),
+        "dense_kernel": (UNITS, 1), "dense_bias": (1,),
+    }
+    arrays = {k: rng.normal(0, 0.1, shape).astype("float32") for k, shape in shapes.items()}
+
+    np.savez(path, scaler_min=np.zeros(1), scaler_scale=np.ones(1), **arrays)
+
+
+def request_stream(rng):
+
+    hot = rng.random(REQUESTS) < HOT_SHARE
+    return np.where(hot, rng.integers(0, HOT_STOCKS, REQUESTS), rng.integers(0, N_MODELS, REQUESTS))
+
+
+def run():
+
+    rng = np.random.default_rng(0)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp = Path(tmp)
+
+        paths = [tmp / f"STOCK{i}.npz" for i in range(N_MODELS)]
+        for path in paths:
+            write_weights(path, rng)
+
+        model_bytes = paths[0].stat().st_size
+        stream = request_stream(rng)
+
+        # -------- no cache ----------
+        started = time.perf_counter()
+        for i in stream:
+            NumpyLSTM.load(paths[i])
+        uncached_s = time.perf_counter() - started
+
+        # -------- registry ----------
+        registry = ModelRegistry(BUDGET_MODELS * model_bytes)
+
+        started = time.perf_counter()
+        for i in stream:
+            registry.get("lstm", paths[i].stem, lambda: NumpyLSTM.load(paths[i]), [paths[i]])
+        cached_s = time.perf_counter() - started
+
+        stats = registry.stats()
+
+        # -------- concurrent cold load --
+        registry.clear()
+        loads = []
+
+        def load():
+            loads.append(1)
+            time.sleep(0.05)
+            return NumpyLSTM.load(paths[0])
+
+        threads = [
+            threading.Thread(target=registry.get, args=("lstm", "STOCK0", load, [paths[0]]))
+            for _ in range(THREADS)
+        ]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+    print("\n==============================")
+    print("MODEL REGISTRY BENCHMARK")
+    print("==============================")
+    print(f"Models: {N_MODELS} x {model_bytes / 1024:.0f}KB, budget: {BUDGET_MODELS} models ({stats['budget_mb']}MB)")
+    print(f"Requests: {REQUESTS}, {HOT_SHARE:.0%} to {HOT_STOCKS} recently used stocks")
+    print(f"Load every request : {uncached_s / REQUESTS * 1e6:>8.1f}us per request")
+    print(f"Registry           : {cached_s / REQUESTS * 1e6:>8.1f}us per request ({uncached_s / cached_s:.1f}x)")
+    print(f"Hits / misses      : {stats['hits']} / {stats['misses']} (hit rate {stats['hit_rate']:.1%})")
+    print(f"Evictions          : {stats['evictions']}, cached at the end: {stats['models']} models, {stats['mb']}MB")
+    print(f"Concurrent cold get: {THREADS} threads, loader ran {len(loads)} time(s)")
+
+
+if __name__ == "__main__":
+    run()
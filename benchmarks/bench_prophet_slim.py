@@ -0,0 +1,106 @@
+"""
+Prophet serving benchmark: full pickle + whole-history predict vs slim
+JSON artifact + future-only predict.
+
+Fits one model on a synthetic 15-year series, saves it both ways and
+compares artifact size, load time and the latency of a 10-year forecast.
+The old path rebuilds and predicts the full history, then keeps the tail.
+The new path predicts only the future dates. The yhat values must match.
+
+Run from the project root:
+    python -m benchmarks.bench_prophet_slim
+"""
+
+import logging
+import tempfile
+import time
+from pathlib import Path
+
+import joblib
+import numpy as np
+import pandas as pd
+from prophet.serialize import model_from_json
+
+from benchmarks.bench_indicators import synthetic_prices
+from src.train_prophet_model import train_single_stock, slim_model
+from prophet.serialize import model_to_json
+
+N_DAYS = 3_900
+YEARS = 10
+REPEATS = 5
+
+
+def best_of(fn):
+
+    times = []
+    for _ in range(REPEATS):
+        started = time.perf_counter()
+        out = fn()
+        times.append(time.perf_counter() - started)
+
+    return out, min(times)
+
+
+def predict_full(model, days):
+    """
+    Previous prophet_service path
+    """
+    future = model.make_future_dataframe(periods=days, freq="B")
+    forecast = model.predict(future)
+    return forecast["yhat"].tail(days).to_numpy()
+
+
+def predict_future_only(model, days):
+
+    last = model.history_dates.max()
+    dates = pd.date_range(start=last, periods=days + 1, freq="B")
+    dates = dates[dates > last][:days]
+
+    model.uncertainty_samples = 0
+    return model.predict(pd.DataFrame({"ds": dates}))["yhat"].to_numpy()
+
+
+def run():
+
+    logging.getLogger("cmdstanpy").setLevel(logging.WARNING)
+
+    df = synthetic_prices(1, N_DAYS)[["Date", "Close"]]
+    model = train_single_stock(df)
+    days = YEARS * 365
+
+    with tempfile.TemporaryDirectory() as tmp:
+
+        pkl = Path(tmp) / "model.pkl"
+        slim = Path(tmp) / "model.json"
+
+        joblib.dump(model, pkl)
+        slim.write_text(model_to_json(slim_model(model)))
+
+        full, full_load_s = best_of(lambda: joblib.load(pkl))
+        light, slim_load_s = best_of(lambda: model_from_json(slim.read_text()))
+
+        pkl_kb = pkl.stat().st_size / 1e3
+        slim_kb = slim.stat().st_size / 1e3
+
+    yhat_full, full_predict_s = best_of(lambda: predict_full(full, days))
+    yhat_slim, slim_predict_s = best_of(lambda: predict_future_only(light, days))
+
+    diff = float(np.max(np.abs(yhat_full - yhat_slim)))
+
+    print("\n==============================")
+    print("PROPHET SERVING BENCHMARK")
+    print("==============================")
+    print(f"History rows: {len(df)}, horizon: {YEARS} years ({days} business days)")
+    print(f"{'':<22}{'full pickle':>14}{'slim + future':>15}")
+    print(f"{'artifact size (KB)':<22}{pkl_kb:>14.1f}{slim_kb:>15.1f}")
+    print(f"{'load (ms)':<22}{full_load_s * 1e3:>14.1f}{slim_load_s * 1e3:>15.1f}")
+    print(f"{'predict (ms)':<22}{full_predict_s * 1e3:>14.1f}{slim_predict_s * 1e3:>15.1f}")
+    print(
+        f"{'first request (ms)':<22}{(full_load_s + full_predict_s) * 1e3:>14.1f}"
+        f"{(slim_load_s + slim_predict_s) * 1e3:>15.1f}"
+    )
+    print(f"Max |yhat difference|: {diff:.2e}")
+
+
+if __name__ == "__main__":
+    run()
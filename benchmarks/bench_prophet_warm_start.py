@@ -0,0 +1,84 @@
+"""
+Prophet refit benchmark: cold start vs warm start from saved parameters.
+
+Simulates daily appends on one synthetic 15-year stock. After each new
+bar the model is refit twice on the full history: from Prophet's default
+initialisation and seeded with the previous model's fitted parameters.
+Reports both fit times and checks the two forecasts agree.
+
+Run from the project root:
+    python -m benchmarks.bench_prophet_warm_start
+"""
+
+import logging
+import time
+
+import numpy as np
+
+from benchmarks.bench_indicators import synthetic_prices
+from src.train_prophet_model import train_single_stock, stan_init
+
+N_DAYS = 3_900
+DAILY_STEPS = 5
+HORIZON = 365
+
+# max relative difference between warm and cold yhat over the horizon
+PARITY_TOLERANCE = 0.01
+
+
+def timed(fn, *args):
+    started = time.perf_counter()
+    out = fn(*args)
+    return out, time.perf_counter() - started
+
+
+def forecast(model):
+
+    future = model.make_future_dataframe(periods=HORIZON, freq="B")
+
+    return model.predict(future)["yhat"].to_numpy()[-HORIZON:]
+
+
+def run():
+
+    logging.getLogger("cmdstanpy").setLevel(logging.WARNING)
+
+    df = synthetic_prices(1, N_DAYS)[["Date", "Close"]]
+    first = len(df) - DAILY_STEPS
+
+    previous, initial_s = timed(train_single_stock, df.iloc[:first])
+
+    rows = []
+
+    for step in range(1, DAILY_STEPS + 1):
+
+        history = df.iloc[:first + step]
+
+        cold, cold_s = timed(train_single_stock, history)
+        warm, warm_s = timed(train_single_stock, history, stan_init(previous))
+
+        yhat_cold = forecast(cold)
+        yhat_warm = forecast(warm)
+        diff = float(np.max(np.abs(yhat_warm - yhat_cold) / np.abs(yhat_cold)))
+
+        rows.append((step, cold_s, warm_s, diff))
+        previous = warm
+
+    cold_s = np.mean([r[1] for r in rows])
+    warm_s = np.mean([r[2] for r in rows])
+    worst = max(r[3] for r in rows)
+
+    print("\n==============================")
+    print("PROPHET WARM START BENCHMARK")
+    print("==============================")
+    print(f"Rows: {len(df)}, daily steps: {DAILY_STEPS}, forecast horizon: {HORIZON} days")
+    print(f"Initial cold fit: {initial_s:.2f}s")
+    print(f"{'step':>5}{'cold s':>9}{'warm s':>9}{'max rel diff':>14}")
+    for step, c, w, d in rows:
+        print(f"{step:>5}{c:>9.2f}{w:>9.2f}{d:>14.2e}")
+    print(f"Mean warm fit: {warm_s / cold_s:.1%} of a cold fit")
+    print(f"Forecast parity (<= {PARITY_TOLERANCE:.0%}): {'yes' if worst <= PARITY_TOLERANCE else 'NO'}")
+
+
+if __name__ == "__main__":
+    run()
@@ -0,0 +1,71 @@
+"""
+Random Forest retraining benchmark: warm-start update vs full refit.
+
+Simulates a run of daily appends on one synthetic stock. After each new
+bar the saved forest is either warm-start updated (retire the oldest
+trees, grow new ones on recent rows) or refit from scratch. Reports the
+time per update and the holdout MAE of both forests.
+
+Run from the project root:
+    python -m benchmarks.bench_rf_incremental
+"""
+
+import time
+
+import numpy as np
+
+from benchmarks.bench_indicators import synthetic_prices
+from src.features import build_all_indicators
+from src.train_rf_model import (
+    train_single_stock, update_single_stock, holdout_mae,
+    INCREMENTAL_TREES, RECENT_WINDOW, TREE_BUDGET
+)
+
+N_DAYS = 3_900
+DAILY_STEPS = 10
+
+
+def timed(fn, *args):
+    started = time.perf_counter()
+    out = fn(*args)
+    return out, time.perf_counter() - started
+
+
+def run():
+
+    df = build_all_indicators(synthetic_prices(1, N_DAYS)).reset_index(drop=True)
+    first = len(df) - DAILY_STEPS
+
+    model, initial_s = timed(train_single_stock, df.iloc[:first])
+
+    rows = []
+
+    for step in range(1, DAILY_STEPS + 1):
+
+        history = df.iloc[:first + step]
+
+        model, update_s = timed(update_single_stock, model, history)
+        full, refit_s = timed(train_single_stock, history)
+
+        rows.append((
+            step, update_s, refit_s,
+            holdout_mae(model, history), holdout_mae(full, history)
+        ))
+
+    update_s = np.mean([r[1] for r in rows])
+    refit_s = np.mean([r[2] for r in rows])
+
+    print("\n==============================")
+    print("RF INCREMENTAL BENCHMARK")
+    print("==============================")
+    print(f"Rows: {len(df)}, daily steps: {DAILY_STEPS}")
+    print(f"Trees added / budget: {INCREMENTAL_TREES} / {TREE_BUDGET}, recent window: {RECENT_WINDOW}")
+    print(f"Initial full fit: {initial_s:.2f}s")
+    print(f"{'step':>5}{'update s':>10}{'refit s':>10}{'MAE upd':>10}{'MAE full':>10}")
+    for step, u, r, mu, mf in rows:
+        print(f"{step:>5}{u:>10.3f}{r:>10.3f}{mu:>10.4f}{mf:>10.4f}")
+    print(f"Mean update cost: {update_s / refit_s:.1%} of a full refit")
+
+
+if __name__ == "__main__":
+    run()
@@ -1,7 +1,13 @@
 import pandas as pd
+import numpy as np
 from pathlib import Path
-import yfinance as yf
+import threading
 import time
+import zlib
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from src.store import (
+    open_dataset, write_partition, append_partition, save_manifest, load_watermarks
+)
 
 PROJECT_ROOT = Path(__file__).resolve().parent.parent
 DATA_RAW = PROJECT_ROOT / "data" / "raw"
@@ -20,54 +26,266 @@ NIFTY50_SYMBOLS = [
     "BPCL.NS","SHREECEM.NS","M&M.NS","ADANIENT.NS","IOC.NS"
 ]
 
+# =====================================================
+# DOWNLOAD CONFIGURATION
+# =====================================================
 
-def download_all_stock_data():
+START_DATE = "2010-01-01"
+END_DATE = "2025-01-01"
 
-    all_data = []
+RAW_DATASET = "raw"
 
-    for symbol in NIFTY50_SYMBOLS:
+MAX_WORKERS = 8              # concurrent requests in flight
+REQUESTS_PER_SECOND = 2.0    # sustained rate towards the source
+BURST = 4                    # requests allowed back to back
+MAX_RETRIES = 3
+BACKOFF_SECONDS = 1.0        # doubled after every failed attempt
 
-        print("Downloading:", symbol)
+LOG = "[DOWNLOAD]"
 
-        df = yf.download(
-            symbol,
-            start="2010-01-01",
-            end="2025-01-01",
-            progress=False,
-            threads=False
-        )
 
-        if df.empty:
-            print("Skipped:", symbol)
-            continue
+# =====================================================
+# RATE LIMITER
+# =====================================================
 
-        # ======================================
-        # CRITICAL STEP — FLATTEN MULTIINDEX
-        # ======================================
-        if isinstance(df.columns, pd.MultiIndex):
-            df.columns = df.columns.get_level_values(0)
+class TokenBucket:
+    """
+    Thread-safe token bucket: refills `rate` tokens per second up to `capacity`
+    """
 
-        # reset index
-        df = df.reset_index()
+    def __init__(self, rate, capacity=None):
+        self.rate = rate
+        self.capacity = capacity or max(1.0, rate)
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
 
-        # add stock identifier
-        df["Stock"] = symbol
+    def acquire(self):
 
-        # remove column name hierarchy label
-        df.columns.name = None
+        while True:
+            with self.lock:
+                now = time.monotonic()
+                self.tokens = min(
+                    self.capacity,
+                    self.tokens + (now - self.updated) * self.rate
+                )
+                self.updated = now
 
-        # append vertically
-        all_data.append(df)
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
 
-        time.sleep(1)
+                wait = (1 - self.tokens) / self.rate
 
-    final_df = pd.concat(all_data, axis=0, ignore_index=True)
+            time.sleep(wait)
 
-    DATA_RAW.mkdir(parents=True, exist_ok=True)
-    final_df.to_csv(DATA_RAW / "nifty50_all_stock_data.csv")
 
-    print("All stock data downloaded successfully!")
+# =====================================================
+# FETCH BACKENDS
+# =====================================================
+
+def fetch_yfinance(symbol, start, end):
+    """
+    Download one symbol from Yahoo Finance as a flat OHLCV frame
+    """
+
+    import yfinance as yf
+
+    df = yf.download(
+        symbol,
+        start=start,
+        end=end,
+        progress=False,
+        threads=False
+    )
+
+    # ======================================
+    # CRITICAL STEP — FLATTEN MULTIINDEX
+    # ======================================
+    if isinstance(df.columns, pd.MultiIndex):
+        df.columns = df.columns.get_level_values(0)
+
+    # reset index
+    df = df.reset_index()
+
+    # remove column name hierarchy label
+    df.columns.name = None
+
+    return df
+
+
+class SyntheticSource:
+    """
+    Local stand-in for yfinance: deterministic random-walk OHLCV per symbol,
+    with optional per-request latency and injected failures
+    """
+
+    def __init__(self, latency=0.0, failure_rate=0.0, seed=0):
+        self.latency = latency
+        self.failure_rate = failure_rate
+        self.seed = seed
+        self.calls = 0
+        self.lock = threading.Lock()
+
+    def __call__(self, symbol, start, end):
+
+        with self.lock:
+            self.calls += 1
+            call = self.calls
+
+        time.sleep(self.latency)
+
+        fail_rng = np.random.default_rng((self.seed, call))
+        if fail_rng.random() < self.failure_rate:
+            raise ConnectionError(f"synthetic failure for {symbol}")
+
+        dates = pd.bdate_range(start, end, inclusive="left")
+
+        # same symbol -> same series, whatever window is requested
+        rng = np.random.default_rng((self.seed, zlib.crc32(symbol.encode())))
+        full = pd.bdate_range(START_DATE, max(pd.Timestamp(end), pd.Timestamp(END_DATE)))
+        close = 100 * np.exp(np.cumsum(rng.normal(0, 0.02, len(full))))
+        volume = rng.integers(100_000, 1_000_000, len(full))
+
+        mask = full.isin(dates)
+
+        return pd.DataFrame({
+            "Date": full[mask],
+            "Close": close[mask],
+            "High": close[mask] * 1.01,
+            "Low": close[mask] * 0.99,
+            "Open": close[mask],
+            "Volume": volume[mask],
+        })
+
+
+# =====================================================
+# DOWNLOAD ONE SYMBOL (RETRY + BACKOFF)
+# =====================================================
+
+def download_symbol(symbol, start, end, fetch, limiter,
+                    retries=MAX_RETRIES, backoff=BACKOFF_SECONDS):
+
+    for attempt in range(retries + 1):
+
+        limiter.acquire()
+
+        try:
+            return fetch(symbol, start, end)
+
+        except Exception as e:
+            if attempt == retries:
+                raise
+
+            wait = backoff * 2 ** attempt
+            print(f"{LOG} {symbol} failed ({e}), retrying in {wait:.1f}s")
+            time.sleep(wait)
+
+
+# =====================================================
+# DOWNLOAD ALL SYMBOLS
+# =====================================================
+
+def plan_incremental(symbols, start, end, watermarks):
+    """
+    Start date per symbol: the day after its watermark, or `start` if never stored.
+    Symbols already up to `end` are left out.
+    """
+
+    plan = {}
+
+    for symbol in symbols:
+
+        symbol_start = pd.Timestamp(start)
+
+        if symbol in watermarks:
+            symbol_start = watermarks[symbol] + pd.Timedelta(days=1)
+
+        if symbol_start < pd.Timestamp(end):
+            plan[symbol] = symbol_start.strftime("%Y-%m-%d")
+
+    return plan
+
+
+def download_all_stock_data(symbols=NIFTY50_SYMBOLS, start=START_DATE, end=END_DATE,
+                            fetch=fetch_yfinance, max_workers=MAX_WORKERS,
+                            rate=REQUESTS_PER_SECOND, burst=BURST,
+                            dataset=RAW_DATASET, incremental=False):
+    """
+    Fetch symbols over a bounded worker pool under a shared rate limit and
+    write each one to its store partition as soon as it arrives.
+
+    incremental : fetch only the tail after each symbol's stored watermark
+                  and append it, instead of replacing the partition
+    """
+
+    limiter = TokenBucket(rate, burst)
+    manifest = open_dataset(dataset)
+
+    if incremental:
+        plan = plan_incremental(symbols, start, end, load_watermarks(dataset))
+        write = append_partition
+        print(f"{LOG} Incremental: {len(plan)} of {len(symbols)} symbols behind {end}")
+    else:
+        plan = {symbol: start for symbol in symbols}
+        write = write_partition
+
+    downloaded = []
+    skipped = []
+    failed = []
+    rows = 0
+
+    started = time.perf_counter()
+
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+
+        futures = {
+            pool.submit(download_symbol, symbol, symbol_start, end, fetch, limiter): symbol
+            for symbol, symbol_start in plan.items()
+        }
+
+        for future in as_completed(futures):
+
+            symbol = futures[future]
+
+            try:
+                df = future.result()
+            except Exception as e:
+                print(f"{LOG} FAILED: {symbol} ({e})")
+                failed.append(symbol)
+                continue
+
+            if df is None or df.empty:
+                print(f"{LOG} Skipped: {symbol}")
+                skipped.append(symbol)
+                continue
+
+            # add stock identifier
+            df["Stock"] = symbol
+
+            write(df, dataset, symbol, manifest)
+            save_manifest(dataset, manifest)
+
+            print(f"{LOG} Downloaded: {symbol} ({len(df)} rows)")
+            downloaded.append(symbol)
+            rows += len(df)
+
+    elapsed = time.perf_counter() - started
+
+    print(f"{LOG} Downloaded {len(downloaded)} ({rows} rows), skipped {len(skipped)}, "
+          f"failed {len(failed)} in {elapsed:.1f}s")
+
+    if not failed:
+        print("All stock data downloaded successfully!")
+
+    return {
+        "downloaded": downloaded,
+        "skipped": skipped,
+        "failed": failed,
+        "rows": rows,
+        "seconds": elapsed,
+    }
 
 
 if __name__ == "__main__":
-    download_all_stock_data()
\ No newline at end of file
+    download_all_stock_data()
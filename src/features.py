@@ -1,5 +1,9 @@
+import numpy as np
 import pandas as pd
 from pathlib import Path
+from pandas.api.indexers import BaseIndexer
+from src.store import read_dataset, write_dataset
+from src.market_summary import build_summary
 
 # =====================================================
 # PROJECT PATHS (robust)
@@ -7,8 +11,8 @@ from pathlib import Path
 
 PROJECT_ROOT = Path(__file__).resolve().parents[1]
 
-RAW_DATA_PATH = PROJECT_ROOT / "data" / "processed" / "nifty50_processed.csv"
-OUTPUT_PATH = PROJECT_ROOT / "data" / "processed" / "nifty50_technical.csv"
+INPUT_DATASET = "processed"
+OUTPUT_DATASET = "technical"
 
 # =====================================================
 # TECHNICAL INDICATORS FOR ONE STOCK
@@ -56,12 +60,103 @@ def compute_indicators(stock_df: pd.DataFrame) -> pd.DataFrame:
 
 
 # =====================================================
-# BUILD INDICATORS FOR ALL STOCKS
+# SEGMENT-AWARE ROLLING WINDOWS
+# =====================================================
+
+class SegmentWindowIndexer(BaseIndexer):
+    """
+    Trailing fixed-size windows over one contiguous array that never reach
+    back past the start of the row's segment (stock).
+
+    Expects `window_size` and `segment_starts` (first row of each row's segment).
+    """
+
+    def get_window_bounds(self, num_values=0, min_periods=None, center=None,
+                          closed=None, step=None):
+
+        end = np.arange(1, num_values + 1, dtype=np.int64)
+        start = np.maximum(end - self.window_size, self.segment_starts)
+
+        return start, end
+
+
+def _segment_rolling(values: pd.Series, window: int, segment_starts: np.ndarray):
+    indexer = SegmentWindowIndexer(window_size=window, segment_starts=segment_starts)
+    return values.rolling(indexer, min_periods=window)
+
+
+# =====================================================
+# BUILD INDICATORS FOR ALL STOCKS (SINGLE PASS)
 # =====================================================
 
 def build_all_indicators(df: pd.DataFrame) -> pd.DataFrame:
     """
-    Apply indicator computation to every stock
+    Compute indicators for every stock in one sorted pass.
+
+    Rows are ordered by (stock in order of appearance, date) so each stock is
+    a contiguous segment, then every indicator runs once over the whole
+    array with windows clipped at segment boundaries. Output matches
+    build_all_indicators_per_stock row for row and bit for bit.
+    """
+
+    codes, _ = pd.factorize(df["Stock"])
+    order = np.lexsort((df["Date"].values, codes))
+
+    out = df.take(order)
+    codes = codes[order]
+
+    # first row of each row's segment
+    row = np.arange(len(codes), dtype=np.int64)
+    is_start = np.ones(len(codes), dtype=bool)
+    is_start[1:] = codes[1:] != codes[:-1]
+    segment_starts = np.maximum.accumulate(np.where(is_start, row, 0))
+
+    close = out["Close"]
+    by_stock = close.groupby(codes, sort=False)
+
+    # -----------------------------
+    # Moving Averages (Trend)
+    # -----------------------------
+    out["SMA_20"] = _segment_rolling(close, 20, segment_starts).mean()
+    out["SMA_50"] = _segment_rolling(close, 50, segment_starts).mean()
+
+    # -----------------------------
+    # Returns (Momentum) — pct_change pads gaps first
+    # -----------------------------
+    filled = by_stock.ffill()
+    out["Returns"] = filled / filled.groupby(codes, sort=False).shift(1) - 1
+
+    # -----------------------------
+    # Volatility (Risk)
+    # -----------------------------
+    out["Volatility_20"] = _segment_rolling(out["Returns"], 20, segment_starts).std()
+
+    # -----------------------------
+    # RSI (Momentum Strength)
+    # -----------------------------
+    window = 14
+    delta = close - by_stock.shift(1)
+
+    gain = delta.clip(lower=0)
+    loss = -delta.clip(upper=0)
+
+    avg_gain = _segment_rolling(gain, window, segment_starts).mean()
+    avg_loss = _segment_rolling(loss, window, segment_starts).mean()
+
+    rs = avg_gain / avg_loss
+    out["RSI_14"] = 100 - (100 / (1 + rs))
+
+    return out.dropna()
+
+
+# =====================================================
+# BUILD INDICATORS PER STOCK (REFERENCE)
+# =====================================================
+
+def build_all_indicators_per_stock(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Apply indicator computation to every stock, one stock at a time.
+    Kept as the reference implementation for build_all_indicators.
     """
 
     processed_list = []
@@ -91,17 +186,20 @@ def run_feature_pipeline():
     print("\n========== FEATURE ENGINE START ==========")
 
     print("Loading base dataset...")
-    df = pd.read_csv(RAW_DATA_PATH)
-    df["Date"] = pd.to_datetime(df["Date"])
+    df = read_dataset(INPUT_DATASET)
 
     print("Computing indicators...")
     df_technical = build_all_indicators(df)
 
     print("Saving technical dataset...")
-    df_technical.to_csv(OUTPUT_PATH, index=False)
+    write_dataset(df_technical, OUTPUT_DATASET)
 
-    print("Saved to:", OUTPUT_PATH)
+    print("Saved to dataset:", OUTPUT_DATASET)
     print("Final rows:", len(df_technical))
+
+    # Dashboard statistics over the processed (not indicator-trimmed) history
+    print("Building market summary...")
+    build_summary(df)
     print("========== FEATURE ENGINE COMPLETE ==========\n")
 
 
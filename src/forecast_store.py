@@ -0,0 +1,255 @@
+import sys
+import json
+import time
+import uuid
+import numpy as np
+import pandas as pd
+from src.store import PROJECT_ROOT, STORE_DIR, DATE_COLUMN
+
+# =====================================================
+# LAYOUT
+# =====================================================
+# data/store/_forecasts/
+#     index.json              "<model>/<stock>" -> [start, end) row offsets,
+#                             last data date used, generation time
+#     <column>.<build>.npy    Date, Forecast, Lower, Upper; one row per
+#                             forecast day, rows grouped by (model, stock)
+#
+# Each (model, stock) is forecast once at the longest horizon the UI
+# offers. Every shorter horizon is a prefix of it: the recursive and
+# direct LSTM, ARIMA means/intervals and Prophet's yhat at a given day do
+# not depend on how many days are requested. So the app serves any
+# horizon by slicing the first N rows.
+
+FORECAST_DIR = STORE_DIR / "_forecasts"
+INDEX_NAME = "index.json"
+
+APP_DIR = PROJECT_ROOT / "app"
+
+COLUMNS = {
+    DATE_COLUMN: "datetime64[ns]",
+    "Forecast": "float64",
+    "Lower": "float64",
+    "Upper": "float64",
+}
+
+# longest horizon per model, in forecast days (3_Prediction.py sliders)
+HORIZONS = {
+    "lstm": 90,
+    "arima": 90,
+    "prophet": 10 * 365,
+}
+
+LOG = "[FORECASTS]"
+
+
+def entry_key(model: str, stock: str) -> str:
+    return f"{model}/{stock}"
+
+# =====================================================
+# BATCH JOB
+# =====================================================
+
+def _services():
+    """
+    The app's inference services, so stored and live forecasts are the same
+    """
+
+    if str(APP_DIR) not in sys.path:
+        sys.path.insert(0, str(APP_DIR))
+
+    from models.lstm_service import predict_lstm
+    from models.prophet_service import predict_prophet
+    from models import arima_service
+
+    def lstm(stock_df, stock):
+        dates, preds = predict_lstm(stock_df, stock, HORIZONS["lstm"])
+        return dates, np.ravel(preds), None, None
+
+    def arima(stock_df, stock):
+        # nightly is when re-estimation belongs; the app then only extends state
+        arima_service.update(stock, stock_df)
+        if arima_service.reestimation_due(stock):
+            arima_service.reestimate(stock, stock_df)
+        return arima_service.predict_arima(stock_df, stock, HORIZONS["arima"])
+
+    def prophet(stock_df, stock):
+        dates, preds = predict_prophet(stock, HORIZONS["prophet"] // 365)
+        return dates, preds, None, None
+
+    return {"lstm": lstm, "arima": arima, "prophet": prophet}
+
+
+def run_forecasts(stocks=None, models=None):
+    """
+    Forecast every stock with every model at its longest horizon and
+    replace the forecast table. Models that are not trained for a stock
+    are skipped and models that fail are logged; the app forecasts those
+    live.
+    """
+
+    from src.price_arrays import open_arrays
+
+    arrays = open_arrays("processed")
+    stocks = stocks or arrays.stocks
+    services = _services()
+    models = models or list(services)
+
+    print(f"\n{LOG} Forecasting {len(stocks)} stocks: {', '.join(models)}")
+
+    started = time.perf_counter()
+    generated = pd.Timestamp.now().isoformat(timespec="seconds")
+
+    columns = {col: [] for col in COLUMNS}
+    entries = {}
+    offset = 0
+    skipped = 0
+    failed = []
+
+    for model in models:
+        for stock in stocks:
+
+            stock_df = arrays.frame(stock, ["Close"])
+
+            try:
+                dates, preds, lower, upper = services[model](stock_df, stock)
+            except FileNotFoundError:
+                skipped += 1
+                continue
+            except Exception as e:
+                print(f"{LOG} FAILED: {entry_key(model, stock)} ({e})")
+                failed.append(entry_key(model, stock))
+                continue
+
+            n = len(preds)
+            columns[DATE_COLUMN].append(pd.DatetimeIndex(dates).to_numpy("datetime64[ns]"))
+            columns["Forecast"].append(np.asarray(preds, dtype="float64"))
+            columns["Lower"].append(np.full(n, np.nan) if lower is None else np.asarray(lower, dtype="float64"))
+            columns["Upper"].append(np.full(n, np.nan) if upper is None else np.asarray(upper, dtype="float64"))
+
+            entries[entry_key(model, stock)] = {
+                "rows": [offset, offset + n],
+                "data_date": str(pd.Timestamp(stock_df[DATE_COLUMN].iloc[-1]).date()),
+                "generated": generated,
+            }
+            offset += n
+
+    index = write_forecasts(columns, entries, generated)
+
+    print(
+        f"{LOG} Stored {len(entries)} forecasts ({offset} rows), "
+        f"{skipped} without a trained model, {len(failed)} failed, "
+        f"in {time.perf_counter() - started:.1f}s"
+    )
+
+    return index
+
+
+def write_forecasts(columns, entries, generated):
+
+    FORECAST_DIR.mkdir(parents=True, exist_ok=True)
+    build = uuid.uuid4().hex[:12]
+
+    for col, dtype in COLUMNS.items():
+        values = np.concatenate(columns[col]) if columns[col] else np.empty(0, dtype=dtype)
+        np.save(FORECAST_DIR / f"{col}.{build}.npy", values.astype(dtype))
+
+    index = {
+        "build": build,
+        "generated": generated,
+        "horizons": HORIZONS,
+        "entries": entries,
+    }
+
+    path = FORECAST_DIR / INDEX_NAME
+    previous = None
+
+    if path.exists():
+        with open(path) as f:
+            previous = json.load(f)["build"]
+
+    tmp = FORECAST_DIR / f"{INDEX_NAME}.{build}.tmp"
+    with open(tmp, "w") as f:
+        json.dump(index, f, indent=2)
+    tmp.replace(path)
+
+    # drop builds older than the previous one, which stays readable for
+    # processes that loaded the old index; mapped files keep their pages
+    keep = {build, previous}
+
+    for path in FORECAST_DIR.glob("*.npy"):
+        if path.name.split(".")[-2] not in keep:
+            try:
+                path.unlink()
+            except OSError:
+                pass
+
+    return index
+
+# =====================================================
+# READ
+# =====================================================
+
+class ForecastTable:
+    """
+    Read-only, memory-mapped view of the latest forecast build
+    """
+
+    def __init__(self, index: dict):
+        self.index = index
+        self.entries = index["entries"]
+        self.arrays = {
+            col: np.load(FORECAST_DIR / f"{col}.{index['build']}.npy", mmap_mode="r")
+            for col in COLUMNS
+        }
+
+    def is_fresh(self, model: str, stock: str, last_date) -> bool:
+        """
+        Stored forecast exists and starts after the latest data date. Its
+        age alone does not matter: on days without new bars (weekends,
+        holidays) yesterday's forecast is still current.
+        """
+
+        entry = self.entries.get(entry_key(model, stock))
+
+        if entry is None:
+            return False
+
+        return pd.Timestamp(entry["data_date"]) >= pd.Timestamp(last_date).normalize()
+
+    def get(self, model: str, stock: str, steps: int, last_date):
+        """
+        First `steps` forecast days as a DataFrame, or None when the stored
+        forecast is missing, stale or shorter than requested
+        """
+
+        if not self.is_fresh(model, stock, last_date):
+            return None
+
+        start, end = self.entries[entry_key(model, stock)]["rows"]
+
+        if end - start < steps:
+            return None
+
+        return pd.DataFrame(
+            {col: arr[start:start + steps] for col, arr in self.arrays.items()},
+            copy=False
+        )
+
+
+def open_forecasts():
+    """
+    Latest forecast table, or None if the batch job has not run yet
+    """
+
+    path = FORECAST_DIR / INDEX_NAME
+
+    if not path.exists():
+        return None
+
+    with open(path) as f:
+        return ForecastTable(json.load(f))
+
+
+if __name__ == "__main__":
+    run_forecasts()
@@ -0,0 +1,406 @@
+import json
+import math
+import numpy as np
+import pandas as pd
+from collections import deque
+from src.store import (
+    dataset_dir, dataset_exists, read_stock, list_stocks,
+    load_watermarks, open_dataset, append_partition, save_manifest
+)
+
+# =====================================================
+# CONFIGURATION
+# =====================================================
+
+INPUT_DATASET = "processed"
+OUTPUT_DATASET = "technical"
+
+# persisted next to the technical partitions; a full rebuild of the
+# technical dataset wipes it and the next update bootstraps it again
+STATE_NAME = "_indicator_state.json"
+
+INDICATORS = ["SMA_20", "SMA_50", "Returns", "Volatility_20", "RSI_14"]
+
+LOG = "[INDICATOR STATE]"
+
+NaN = float("nan")
+
+
+# =====================================================
+# ROLLING KERNELS
+# =====================================================
+# Both kernels replay pandas' own online rolling algorithms
+# (roll_mean / roll_var: Kahan-compensated add & remove), so a state
+# advanced bar by bar lands on exactly the floats that
+# Series.rolling(window).mean() / .std() produce over the full history.
+
+class RollingMean:
+
+    FIELDS = ["window", "values", "nobs", "sum_x", "neg_ct",
+              "comp_add", "comp_remove", "same", "prev", "started"]
+
+    def __init__(self, window):
+        self.window = window
+        self.values = deque()
+        self.nobs = 0
+        self.sum_x = 0.0
+        self.neg_ct = 0
+        self.comp_add = 0.0
+        self.comp_remove = 0.0
+        self.same = 0
+        self.prev = NaN
+        self.started = False
+
+    def _add(self, val):
+
+        if val != val:
+            return
+
+        self.nobs += 1
+        y = val - self.comp_add
+        t = self.sum_x + y
+        self.comp_add = t - self.sum_x - y
+        self.sum_x = t
+
+        if math.copysign(1.0, val) < 0:
+            self.neg_ct += 1
+
+        if val == self.prev:
+            self.same += 1
+        else:
+            self.same = 1
+        self.prev = val
+
+    def _remove(self, val):
+
+        if val != val:
+            return
+
+        self.nobs -= 1
+        y = -val - self.comp_remove
+        t = self.sum_x + y
+        self.comp_remove = t - self.sum_x - y
+        self.sum_x = t
+
+        if math.copysign(1.0, val) < 0:
+            self.neg_ct -= 1
+
+    def value(self):
+
+        if self.nobs < self.window or self.nobs == 0:
+            return NaN
+
+        result = self.sum_x / self.nobs
+
+        if self.same >= self.nobs:
+            result = self.prev
+        elif self.neg_ct == 0 and result < 0:
+            result = 0.0
+        elif self.neg_ct == self.nobs and result > 0:
+            result = 0.0
+
+        return result
+
+    def update(self, val):
+
+        if not self.started:
+            self.prev = val
+            self.same = 0
+            self.started = True
+        elif len(self.values) == self.window:
+            self._remove(self.values.popleft())
+
+        self._add(val)
+        self.values.append(val)
+
+        return self.value()
+
+    def to_dict(self):
+        state = {f: getattr(self, f) for f in self.FIELDS}
+        state["values"] = list(self.values)
+        return state
+
+    @classmethod
+    def from_dict(cls, state):
+        kernel = cls(state["window"])
+        for f in cls.FIELDS:
+            setattr(kernel, f, state[f])
+        kernel.values = deque(state["values"])
+        return kernel
+
+
+class RollingStd(RollingMean):
+
+    FIELDS = ["window", "values", "nobs", "mean_x", "ssqdm_x",
+              "comp_add", "comp_remove", "same", "prev", "started"]
+
+    DDOF = 1
+
+    def __init__(self, window):
+        super().__init__(window)
+        self.nobs = 0.0
+        self.mean_x = 0.0
+        self.ssqdm_x = 0.0
+
+    def _add(self, val):
+
+        if val != val:
+            return
+
+        self.nobs += 1
+
+        if val == self.prev:
+            self.same += 1
+        else:
+            self.same = 1
+        self.prev = val
+
+        prev_mean = self.mean_x - self.comp_add
+        y = val - self.comp_add
+        t = y - self.mean_x
+        self.comp_add = t + self.mean_x - y
+        self.mean_x = self.mean_x + t / self.nobs if self.nobs else 0.0
+        self.ssqdm_x = self.ssqdm_x + (val - prev_mean) * (val - self.mean_x)
+
+    def _remove(self, val):
+
+        if val != val:
+            return
+
+        self.nobs -= 1
+
+        if self.nobs:
+            prev_mean = self.mean_x - self.comp_remove
+            y = val - self.comp_remove
+            t = y - self.mean_x
+            self.comp_remove = t + self.mean_x - y
+            self.mean_x = self.mean_x - t / self.nobs
+            self.ssqdm_x = self.ssqdm_x - (val - prev_mean) * (val - self.mean_x)
+        else:
+            self.mean_x = 0.0
+            self.ssqdm_x = 0.0
+
+    def value(self):
+
+        if self.nobs < self.window or self.nobs <= self.DDOF:
+            return NaN
+
+        if self.nobs == 1 or self.same >= self.nobs:
+            var = 0.0
+        else:
+            var = self.ssqdm_x / (self.nobs - self.DDOF)
+
+        return 0.0 if var < 0 else math.sqrt(var)
+
+
+# =====================================================
+# PER-SYMBOL STATE
+# =====================================================
+
+class SymbolState:
+    """
+    Everything compute_indicators needs to extend one stock by one bar.
+
+    Close-derived steps (pct_change, diff, clip) run in the Close dtype,
+    exactly as pandas does on the Series; rolling inputs are float64.
+    """
+
+    def __init__(self, dtype="float64"):
+        self.dtype = dtype
+        self.last_date = None
+        self.last_close = NaN     # previous raw close, for diff()
+        self.last_filled = NaN    # previous forward-filled close, for pct_change()
+        self.sma_20 = RollingMean(20)
+        self.sma_50 = RollingMean(50)
+        self.volatility_20 = RollingStd(20)
+        self.avg_gain = RollingMean(14)
+        self.avg_loss = RollingMean(14)
+
+    def update(self, date, close):
+
+        cast = np.dtype(self.dtype).type
+        zero = cast(0)
+
+        c = cast(close)
+        last_close = cast(self.last_close)
+        last_filled = cast(self.last_filled)
+
+        with np.errstate(all="ignore"):
+
+            filled = c if c == c else last_filled
+            returns = filled / last_filled - cast(1)
+
+            delta = c - last_close
+            gain = delta if (delta != delta or delta >= zero) else zero
+            loss = -(delta if (delta != delta or delta <= zero) else zero)
+
+            avg_gain = np.float64(self.avg_gain.update(float(gain)))
+            avg_loss = np.float64(self.avg_loss.update(float(loss)))
+            rs = avg_gain / avg_loss
+            rsi = 100 - (100 / (1 + rs))
+
+        self.last_close = float(c)
+        self.last_filled = float(filled)
+        self.last_date = pd.Timestamp(date).strftime("%Y-%m-%d")
+
+        return {
+            "SMA_20": self.sma_20.update(float(c)),
+            "SMA_50": self.sma_50.update(float(c)),
+            "Returns": returns,
+            "Volatility_20": self.volatility_20.update(float(returns)),
+            "RSI_14": float(rsi),
+        }
+
+    KERNELS = ["sma_20", "sma_50", "volatility_20", "avg_gain", "avg_loss"]
+
+    def to_dict(self):
+        state = {
+            "dtype": self.dtype,
+            "last_date": self.last_date,
+            "last_close": self.last_close,
+            "last_filled": self.last_filled,
+        }
+        for k in self.KERNELS:
+            state[k] = getattr(self, k).to_dict()
+        return state
+
+    @classmethod
+    def from_dict(cls, state):
+        symbol = cls(state["dtype"])
+        symbol.last_date = state["last_date"]
+        symbol.last_close = state["last_close"]
+        symbol.last_filled = state["last_filled"]
+        for k in cls.KERNELS:
+            kernel_cls = RollingStd if k == "volatility_20" else RollingMean
+            setattr(symbol, k, kernel_cls.from_dict(state[k]))
+        return symbol
+
+
+# =====================================================
+# STEP A STOCK THROUGH NEW BARS
+# =====================================================
+
+def advance(state: SymbolState, stock_df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Feed rows (sorted by date) through the state and return them with
+    indicator columns, same values compute_indicators would give
+    """
+
+    rows = [
+        state.update(date, close)
+        for date, close in zip(stock_df["Date"], stock_df["Close"])
+    ]
+
+    out = stock_df.copy()
+    indicators = pd.DataFrame(rows, index=out.index, columns=INDICATORS)
+
+    for col in INDICATORS:
+        out[col] = indicators[col]
+    out["Returns"] = out["Returns"].astype(state.dtype)
+
+    return out
+
+
+# =====================================================
+# PERSISTENCE
+# =====================================================
+
+def state_path():
+    return dataset_dir(OUTPUT_DATASET) / STATE_NAME
+
+
+def load_state() -> dict:
+
+    path = state_path()
+    if not path.exists():
+        return {}
+
+    with open(path) as f:
+        return {stock: SymbolState.from_dict(s) for stock, s in json.load(f).items()}
+
+
+def save_state(states: dict):
+
+    path = state_path()
+    tmp = path.with_suffix(".tmp")
+
+    with open(tmp, "w") as f:
+        json.dump({stock: s.to_dict() for stock, s in states.items()}, f)
+
+    tmp.replace(path)
+
+
+def bootstrap_state() -> dict:
+    """
+    Build state by replaying each stock's processed history up to the
+    technical dataset's watermark. Runs once; later updates reuse it.
+    """
+
+    print(f"{LOG} Bootstrapping from {INPUT_DATASET} history")
+
+    watermarks = load_watermarks(OUTPUT_DATASET)
+    states = {}
+
+    for stock, last in watermarks.items():
+        stock_df = read_stock(INPUT_DATASET, stock, columns=["Close"], end=last)
+        states[stock] = SymbolState(str(stock_df["Close"].dtype))
+        advance(states[stock], stock_df)
+
+    save_state(states)
+
+    return states
+
+
+# =====================================================
+# INCREMENTAL UPDATE
+# =====================================================
+
+def update_indicators():
+    """
+    Extend the technical dataset with indicator rows for processed bars
+    newer than each stock's state, in constant time per bar
+    """
+
+    if not dataset_exists(OUTPUT_DATASET):
+        raise FileNotFoundError(
+            "Technical dataset missing — run the full feature pipeline first"
+        )
+
+    states = load_state() or bootstrap_state()
+    manifest = open_dataset(OUTPUT_DATASET)
+
+    appended = 0
+
+    for stock in list_stocks(INPUT_DATASET):
+
+        state = states.get(stock)
+        start = None
+
+        if state is not None and state.last_date is not None:
+            start = pd.Timestamp(state.last_date) + pd.Timedelta(days=1)
+
+        new_rows = read_stock(INPUT_DATASET, stock, start=start)
+
+        if new_rows.empty:
+            continue
+
+        if state is None:
+            state = states[stock] = SymbolState(str(new_rows["Close"].dtype))
+
+        # compute_indicators output loses warm-up rows to dropna()
+        new_rows = advance(state, new_rows).dropna()
+
+        if not new_rows.empty:
+            append_partition(new_rows, OUTPUT_DATASET, stock, manifest)
+            appended += len(new_rows)
+
+    save_manifest(OUTPUT_DATASET, manifest)
+    save_state(states)
+
+    print(f"{LOG} Appended {appended} indicator rows")
+
+    return appended
+
+
+if __name__ == "__main__":
+    update_indicators()
@@ -0,0 +1,65 @@
+import pandas as pd
+from src.data_loader import NIFTY50_SYMBOLS, fetch_yfinance, download_all_stock_data
+from src.preprocess_data import run_preprocessing
+from src.features import run_feature_pipeline
+from src.indicator_state import update_indicators
+from src.price_arrays import build_arrays
+from src.forecast_store import run_forecasts
+from src.market_summary import update_summary
+from src.store import dataset_exists
+
+# =====================================================
+# DAILY INCREMENTAL UPDATE
+# =====================================================
+
+LOG = "[INGEST]"
+
+
+def run_daily_update(symbols=NIFTY50_SYMBOLS, fetch=fetch_yfinance, end=None):
+    """
+    Bring the store up to date without touching stored history:
+    fetch each symbol's missing tail after its watermark, append it to the
+    raw dataset, then preprocess and compute indicators only for the
+    appended rows
+    """
+
+    # yfinance treats `end` as exclusive
+    end = end or (pd.Timestamp.today().normalize() + pd.Timedelta(days=1)).strftime("%Y-%m-%d")
+
+    print(f"\n{LOG} Updating raw data up to {end}")
+    summary = download_all_stock_data(
+        symbols,
+        end=end,
+        fetch=fetch,
+        incremental=True
+    )
+
+    if not summary["rows"]:
+        print(f"{LOG} Already up to date")
+        return summary
+
+    print(f"{LOG} Preprocessing appended rows")
+    run_preprocessing(incremental=True)
+
+    if dataset_exists("technical"):
+        print(f"{LOG} Extending technical indicators")
+        update_indicators()
+    else:
+        print(f"{LOG} Building technical indicators")
+        run_feature_pipeline()
+
+    # Dashboard statistics, extended with the appended rows only
+    update_summary()
+
+    # refresh the memory-mapped layout the app reads from
+    build_arrays("processed")
+    build_arrays("technical")
+
+    # forecasts the Prediction page serves until the next refresh
+    run_forecasts()
+
+    return summary
+
+
+if __name__ == "__main__":
+    run_daily_update()
@@ -0,0 +1,220 @@
+import math
+import uuid
+import numpy as np
+import pandas as pd
+from src.store import (
+    DATE_COLUMN, PARTITION_KEY, dataset_dir, load_manifest, read_dataset, read_stock
+)
+
+# =====================================================
+# CONFIGURATION
+# =====================================================
+
+INPUT_DATASET = "processed"
+
+# one row per stock, kept next to the processed partitions; rewriting the
+# processed dataset wipes it and the next read rebuilds it
+SUMMARY_NAME = "_summary.parquet"
+
+# Mean / M2 (sum of squared deviations) / Closes are the running moments
+# behind Volatility, so appended rows update it without the history
+COLUMNS = [
+    "Stock", "First_Date", "Last_Date", "First_Close", "Last_Close",
+    "Return", "Volatility", "Records", "Closes", "Mean", "M2",
+]
+
+LOG = "[SUMMARY]"
+
+
+def summary_path():
+    return dataset_dir(INPUT_DATASET) / SUMMARY_NAME
+
+
+# =====================================================
+# PER-STOCK STATISTICS
+# =====================================================
+
+def _finish(row: dict) -> dict:
+
+    row["Return"] = (row["Last_Close"] - row["First_Close"]) / row["First_Close"]
+
+    # sample std of Close (ddof=1), as Series.std()
+    row["Volatility"] = math.sqrt(row["M2"] / (row["Closes"] - 1)) if row["Closes"] > 1 else math.nan
+
+    return row
+
+
+def summarize(stock_df: pd.DataFrame) -> dict:
+    """
+    Summary row of one stock's rows (sorted by date)
+    """
+
+    close = stock_df["Close"].to_numpy("float64")
+    dates = stock_df[DATE_COLUMN].to_numpy()
+    valid = close[~np.isnan(close)]
+    mean = float(valid.mean()) if len(valid) else 0.0
+
+    row = {
+        "First_Date": pd.Timestamp(dates[0]),
+        "Last_Date": pd.Timestamp(dates[-1]),
+        "First_Close": float(close[0]),
+        "Last_Close": float(close[-1]),
+        "Records": len(close),
+        "Closes": len(valid),
+        "Mean": mean,
+        "M2": float(((valid - mean) ** 2).sum()),
+    }
+
+    if "Sector" in stock_df:
+        row["Sector"] = stock_df["Sector"].iloc[-1]
+
+    return _finish(row)
+
+
+def merge(row: dict, new_df: pd.DataFrame) -> dict:
+    """
+    Extend a stock's summary with rows appended after its Last_Date
+    (pairwise mean / M2 combination, Chan et al.)
+    """
+
+    new = summarize(new_df)
+    n_a, n_b = row["Closes"], new["Closes"]
+    n = n_a + n_b
+
+    merged = {**row, "Last_Date": new["Last_Date"], "Last_Close": new["Last_Close"]}
+    merged["Records"] = row["Records"] + new["Records"]
+    merged["Closes"] = n
+
+    if n_b:
+        delta = new["Mean"] - row["Mean"]
+        merged["Mean"] = row["Mean"] + delta * n_b / n
+        merged["M2"] = row["M2"] + new["M2"] + delta ** 2 * n_a * n_b / n
+
+    if "Sector" in new:
+        merged["Sector"] = new["Sector"]
+
+    return _finish(merged)
+
+
+# =====================================================
+# BUILD / UPDATE
+# =====================================================
+
+def to_frame(rows: dict) -> pd.DataFrame:
+
+    summary = pd.DataFrame([{"Stock": stock, **row} for stock, row in sorted(rows.items())])
+    extra = [c for c in summary.columns if c not in COLUMNS]
+
+    return summary[COLUMNS + extra]
+
+
+def save_summary(rows: dict) -> pd.DataFrame:
+
+    summary = to_frame(rows)
+
+    # unique per writer, so concurrent writers never share a tmp file
+    path = summary_path()
+    tmp = path.with_name(f"{path.name}.{uuid.uuid4().hex[:12]}.tmp")
+    summary.to_parquet(tmp, index=False)
+    tmp.replace(path)
+
+    return summary
+
+
+def build_summary(df: pd.DataFrame = None, save=True) -> pd.DataFrame:
+    """
+    Summarize every stock from full history; `df` is the processed frame
+    when the caller already holds it. save=False only returns it (the
+    app's fallback before the pipeline has written one).
+    """
+
+    if df is None:
+        df = read_dataset(INPUT_DATASET)
+
+    rows = {
+        stock: summarize(stock_df.sort_values(DATE_COLUMN))
+        for stock, stock_df in df.groupby(PARTITION_KEY, sort=True, observed=True)
+    }
+
+    if not save:
+        return to_frame(rows)
+
+    summary = save_summary(rows)
+
+    print(f"{LOG} Built: {len(summary)} stocks")
+
+    return summary
+
+
+def read_summary():
+
+    path = summary_path()
+
+    if not path.exists():
+        return None
+
+    return pd.read_parquet(path)
+
+
+def update_summary() -> pd.DataFrame:
+    """
+    Bring the summary in line with the processed manifest, reading only
+    the rows appended after each stock's Last_Date. A stock whose stored
+    rows changed in any other way is summarized again from its full history.
+    """
+
+    summary = read_summary()
+
+    if summary is None:
+        return build_summary()
+
+    rows = {row.pop("Stock"): row for row in summary.to_dict("records")}
+    manifest = load_manifest(INPUT_DATASET)
+    partitions = manifest["partitions"]
+
+    removed = set(rows) - set(partitions)
+    for stock in removed:
+        del rows[stock]
+
+    stale = [
+        stock for stock, stats in partitions.items()
+        if stock not in rows
+        or rows[stock]["Records"] != stats["rows"]
+        or str(pd.Timestamp(rows[stock]["Last_Date"]).date()) != stats["max_date"]
+    ]
+
+    if not stale and not removed:
+        return summary
+
+    # one projected read of every stale stock's tail
+    columns = ["Close"] + (["Sector"] if "Sector" in manifest["columns"] else [])
+    starts = {
+        stock: pd.Timestamp(rows[stock]["Last_Date"]) + pd.Timedelta(days=1)
+        for stock in stale if stock in rows
+    }
+    tails = {}
+    if starts:
+        df = read_dataset(INPUT_DATASET, stocks=list(starts), columns=columns, start=min(starts.values()))
+        tails = dict(iter(df.groupby(PARTITION_KEY, observed=True)))
+
+    for stock in stale:
+
+        if stock in starts:
+            tail = tails.get(stock, df.iloc[:0])
+            new_rows = tail[tail[DATE_COLUMN] >= starts[stock]]
+
+            if len(new_rows) and rows[stock]["Records"] + len(new_rows) == partitions[stock]["rows"]:
+                rows[stock] = merge(rows[stock], new_rows)
+                continue
+
+        rows[stock] = summarize(read_stock(INPUT_DATASET, stock, columns=columns))
+
+    summary = save_summary(rows)
+
+    print(f"{LOG} Updated {len(stale) + len(removed)} stocks")
+
+    return summary
+
+
+if __name__ == "__main__":
+    build_summary()
@@ -0,0 +1,166 @@
+import os
+import json
+import time
+import hashlib
+import pandas as pd
+from pathlib import Path
+from contextlib import contextmanager
+
+# =====================================================
+# PROJECT PATHS
+# =====================================================
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+
+# one entry per trained artifact: "<model>/<stock>" -> fingerprint + files
+ARTIFACT_MANIFEST = PROJECT_ROOT / "models" / "_artifacts.json"
+
+# a lock older than this is left over from a killed process
+STALE_LOCK_SECONDS = 60
+
+LOG = "[CACHE]"
+
+# =====================================================
+# FINGERPRINT
+# =====================================================
+# A model is stale when anything that determines it changes:
+#   - the stock's input slice (values, columns and dtypes)
+#   - the feature definition (which columns / target the trainer uses)
+#   - the hyperparameters
+# The fingerprint hashes all three; a daily append changes the slice of
+# stocks that received new bars, and only those models retrain.
+
+def fingerprint(frame: pd.DataFrame, features, params: dict) -> str:
+
+    h = hashlib.sha256()
+
+    h.update(json.dumps(
+        {
+            "columns": [[str(c), str(t)] for c, t in frame.dtypes.items()],
+            "features": list(features),
+            "params": params,
+        },
+        sort_keys=True,
+        default=str,
+    ).encode())
+
+    rows = pd.util.hash_pandas_object(frame, index=False)
+    h.update(rows.to_numpy().tobytes())
+
+    return h.hexdigest()
+
+# =====================================================
+# MANIFEST
+# =====================================================
+
+@contextmanager
+def _locked(path=ARTIFACT_MANIFEST, stale_seconds=STALE_LOCK_SECONDS):
+    """
+    Cross-process lock around the manifest, so orchestrator workers can
+    record artifacts concurrently; also guards other shared files (array
+    builds)
+    """
+
+    lock = Path(path).with_suffix(".lock")
+    lock.parent.mkdir(parents=True, exist_ok=True)
+
+    while True:
+        try:
+            fd = os.open(lock, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+            break
+        except FileExistsError:
+            try:
+                if time.time() - lock.stat().st_mtime > stale_seconds:
+                    lock.unlink()
+            except OSError:
+                pass
+            time.sleep(0.05)
+
+    try:
+        yield
+    finally:
+        os.close(fd)
+        lock.unlink()
+
+
+def load_artifacts(path=ARTIFACT_MANIFEST) -> dict:
+
+    if not Path(path).exists():
+        return {}
+
+    with open(path) as f:
+        return json.load(f)
+
+
+def _save_artifacts(artifacts, path=ARTIFACT_MANIFEST):
+
+    path = Path(path)
+    tmp = path.with_suffix(".tmp")
+
+    with open(tmp, "w") as f:
+        json.dump(artifacts, f, indent=2, sort_keys=True)
+
+    tmp.replace(path)
+
+
+def artifact_key(model_type, stock):
+    return f"{model_type}/{stock}"
+
+
+def is_fresh(model_type, stock, fp, paths) -> bool:
+    """
+    True when the recorded fingerprint matches and every file still exists
+    """
+
+    entry = load_artifacts().get(artifact_key(model_type, stock))
+
+    if entry is None or entry["fingerprint"] != fp:
+        return False
+
+    return all(Path(p).exists() for p in paths)
+
+
+def _replace(files):
+    for tmp, path in (files or {}).items():
+        Path(tmp).replace(path)
+
+
+def record(model_type, stock, fp, paths, replace=None, **info):
+    """
+    Store the fingerprint a freshly saved artifact was trained from.
+    `replace` ({tmp: path}) moves the saved files into place under the
+    same lock, so the files never disagree with their entry.
+    """
+
+    with _locked():
+        _replace(replace)
+        artifacts = load_artifacts()
+        artifacts[artifact_key(model_type, stock)] = {
+            "fingerprint": fp,
+            "paths": [str(Path(p).relative_to(PROJECT_ROOT)) for p in paths],
+            "trained": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            **info,
+        }
+        _save_artifacts(artifacts)
+
+
+def update_entry(model_type, stock, expect=None, replace=None, **info) -> bool:
+    """
+    Update fields of an existing entry (e.g. after a model is refit in
+    place); its fingerprint is kept. Only when the entry still has the
+    `expect` fields: otherwise nothing is changed and False is returned.
+    `replace` ({tmp: path}) moves refit files into place under the lock.
+    """
+
+    with _locked():
+        artifacts = load_artifacts()
+        entry = artifacts.get(artifact_key(model_type, stock))
+
+        if entry is None or any(entry.get(k) != v for k, v in (expect or {}).items()):
+            return False
+
+        _replace(replace)
+        entry.update(info)
+        _save_artifacts(artifacts)
+
+    return True
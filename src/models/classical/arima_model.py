@@ -1,9 +1,9 @@
-import pandas as pd
 from pathlib import Path
 from statsmodels.tsa.stattools import adfuller
 from statsmodels.tsa.arima.model import ARIMA
 import joblib
 import matplotlib.pyplot as plt
+from src.store import read_stock
 
 
 # =====================================================
@@ -16,14 +16,24 @@ MODEL_DIR = PROJECT_ROOT / "models"
 MODEL_DIR.mkdir(parents=True, exist_ok=True)
 
 
+# =====================================================
+# CONFIGURATION
+# =====================================================
+# models are trained and saved by src.models.classical.arima_search;
+# this module provides its helpers and a holdout check of the saved order
+SPLIT_RATIO = 0.8
+
+
+def model_path(stock_name):
+    return MODEL_DIR / f"arima_{stock_name}.pkl"
+
+
 # =====================================================
 # LOAD ONE STOCK
 # =====================================================
 def load_stock(stock_name="RELIANCE.NS"):
-    df = pd.read_csv(DATA_PROCESSED / "nifty50_processed.csv")
-
-    stock_df = df[df["Stock"] == stock_name].sort_values("Date")
-    stock_df = stock_df.set_index("Date")
+    stock_df = read_stock("processed", stock_name, columns=["Close"])
+    stock_df = stock_df.drop(columns=["Stock"]).set_index("Date")
     stock_df = stock_df.asfreq("B").ffill()
 
     stock_df["Close"] = stock_df["Close"].ffill()
@@ -110,31 +120,37 @@ def forecast(model, steps):
 
 
 # =====================================================
-# MAIN PIPELINE
+# MAIN PIPELINE (EVALUATION ONLY)
 # =====================================================
 def run_arima(stock_name="RELIANCE.NS"):
+    """
+    Refit the searched order on the first SPLIT_RATIO of the series and
+    plot its forecast against the rest. Saves nothing.
+    """
+
+    path = model_path(stock_name)
+
+    if not path.exists():
+        raise FileNotFoundError(
+            f"ARIMA model not found for {stock_name}\n"
+            f"Run: python -m src.models.classical.arima_search"
+        )
+
+    order = joblib.load(path).model.order
 
     print("Loading stock data...")
     series = load_stock(stock_name)
 
-    print("Checking stationarity...")
-    stationary_series, d = make_stationary(series)
-
     print("Splitting data...")
-    train, test = time_split(stationary_series)
+    train, test = time_split(series, SPLIT_RATIO)
 
-    print("Training ARIMA model...")
-    order = (5, d, 0)   # simple baseline order
+    print(f"Fitting ARIMA{order} on the training split...")
     model = train_arima(train, order)
-
     print(model.summary())
 
     print("Forecasting...")
     predictions = forecast(model, len(test))
 
-    print("Saving model...")
-    joblib.dump(model, MODEL_DIR / f"arima_{stock_name}.pkl")
-
     print("Plotting results...")
     plt.figure(figsize=(12,6))
     plt.plot(test.index, test, label="Actual")
@@ -0,0 +1,445 @@
+import os
+import json
+import time
+import uuid
+import warnings
+import joblib
+import numpy as np
+import multiprocessing as mp
+from concurrent.futures import ProcessPoolExecutor, wait, FIRST_COMPLETED
+from statsmodels.tsa.stattools import adfuller
+from statsmodels.tsa.arima.model import ARIMA
+from src.store import list_stocks
+from src.model_cache import fingerprint, is_fresh, record
+from src.train_orchestrator import worker_env
+from src.models.classical.arima_model import MODEL_DIR, load_stock, model_path
+
+
+# =====================================================
+# CONFIGURATION
+# =====================================================
+MAX_D = 2
+MAX_P = 5
+MAX_Q = 5
+
+CRITERION = "aic"           # or "bic"
+ADF_ALPHA = 0.05
+
+# Orders are searched in rounds of increasing complexity p + q.
+# A candidate only seeds the next round ((p+1, q) and (p, q+1)) if it is
+# within PRUNE_MARGIN of the stock's best criterion so far, and a stock
+# stops once PATIENCE rounds in a row improved by less than MIN_IMPROVEMENT.
+PRUNE_MARGIN = 10.0
+MIN_IMPROVEMENT = 2.0
+PATIENCE = 2
+
+MAX_WORKERS = None          # default: all cores, one BLAS thread each
+
+REPORT_PATH = MODEL_DIR / "arima_search_report.json"
+
+# recorded with every saved model; the app refuses artifacts without it
+SOURCE = "arima_search"
+
+SEARCH_PARAMS = {
+    "max_d": MAX_D,
+    "max_p": MAX_P,
+    "max_q": MAX_Q,
+    "criterion": CRITERION,
+    "adf_alpha": ADF_ALPHA,
+    "prune_margin": PRUNE_MARGIN,
+    "min_improvement": MIN_IMPROVEMENT,
+    "patience": PATIENCE,
+    "frequency": "B",
+    "fill": "ffill",
+}
+
+LOG = "[ARIMA SEARCH]"
+
+
+# =====================================================
+# WORKER JOBS
+# =====================================================
+def find_d(series):
+    """
+    Smallest d <= MAX_D whose differenced series passes the ADF test.
+    Runs once per series; every candidate then shares it.
+    """
+
+    values = series.to_numpy()
+
+    for d in range(MAX_D + 1):
+
+        if len(values) < 10:
+            return d
+
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore")
+            p_value = adfuller(values)[1]
+
+        if p_value < ADF_ALPHA:
+            return d
+
+        values = np.diff(values)
+
+    return MAX_D
+
+
+def fit_candidate(series, order):
+    """
+    Fit one order; returns (aic, bic, seconds). Failed fits score inf.
+    """
+
+    started = time.perf_counter()
+
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        try:
+            res = ARIMA(series, order=order).fit()
+            aic, bic = float(res.aic), float(res.bic)
+        except Exception:
+            aic = bic = float("inf")
+
+    return aic, bic, time.perf_counter() - started
+
+
+def fit_final(series, order, path):
+    """
+    Refit the winning order and save it
+    """
+
+    started = time.perf_counter()
+
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        res = ARIMA(series, order=order).fit()
+
+    joblib.dump(res, path)
+
+    return time.perf_counter() - started
+
+
+# =====================================================
+# SEARCH STATE (PER STOCK)
+# =====================================================
+def grid_size():
+    return (MAX_P + 1) * (MAX_Q + 1)
+
+
+def next_orders(state):
+    """
+    Children of this round's surviving candidates that were not tried yet
+    """
+
+    best = state["best"][0]
+    orders = set()
+
+    for (p, q), crit in state["round"].items():
+
+        if crit > best + PRUNE_MARGIN:
+            continue
+
+        for child in ((p + 1, q), (p, q + 1)):
+            if child[0] <= MAX_P and child[1] <= MAX_Q and child not in state["tried"]:
+                orders.add(child)
+
+    return sorted(orders)
+
+
+def close_round(state):
+    """
+    Update best / patience after a round; returns the next round's (p, q)s
+    """
+
+    round_best = min(state["round"].items(), key=lambda kv: kv[1])
+
+    if round_best[1] < state["best"][0] - MIN_IMPROVEMENT:
+        state["stale"] = 0
+    else:
+        state["stale"] += 1
+
+    if round_best[1] < state["best"][0]:
+        state["best"] = (round_best[1], round_best[0])
+
+    if state["stale"] >= PATIENCE:
+        return []
+
+    return next_orders(state)
+
+
+# =====================================================
+# ENGINE
+# =====================================================
+def new_state(stock, force=False):
+    """
+    Search state for one stock, or None when its saved model is up to date
+    """
+
+    series = load_stock(stock)
+    path = model_path(stock)
+    fp = fingerprint(series.reset_index(), ["Close"], SEARCH_PARAMS)
+
+    if not force and is_fresh("arima", stock, fp, [path]):
+        return None
+
+    return {
+        "series": series, "fp": fp, "path": path,
+        "tmp": path.with_name(f"{path.name}.{uuid.uuid4().hex[:12]}.tmp"),
+        "d": None, "best": (float("inf"), None), "round": {},
+        "tried": set(), "pending": 0, "stale": 0,
+        "aic": {}, "bic": {}, "fit_seconds": 0.0,
+        "started": time.perf_counter(), "seconds": None,
+    }
+
+
+def best_order(state):
+    """
+    (p, d, q) of the best candidate; raises when no candidate could be fitted
+    """
+
+    if state["best"][1] is None:
+        raise ValueError(f"no candidate order could be fitted ({len(state['tried'])} tried)")
+
+    p, q = state["best"][1]
+
+    return p, state["d"], q
+
+
+def finish(stock, state):
+    """
+    Record the saved winner; the app only serves models recorded here
+    """
+
+    state["seconds"] = time.perf_counter() - state["started"]
+    p, d, q = best_order(state)
+
+    # the model is moved into place together with its entry
+    record(
+        "arima", stock, state["fp"], [state["path"]],
+        replace={state["tmp"]: state["path"]},
+        source=SOURCE, order=[p, d, q], criterion=CRITERION,
+        aic=state["aic"][(p, q)], bic=state["bic"][(p, q)],
+        fitted_at=time.time(),
+    )
+
+    print(
+        f"{LOG} {stock:<16} ARIMA({p},{state['d']},{q}) "
+        f"{CRITERION.upper()} {state['best'][0]:>10.1f}  "
+        f"{len(state['tried']):>2}/{grid_size()} fits  {state['seconds']:>6.1f}s"
+    )
+
+
+def fail(stock, state, error):
+    """
+    Mark a stock failed (constant series, no fittable order, final fit
+    error); the search goes on with the others
+    """
+
+    state["error"] = f"{type(error).__name__}: {error}"
+    state["seconds"] = time.perf_counter() - state["started"]
+    state["tmp"].unlink(missing_ok=True)
+
+    print(f"{LOG} {stock:<16} FAILED   {state['error']}")
+
+
+def train_stock(stock_name, force=False):
+    """
+    The same search for one stock, run serially in this process (the
+    orchestrator's "arima" job). Returns "trained" or "cached" and raises
+    when the stock cannot be fitted; the search report is only written by
+    run_search.
+    """
+
+    state = new_state(stock_name, force)
+
+    if state is None:
+        return "cached"
+
+    state["d"] = find_d(state["series"])
+    pqs = [(0, 0)]
+
+    while pqs:
+
+        state["round"] = {}
+
+        for p, q in pqs:
+            state["tried"].add((p, q))
+            aic, bic, seconds = fit_candidate(state["series"], (p, state["d"], q))
+            state["aic"][(p, q)], state["bic"][(p, q)] = aic, bic
+            state["round"][(p, q)] = aic if CRITERION == "aic" else bic
+            state["fit_seconds"] += seconds
+
+        pqs = close_round(state)
+
+    state["fit_seconds"] += fit_final(state["series"], best_order(state), state["tmp"])
+
+    finish(stock_name, state)
+
+    return "trained"
+
+
+def run_search(stocks=None, max_workers=MAX_WORKERS, force=False):
+    """
+    ARIMA order search for every stock, all candidate fits sharing one
+    process pool. Saves each stock's winning model and a search report.
+    """
+
+    stocks = stocks or list_stocks("processed")
+
+    print("\n==============================")
+    print("ARIMA ORDER SEARCH")
+    print("==============================")
+
+    states = {}
+    cached = []
+
+    for stock in stocks:
+
+        state = new_state(stock, force)
+
+        if state is None:
+            cached.append(stock)
+        else:
+            states[stock] = state
+
+    workers = max_workers or os.cpu_count() or 1
+
+    print(f"{LOG} Stocks: {len(states)} to search, {len(cached)} up to date")
+    print(f"{LOG} Grid: p<={MAX_P}, q<={MAX_Q} ({grid_size()} orders), criterion {CRITERION.upper()}")
+    print(f"{LOG} Workers: {workers}")
+
+    started = time.perf_counter()
+    futures = {}
+
+    # one BLAS thread per worker, inherited from this process's environment
+    with worker_env(1), ProcessPoolExecutor(
+        max_workers=workers,
+        mp_context=mp.get_context("spawn"),
+    ) as pool:
+
+        def submit_round(stock, pqs):
+            state = states[stock]
+            state["round"] = {}
+            for p, q in pqs:
+                state["tried"].add((p, q))
+                state["pending"] += 1
+                order = (p, state["d"], q)
+                futures[pool.submit(fit_candidate, state["series"], order)] = ("fit", stock, (p, q))
+
+        for stock, state in states.items():
+            futures[pool.submit(find_d, state["series"])] = ("d", stock, None)
+
+        while futures:
+
+            done, _ = wait(futures, return_when=FIRST_COMPLETED)
+
+            for future in done:
+
+                kind, stock, pq = futures.pop(future)
+                state = states[stock]
+
+                # a failed stock's candidates still in flight are ignored
+                if "error" in state:
+                    continue
+
+                try:
+                    if kind == "d":
+                        state["d"] = future.result()
+                        submit_round(stock, [(0, 0)])
+
+                    elif kind == "fit":
+                        aic, bic, seconds = future.result()
+                        state["aic"][pq], state["bic"][pq] = aic, bic
+                        state["round"][pq] = aic if CRITERION == "aic" else bic
+                        state["fit_seconds"] += seconds
+                        state["pending"] -= 1
+
+                        if state["pending"] == 0:
+                            pqs = close_round(state)
+                            if pqs:
+                                submit_round(stock, pqs)
+                            else:
+                                order = best_order(state)
+                                futures[pool.submit(fit_final, state["series"], order, state["tmp"])] = ("final", stock, None)
+
+                    else:
+                        state["fit_seconds"] += future.result()
+                        finish(stock, state)
+
+                except Exception as e:
+                    fail(stock, state, e)
+
+    wall = time.perf_counter() - started
+
+    return write_report(states, cached, wall, workers)
+
+
+def load_report():
+
+    if not REPORT_PATH.exists():
+        return {"stocks": {}}
+
+    with open(REPORT_PATH) as f:
+        return json.load(f)
+
+
+def write_report(states, cached, wall, workers):
+
+    # up-to-date stocks keep their entry from the run that searched them
+    previous = load_report()["stocks"]
+
+    report = {
+        "criterion": CRITERION,
+        "params": SEARCH_PARAMS,
+        "workers": workers,
+        "seconds": round(wall, 3),
+        "cached": cached,
+        "stocks": {s: previous[s] for s in cached if s in previous},
+    }
+
+    for stock, state in states.items():
+
+        if "error" in state:
+            report["stocks"][stock] = {
+                "failed": state["error"],
+                "candidates": len(state["tried"]),
+                "fit_seconds": round(state["fit_seconds"], 3),
+                "wall_seconds": round(state["seconds"], 3),
+            }
+            continue
+
+        p, q = state["best"][1]
+        report["stocks"][stock] = {
+            "order": [p, state["d"], q],
+            "aic": state["aic"][(p, q)],
+            "bic": state["bic"][(p, q)],
+            "candidates": len(state["tried"]),
+            "pruned": grid_size() - len(state["tried"]),
+            "fit_seconds": round(state["fit_seconds"], 3),
+            "wall_seconds": round(state["seconds"], 3),
+        }
+
+    tmp = REPORT_PATH.with_suffix(".tmp")
+    with open(tmp, "w") as f:
+        json.dump(report, f, indent=2)
+    tmp.replace(REPORT_PATH)
+
+    fits = sum(s["candidates"] for s in report["stocks"].values())
+    fit_seconds = sum(s["fit_seconds"] for s in report["stocks"].values())
+
+    print("\n==============================")
+    print("ARIMA SEARCH COMPLETE")
+    print("==============================")
+    print("Stocks searched :", len(states))
+    print("Failed          :", sum("error" in s for s in states.values()))
+    print("Up to date      :", len(cached))
+    print(f"Candidate fits  : {fits} of {grid_size() * len(states)} in the full grid")
+    print(f"Fit time (sum)  : {fit_seconds:.1f}s")
+    print(f"Wall time       : {wall:.1f}s")
+    print("Report          :", REPORT_PATH)
+    print("==============================\n")
+
+    return report
+
+
+if __name__ == "__main__":
+    run_search()
@@ -1,16 +1,18 @@
 import pandas as pd
+import tracemalloc
 from pathlib import Path
+from src.store import (
+    read_dataset, read_stock, write_dataset, list_stocks, create_dataset,
+    open_dataset, write_partition, append_partition, save_manifest, load_watermarks
+)
 
 PROJECT_ROOT = Path(__file__).resolve().parent.parent
 DATA_RAW = PROJECT_ROOT / "data" / "raw"
 DATA_PROCESSED = PROJECT_ROOT / "data" / "processed"
 
-def load_data():
-    df = pd.read_csv(DATA_RAW / "nifty50_all_stock_data.csv")
+PRICE_COLS = ["Open", "High", "Low", "Close"]
 
-    # remove index column if present
-    if "Unnamed: 0" in df.columns:
-        df = df.drop(columns=["Unnamed: 0"])
+def clean_data(df):
 
     # select OHLCV structure
     df = df[['Date', 'Open', 'High', 'Low', 'Close', 'Volume', 'Stock']]
@@ -24,6 +26,22 @@ def load_data():
     # enforce time ordering
     df = df.sort_values(["Stock", "Date"]).reset_index(drop=True)
 
+    return df
+
+def compact_dtypes(df):
+    """
+    float32 prices, integer volume and a categorical Stock column
+    """
+
+    df[PRICE_COLS] = df[PRICE_COLS].astype("float32")
+    df["Volume"] = df["Volume"].round().astype("Int64" if df["Volume"].isna().any() else "int64")
+    df["Stock"] = df["Stock"].astype("category")
+
+    return df
+
+def load_data():
+    df = clean_data(read_dataset("raw"))
+
     # validation
     print("Rows:", len(df))
     print("Stocks:", df["Stock"].nunique())
@@ -32,13 +50,104 @@ def load_data():
 
     return df
 
-def run_preprocessing():
+def preprocess_new_rows():
+    """
+    Clean only the raw rows newer than each stock's processed watermark
+    and append them to the processed dataset
+    """
+
+    raw_marks = load_watermarks("raw")
+    done_marks = load_watermarks("processed")
+
+    manifest = open_dataset("processed")
+    appended = 0
+
+    for stock, raw_last in raw_marks.items():
+
+        last = done_marks.get(stock)
+
+        if last is not None and last >= raw_last:
+            continue
+
+        start = last + pd.Timedelta(days=1) if last is not None else None
+        new_rows = compact_dtypes(clean_data(read_stock("raw", stock, start=start)))
+
+        if new_rows.empty:
+            continue
+
+        append_partition(new_rows, "processed", stock, manifest)
+        appended += len(new_rows)
+
+    save_manifest("processed", manifest)
+
+    print("New rows:", appended)
+
+    return appended
+
+def stream_preprocessing():
+    """
+    Preprocess one stock partition at a time so peak memory is bounded by
+    the largest single stock, not the whole universe. Duplicate dates are
+    dropped and rows ordered within each stock.
+    """
+
+    tracemalloc.start()
+
+    manifest = create_dataset("processed")
+
+    rows = 0
+    missing = 0
+    duplicates = 0
+    largest = 0
+
+    stocks = list_stocks("raw")
+
+    for stock in stocks:
+
+        stock_df = compact_dtypes(clean_data(read_stock("raw", stock)))
+
+        dupes = stock_df.duplicated(subset=["Date"], keep="last")
+        duplicates += int(dupes.sum())
+        stock_df = stock_df[~dupes]
+
+        missing += int(stock_df.isnull().sum().sum())
+        rows += len(stock_df)
+        largest = max(largest, int(stock_df.memory_usage(deep=True).sum()))
+
+        write_partition(stock_df, "processed", stock, manifest)
+
+    save_manifest("processed", manifest)
+
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    # validation
+    print("Rows:", rows)
+    print("Stocks:", len(stocks))
+    print("Missing:", missing)
+    print("Duplicates dropped:", duplicates)
+    print(f"Largest partition in memory: {largest / 1e6:.2f} MB")
+    print(f"Peak traced memory: {peak / 1e6:.2f} MB")
+
+    return rows
+
+def run_preprocessing(incremental=False, streaming=True):
+
+    if incremental:
+        print("Preprocessing new rows...")
+        preprocess_new_rows()
+        return
+
+    if streaming:
+        print("Preprocessing stock by stock...")
+        stream_preprocessing()
+        print("Data cleaned successfully!")
+        return
 
     print("Loading data...")
     final_df = load_data()
 
-    DATA_PROCESSED.mkdir(parents=True, exist_ok=True)
-    final_df.to_csv(DATA_PROCESSED / "nifty50_processed.csv")
+    write_dataset(final_df, "processed")
 
     print("Data cleaned successfully!")
 
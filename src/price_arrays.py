@@ -0,0 +1,243 @@
+import json
+import uuid
+import numpy as np
+import pandas as pd
+from numpy.lib.format import open_memmap
+from src.store import (
+    DATE_COLUMN, dataset_dir, load_manifest, read_stock
+)
+from src.model_cache import _locked
+
+# =====================================================
+# LAYOUT
+# =====================================================
+# data/store/<dataset>/_arrays/
+#     index.json              symbol -> [start, end) row offsets, column dtypes
+#     <column>.<build>.npy    one contiguous array per column,
+#                             rows sorted by (symbol, date)
+#
+# Arrays are opened with mmap_mode="r": slicing one symbol is zero-copy and
+# every process mapping the same files shares the OS page cache instead of
+# holding its own DataFrame.
+#
+# Builds hold index.lock, so only one process builds a dataset at a time.
+# A build keeps the previous build's files: a reader that loaded the old
+# index just before the swap can still map them.
+
+ARRAYS_DIR = "_arrays"
+INDEX_NAME = "index.json"
+
+# a build lock older than this is left over from a killed process
+BUILD_LOCK_SECONDS = 600
+
+LOG = "[ARRAYS]"
+
+
+def arrays_dir(name: str):
+    return dataset_dir(name) / ARRAYS_DIR
+
+
+def _array_dtype(dtype: str) -> np.dtype:
+
+    # nullable integers (volume with gaps) are widened to float with NaN
+    if dtype.startswith("Int") or dtype.startswith("UInt"):
+        return np.dtype("float64")
+
+    return np.dtype(dtype)
+
+
+def _source_stats(manifest: dict) -> dict:
+    return {
+        stock: [stats["rows"], stats["max_date"]]
+        for stock, stats in manifest["partitions"].items()
+    }
+
+
+def _read_index(name: str):
+
+    path = arrays_dir(name) / INDEX_NAME
+
+    if not path.exists():
+        return None
+
+    with open(path) as f:
+        return json.load(f)
+
+
+# =====================================================
+# BUILD
+# =====================================================
+
+def build_arrays(name: str, if_stale=False) -> dict:
+    """
+    Lay a dataset out as contiguous per-column arrays plus an offset index.
+    Fills one stock at a time, so memory stays bounded by a single partition.
+    With if_stale, the index is returned as is when another process
+    brought it up to date while this one waited for the lock.
+    """
+
+    target = arrays_dir(name)
+    target.mkdir(parents=True, exist_ok=True)
+
+    with _locked(target / INDEX_NAME, BUILD_LOCK_SECONDS):
+
+        previous = _read_index(name)
+
+        if if_stale and previous is not None and _is_current(name, previous):
+            return previous
+
+        return _build(name, previous)
+
+
+def _build(name: str, previous) -> dict:
+
+    manifest = load_manifest(name)
+    stocks = sorted(manifest["partitions"])
+
+    columns = {
+        col: _array_dtype(dtype)
+        for col, dtype in manifest["columns"].items()
+        if dtype not in ("object", "category")
+    }
+
+    target = arrays_dir(name)
+
+    build = uuid.uuid4().hex[:12]
+    total = sum(manifest["partitions"][s]["rows"] for s in stocks)
+
+    arrays = {
+        col: open_memmap(target / f"{col}.{build}.npy", mode="w+", dtype=dtype, shape=(total,))
+        for col, dtype in columns.items()
+    }
+
+    symbols = {}
+    offset = 0
+
+    for stock in stocks:
+
+        stock_df = read_stock(name, stock, columns=list(columns))
+        end = offset + len(stock_df)
+
+        for col, arr in arrays.items():
+            if arr.dtype.kind == "f":
+                arr[offset:end] = stock_df[col].to_numpy(dtype=arr.dtype, na_value=np.nan)
+            else:
+                arr[offset:end] = stock_df[col].to_numpy(dtype=arr.dtype)
+
+        symbols[stock] = [offset, end]
+        offset = end
+
+    for arr in arrays.values():
+        arr.flush()
+    del arrays
+
+    index = {
+        "build": build,
+        "rows": total,
+        "columns": {col: str(dtype) for col, dtype in columns.items()},
+        "symbols": symbols,
+        "source": _source_stats(manifest),
+    }
+
+    tmp = target / f"{INDEX_NAME}.{build}.tmp"
+    with open(tmp, "w") as f:
+        json.dump(index, f, indent=2)
+    tmp.replace(target / INDEX_NAME)
+
+    # drop builds older than the previous one; processes still mapping
+    # them keep their pages
+    keep = {build} | ({previous["build"]} if previous else set())
+
+    for path in target.glob("*.npy"):
+        if path.name.split(".")[-2] not in keep:
+            try:
+                path.unlink()
+            except OSError:
+                pass
+
+    print(f"{LOG} Built {name}: {len(symbols)} symbols, {total} rows, {len(columns)} columns")
+
+    return index
+
+
+# =====================================================
+# READ
+# =====================================================
+
+class PriceArrays:
+    """
+    Read-only, memory-mapped view of one dataset
+    """
+
+    def __init__(self, name: str, index: dict):
+        self.name = name
+        self.index = index
+        self.offsets = index["symbols"]
+
+        target = arrays_dir(name)
+        self.arrays = {
+            col: np.load(target / f"{col}.{index['build']}.npy", mmap_mode="r")
+            for col in index["columns"]
+        }
+
+    @property
+    def stocks(self) -> list:
+        return sorted(self.offsets)
+
+    def columns(self, stock: str, columns=None) -> dict:
+        """
+        Zero-copy views of one stock's rows, keyed by column
+        """
+
+        start, end = self.offsets[stock]
+        columns = columns or [DATE_COLUMN] + sorted(c for c in self.arrays if c != DATE_COLUMN)
+
+        return {col: self.arrays[col][start:end] for col in columns}
+
+    def frame(self, stock: str, columns=None) -> pd.DataFrame:
+        """
+        One stock's history as a DataFrame (Date first, sorted by date)
+        """
+
+        if columns is not None and DATE_COLUMN not in columns:
+            columns = [DATE_COLUMN] + list(columns)
+
+        df = pd.DataFrame(self.columns(stock, columns), copy=False)
+        df["Stock"] = stock
+
+        return df
+
+
+def _is_current(name: str, index: dict) -> bool:
+
+    target = arrays_dir(name)
+    files = all((target / f"{col}.{index['build']}.npy").exists() for col in index["columns"])
+
+    return files and index["source"] == _source_stats(load_manifest(name))
+
+
+def open_arrays(name: str, rebuild=True) -> PriceArrays:
+    """
+    Map a dataset's arrays, (re)building them first if missing or stale.
+    With rebuild=False (the app) the last built index is served as is and
+    building is left to the pipeline.
+    """
+
+    index = _read_index(name)
+
+    if not rebuild:
+        if index is None:
+            raise FileNotFoundError(
+                f"No arrays built for {name}\n"
+                f"Build: python -m src.price_arrays"
+            )
+
+    elif index is None or not _is_current(name, index):
+        index = build_arrays(name, if_stale=True)
+
+    return PriceArrays(name, index)
+
+
+if __name__ == "__main__":
+    for dataset in ("processed", "technical"):
+        build_arrays(dataset)
@@ -0,0 +1,345 @@
+import json
+import shutil
+import pandas as pd
+from pathlib import Path
+
+# =====================================================
+# PROJECT PATHS
+# =====================================================
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+
+DATA_RAW = PROJECT_ROOT / "data" / "raw"
+DATA_PROCESSED = PROJECT_ROOT / "data" / "processed"
+STORE_DIR = PROJECT_ROOT / "data" / "store"
+
+MANIFEST_NAME = "_manifest.json"
+
+# monolithic CSVs migrated into the store on first read
+LEGACY_CSV = {
+    "raw": DATA_RAW / "nifty50_all_stock_data.csv",
+    "processed": DATA_PROCESSED / "nifty50_processed.csv",
+    "technical": DATA_PROCESSED / "nifty50_technical.csv",
+}
+
+# =====================================================
+# COLUMN TYPES
+# =====================================================
+
+PARTITION_KEY = "Stock"
+DATE_COLUMN = "Date"
+INTEGER_COLUMNS = ["Volume"]
+
+CSV_CHUNK_ROWS = 50_000     # rows parsed at a time when migrating CSVs
+
+LOG = "[STORE]"
+
+
+def coerce_types(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Give every column a fixed storage type:
+    Date -> datetime64, Stock -> string, Volume -> int64, rest -> float64
+    (float32 columns are kept as they are)
+    """
+
+    df = df.copy()
+
+    for col in df.columns:
+        if col == DATE_COLUMN:
+            df[col] = pd.to_datetime(df[col])
+        elif col == PARTITION_KEY:
+            df[col] = df[col].astype(str)
+        else:
+            df[col] = pd.to_numeric(df[col], errors="coerce")
+
+            # volume stays integral unless gaps force a float
+            if col in INTEGER_COLUMNS and not df[col].isna().any():
+                df[col] = df[col].astype("int64")
+            elif col not in INTEGER_COLUMNS and df[col].dtype != "float32":
+                df[col] = df[col].astype("float64")
+
+    return df
+
+
+# =====================================================
+# MANIFEST
+# =====================================================
+
+def dataset_dir(name: str) -> Path:
+    return STORE_DIR / name
+
+
+def partition_path(name: str, stock: str) -> Path:
+    return dataset_dir(name) / f"{stock}.parquet"
+
+
+def load_manifest(name: str) -> dict:
+    """
+    Read a dataset's manifest (partition files, row counts, date ranges)
+    """
+
+    _ensure_dataset(name)
+
+    with open(dataset_dir(name) / MANIFEST_NAME) as f:
+        return json.load(f)
+
+
+def save_manifest(name: str, manifest: dict):
+
+    path = dataset_dir(name) / MANIFEST_NAME
+    tmp = path.with_suffix(".tmp")
+
+    with open(tmp, "w") as f:
+        json.dump(manifest, f, indent=2, sort_keys=True)
+
+    tmp.replace(path)
+
+
+def _partition_stats(stock_df: pd.DataFrame) -> dict:
+
+    return {
+        "rows": int(len(stock_df)),
+        "min_date": stock_df[DATE_COLUMN].min().strftime("%Y-%m-%d"),
+        "max_date": stock_df[DATE_COLUMN].max().strftime("%Y-%m-%d"),
+    }
+
+
+def dataset_exists(name: str) -> bool:
+    return (dataset_dir(name) / MANIFEST_NAME).exists()
+
+
+# =====================================================
+# WRITE
+# =====================================================
+
+def write_partition(stock_df: pd.DataFrame, name: str, stock: str, manifest: dict):
+    """
+    Write one stock's rows (sorted by date) and record its stats in the manifest
+    """
+
+    stock_df = coerce_types(stock_df.drop(columns=[PARTITION_KEY], errors="ignore"))
+    stock_df = stock_df.sort_values(DATE_COLUMN).reset_index(drop=True)
+
+    stock_df.to_parquet(partition_path(name, stock), index=False)
+
+    manifest["partitions"][stock] = _partition_stats(stock_df)
+    manifest["columns"] = {
+        col: str(dtype) for col, dtype in stock_df.dtypes.items()
+    }
+
+
+def new_manifest(name: str) -> dict:
+    return {"dataset": name, "columns": {}, "partitions": {}}
+
+
+def open_dataset(name: str) -> dict:
+    """
+    Return the manifest of a dataset for partition-wise writes, creating it if needed.
+    A dataset still held in its legacy CSV is migrated first, so appends
+    extend the migrated partitions.
+    """
+
+    try:
+        return load_manifest(name)
+    except FileNotFoundError:
+        dataset_dir(name).mkdir(parents=True, exist_ok=True)
+        return new_manifest(name)
+
+
+def create_dataset(name: str) -> dict:
+    """
+    Drop any existing partitions of a dataset and return a fresh manifest
+    """
+
+    target = dataset_dir(name)
+    if target.exists():
+        shutil.rmtree(target)
+    target.mkdir(parents=True)
+
+    return new_manifest(name)
+
+
+def append_partition(new_df: pd.DataFrame, name: str, stock: str, manifest: dict):
+    """
+    Append rows to one stock's partition; rows on an already stored date replace it
+    """
+
+    path = partition_path(name, stock)
+
+    if stock in manifest["partitions"] and path.exists():
+        new_df = coerce_types(new_df.drop(columns=[PARTITION_KEY], errors="ignore"))
+        combined = pd.concat([pd.read_parquet(path), new_df], ignore_index=True)
+        new_df = combined.drop_duplicates(subset=[DATE_COLUMN], keep="last")
+
+    write_partition(new_df, name, stock, manifest)
+
+
+def write_dataset(df: pd.DataFrame, name: str):
+    """
+    Replace a dataset with one parquet partition per stock
+    """
+
+    manifest = create_dataset(name)
+
+    for stock, stock_df in df.groupby(PARTITION_KEY, sort=True, observed=True):
+        write_partition(stock_df, name, stock, manifest)
+
+    save_manifest(name, manifest)
+
+    print(f"{LOG} Wrote {name}: {len(manifest['partitions'])} partitions, {len(df)} rows")
+
+
+# =====================================================
+# READ
+# =====================================================
+
+def list_stocks(name: str) -> list:
+    return sorted(load_manifest(name)["partitions"])
+
+
+def load_watermarks(name: str) -> dict:
+    """
+    Last stored date per stock (empty if the dataset does not exist yet)
+    """
+
+    try:
+        partitions = load_manifest(name)["partitions"]
+    except FileNotFoundError:
+        return {}
+
+    return {
+        stock: pd.Timestamp(stats["max_date"])
+        for stock, stats in partitions.items()
+    }
+
+
+def _overlaps(stats: dict, start, end) -> bool:
+
+    if start is not None and pd.Timestamp(stats["max_date"]) < start:
+        return False
+    if end is not None and pd.Timestamp(stats["min_date"]) > end:
+        return False
+    return True
+
+
+def read_dataset(name: str, stocks=None, columns=None, start=None, end=None) -> pd.DataFrame:
+    """
+    Read a dataset, touching only the partitions of the requested stocks.
+
+    stocks  : one symbol, a list of symbols, or None for all
+    columns : subset of columns to decode (Date and Stock are always returned)
+    start / end : inclusive date bounds, pruned against partition stats first
+    """
+
+    manifest = load_manifest(name)
+    partitions = manifest["partitions"]
+
+    if stocks is None:
+        stocks = sorted(partitions)
+    elif isinstance(stocks, str):
+        stocks = [stocks]
+
+    start = pd.Timestamp(start) if start is not None else None
+    end = pd.Timestamp(end) if end is not None else None
+
+    if columns is not None:
+        columns = [DATE_COLUMN] + [
+            c for c in columns if c not in (DATE_COLUMN, PARTITION_KEY)
+        ]
+
+    filters = []
+    if start is not None:
+        filters.append((DATE_COLUMN, ">=", start))
+    if end is not None:
+        filters.append((DATE_COLUMN, "<=", end))
+
+    frames = []
+
+    for stock in stocks:
+
+        stats = partitions.get(stock)
+        if stats is None or not _overlaps(stats, start, end):
+            continue
+
+        stock_df = pd.read_parquet(
+            partition_path(name, stock),
+            columns=columns,
+            filters=filters or None
+        )
+        stock_df.insert(len(stock_df.columns), PARTITION_KEY, stock)
+        frames.append(stock_df)
+
+    if not frames:
+        cols = columns or list(manifest["columns"])
+        return pd.DataFrame(columns=cols + [PARTITION_KEY])
+
+    df = pd.concat(frames, ignore_index=True)
+    df[PARTITION_KEY] = pd.Categorical(df[PARTITION_KEY], categories=stocks)
+    df[PARTITION_KEY] = df[PARTITION_KEY].cat.remove_unused_categories()
+
+    return df
+
+
+def read_stock(name: str, stock: str, columns=None, start=None, end=None) -> pd.DataFrame:
+    """
+    Read a single stock's history, sorted by date
+    """
+
+    return read_dataset(name, stocks=stock, columns=columns, start=start, end=end)
+
+
+# =====================================================
+# LEGACY CSV MIGRATION
+# =====================================================
+
+def migrate_csv(name: str, csv_path: Path = None, chunksize: int = CSV_CHUNK_ROWS):
+    """
+    Convert one of the monolithic CSVs into a partitioned dataset,
+    parsing it in chunks so the whole file is never held in memory
+    """
+
+    csv_path = csv_path or LEGACY_CSV[name]
+
+    print(f"{LOG} Migrating {csv_path.name} -> {name}")
+
+    manifest = create_dataset(name)
+    rows = 0
+
+    for chunk in pd.read_csv(csv_path, chunksize=chunksize):
+
+        if "Unnamed: 0" in chunk.columns:
+            chunk = chunk.drop(columns=["Unnamed: 0"])
+
+        for stock, stock_df in chunk.groupby(PARTITION_KEY, sort=False):
+            append_partition(stock_df, name, stock, manifest)
+
+        rows += len(chunk)
+
+    save_manifest(name, manifest)
+
+    print(f"{LOG} Wrote {name}: {len(manifest['partitions'])} partitions, {rows} rows")
+
+
+def _ensure_dataset(name: str):
+
+    if dataset_exists(name):
+        return
+
+    legacy = LEGACY_CSV.get(name)
+
+    if legacy is None or not legacy.exists():
+        raise FileNotFoundError(
+            f"Dataset '{name}' not found\nExpected: {dataset_dir(name) / MANIFEST_NAME}"
+        )
+
+    migrate_csv(name, legacy)
+
+
+# =====================================================
+# SCRIPT EXECUTION
+# =====================================================
+
+if __name__ == "__main__":
+    for dataset, path in LEGACY_CSV.items():
+        if path.exists():
+            migrate_csv(dataset, path)
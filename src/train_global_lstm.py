@@ -0,0 +1,267 @@
+import numpy as np
+import pandas as pd
+import joblib
+import tensorflow as tf
+from sklearn.preprocessing import MinMaxScaler
+from tensorflow.keras.models import Model, load_model
+from tensorflow.keras.layers import (
+    Input, LSTM, Dense, Dropout, Embedding, RepeatVector, Concatenate
+)
+from src.store import list_stocks, read_stock
+from src.model_cache import fingerprint, is_fresh, record
+from src.train_lstm_model import LOOKBACK, MIN_ROWS, MODEL_DIR, export_weights
+
+# =========================
+# PATHS
+# =========================
+# one network + one metadata file (stock ids, per-stock scalers) for all stocks
+
+GLOBAL_MODEL_PATH = MODEL_DIR / "global.keras"
+GLOBAL_META_PATH = MODEL_DIR / "global_meta.pkl"
+GLOBAL_WEIGHTS_PATH = MODEL_DIR / "global.npz"     # TF-free serving copy
+
+# =========================
+# PARAMETERS
+# =========================
+
+EPOCHS = 5              # every epoch already sees all stocks' windows
+BATCH_SIZE = 256
+EMBED_DIM = 8
+
+MODEL_PARAMS = {
+    "lookback": LOOKBACK,
+    "epochs": EPOCHS,
+    "batch_size": BATCH_SIZE,
+    "embed_dim": EMBED_DIM,
+    "min_rows": MIN_ROWS,
+    "scaler": "minmax_per_stock",
+    "layers": ["embed_repeat_concat", "lstm64_seq", "dropout0.2", "lstm64", "dropout0.2", "dense1"],
+}
+
+LOG = "[GLOBAL LSTM]"
+
+# =========================
+# MODEL
+# =========================
+
+def build_global_model(n_stocks):
+    """
+    Shared 2-layer LSTM; a learned per-stock embedding is appended to
+    every time step so one network can tell the stocks apart
+    """
+
+    window = Input(shape=(LOOKBACK, 1), name="window")
+    stock_id = Input(shape=(), dtype="int32", name="stock_id")
+
+    emb = Embedding(n_stocks, EMBED_DIM)(stock_id)
+    emb = RepeatVector(LOOKBACK)(emb)
+
+    x = Concatenate()([window, emb])
+    x = LSTM(64, return_sequences=True)(x)
+    x = Dropout(0.2)(x)
+    x = LSTM(64)(x)
+    x = Dropout(0.2)(x)
+    out = Dense(1)(x)
+
+    model = Model(inputs=[window, stock_id], outputs=out)
+    model.compile(optimizer="adam", loss="mse")
+
+    return model
+
+# =========================
+# INPUT PIPELINE
+# =========================
+
+def make_global_dataset(scaled, lookback, batch_size, shuffle=True):
+    """
+    All stocks' scaled series laid end to end in one tensor. Windows are
+    (start offset, stock id) pairs and are gathered per batch, so no
+    window ever crosses a stock boundary and nothing is materialized.
+    """
+
+    flat = tf.constant(np.concatenate(scaled), dtype=tf.float32)
+    offsets = tf.range(lookback, dtype=tf.int64)
+
+    starts, ids = [], []
+    offset = 0
+
+    for i, series in enumerate(scaled):
+        n_windows = len(series) - lookback
+        starts.append(offset + np.arange(n_windows, dtype="int64"))
+        ids.append(np.full(n_windows, i, dtype="int32"))
+        offset += len(series)
+
+    starts = np.concatenate(starts)
+    ids = np.concatenate(ids)
+
+    ds = tf.data.Dataset.from_tensor_slices((starts, ids))
+
+    if shuffle:
+        ds = ds.shuffle(len(starts), reshuffle_each_iteration=True)
+
+    def gather(start, stock_id):
+        X = tf.gather(flat, start[:, None] + offsets)
+        y = tf.gather(flat, start + lookback)
+        return {"window": X, "stock_id": stock_id}, y
+
+    return (
+        ds.batch(batch_size)
+        .map(gather, num_parallel_calls=tf.data.AUTOTUNE)
+        .prefetch(tf.data.AUTOTUNE)
+    )
+
+# =========================
+# TRAIN
+# =========================
+
+def train_global(series_by_stock, epochs=EPOCHS):
+    """
+    series_by_stock: {stock: Close array (n, 1)}. Stocks with fewer than
+    MIN_ROWS rows are left out. Returns (model, meta).
+    """
+
+    stocks = sorted(s for s, series in series_by_stock.items() if len(series) >= MIN_ROWS)
+
+    scalers = {}
+    scaled = []
+
+    for stock in stocks:
+        scaler = MinMaxScaler()
+        scaled.append(scaler.fit_transform(series_by_stock[stock]))
+        scalers[stock] = scaler
+
+    dataset = make_global_dataset(scaled, LOOKBACK, BATCH_SIZE)
+
+    model = build_global_model(len(stocks))
+    model.fit(dataset, epochs=epochs, verbose=0)
+
+    meta = {
+        "stocks": stocks,
+        "ids": {stock: i for i, stock in enumerate(stocks)},
+        "scalers": scalers,
+        "lookback": LOOKBACK,
+    }
+
+    return model, meta
+
+def export_global(model, meta, path=GLOBAL_WEIGHTS_PATH):
+    """
+    NumPy weights with one scaler row per stock, in stock-id order
+    """
+
+    stocks = meta["stocks"]
+    scalers = [meta["scalers"][s] for s in stocks]
+
+    return export_weights(
+        model, path,
+        [s.min_[0] for s in scalers],
+        [s.scale_[0] for s in scalers],
+        stocks=stocks,
+    )
+
+# =========================
+# SCORE
+# =========================
+
+def predict_next(model, meta, windows):
+    """
+    One forward pass for many stocks.
+    windows: {stock: last LOOKBACK closes}. Returns {stock: next close}.
+    """
+
+    stocks = list(windows)
+
+    X = np.stack([
+        meta["scalers"][s].transform(np.asarray(windows[s], dtype="float64").reshape(-1, 1))
+        for s in stocks
+    ]).astype("float32")
+    ids = np.array([meta["ids"][s] for s in stocks], dtype="int32")
+
+    scaled = model.predict({"window": X, "stock_id": ids}, verbose=0)
+
+    return {
+        s: float(meta["scalers"][s].inverse_transform(scaled[i].reshape(-1, 1))[0, 0])
+        for i, s in enumerate(stocks)
+    }
+
+
+def holdout_windows(series, start, lookback=LOOKBACK):
+    """
+    Every window whose target index is >= start: (windows, targets)
+    """
+
+    idx = np.arange(max(start, lookback), len(series))
+    windows = np.stack([series[i - lookback:i, 0] for i in idx])
+
+    return windows, series[idx, 0]
+
+
+def evaluate_global(model, meta, series_by_stock, split=0.8):
+    """
+    One-step-ahead MAE in price units on each stock's last (1 - split) rows
+    """
+
+    errors = {}
+
+    for stock in meta["stocks"]:
+
+        series = series_by_stock[stock]
+        windows, targets = holdout_windows(series, int(len(series) * split))
+
+        scaler = meta["scalers"][stock]
+        X = scaler.transform(windows.reshape(-1, 1)).reshape(len(windows), LOOKBACK, 1)
+        ids = np.full(len(windows), meta["ids"][stock], dtype="int32")
+
+        preds = model.predict({"window": X.astype("float32"), "stock_id": ids}, verbose=0)
+        preds = scaler.inverse_transform(preds).ravel()
+
+        errors[stock] = float(np.mean(np.abs(preds - targets)))
+
+    return errors
+
+# =========================
+# TRAIN LOOP
+# =========================
+
+def load_series():
+
+    return {
+        stock: read_stock("processed", stock, columns=["Close"])
+        for stock in list_stocks("processed")
+    }
+
+
+def run_training(force=False):
+
+    frames = load_series()
+
+    print(f"{LOG} Stocks: {len(frames)}")
+
+    paths = [GLOBAL_MODEL_PATH, GLOBAL_META_PATH]
+
+    # one fingerprint over every stock's slice
+    combined = [frames[s][["Date", "Close"]].assign(Stock=s) for s in sorted(frames)]
+    fp = fingerprint(pd.concat(combined, ignore_index=True), ["Close"], MODEL_PARAMS)
+
+    if not force and is_fresh("lstm_global", "ALL", fp, paths):
+        if not GLOBAL_WEIGHTS_PATH.exists():
+            export_global(load_model(GLOBAL_MODEL_PATH), joblib.load(GLOBAL_META_PATH))
+        print(f"{LOG} Up to date (inputs unchanged)")
+        return "cached"
+
+    series_by_stock = {s: df["Close"].to_numpy().reshape(-1, 1) for s, df in frames.items()}
+
+    model, meta = train_global(series_by_stock)
+
+    model.save(GLOBAL_MODEL_PATH)
+    joblib.dump(meta, GLOBAL_META_PATH)
+    export_global(model, meta)
+    record("lstm_global", "ALL", fp, paths + [GLOBAL_WEIGHTS_PATH], stocks=len(meta["stocks"]))
+
+    print(f"{LOG} Saved: {GLOBAL_MODEL_PATH.name} ({len(meta['stocks'])} stocks)")
+
+    return "trained"
+
+
+if __name__ == "__main__":
+    run_training()
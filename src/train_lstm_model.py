@@ -1,10 +1,13 @@
-import pandas as pd
 import numpy as np
 import joblib
+import tensorflow as tf
 from pathlib import Path
+from numpy.lib.stride_tricks import sliding_window_view
 from sklearn.preprocessing import MinMaxScaler
-from tensorflow.keras.models import Sequential
-from tensorflow.keras.layers import LSTM, Dense, Dropout
+from tensorflow.keras.models import Sequential, load_model
+from tensorflow.keras.layers import LSTM, Dense, Dropout, Embedding
+from src.store import list_stocks, read_stock
+from src.model_cache import fingerprint, is_fresh, record
 
 # =========================
 # PATHS
@@ -21,74 +24,264 @@ MODEL_DIR.mkdir(parents=True, exist_ok=True)
 LOOKBACK = 60
 EPOCHS = 15
 BATCH_SIZE = 32
+MIN_ROWS = 200
 
-# =========================
-# LOAD DATA
-# =========================
+# outputs of the optional direct multi-horizon model: one forward pass
+# forecasts up to HORIZON days instead of feeding predictions back in.
+# Its targets are offsets from the window's last (scaled) close, which
+# serving adds back; absolute levels extrapolate badly past the range
+# the scaler saw (benchmarks/bench_lstm_direct.py).
+HORIZON = 90
 
-df = pd.read_csv(DATA_PROCESSED/ "nifty50_processed.csv")
+FEATURES = ["Close"]
 
-stocks = sorted(df["Stock"].unique())
+# everything besides the data that determines a trained model
+MODEL_PARAMS = {
+    "lookback": LOOKBACK,
+    "epochs": EPOCHS,
+    "batch_size": BATCH_SIZE,
+    "min_rows": MIN_ROWS,
+    "scaler": "minmax",
+    "layers": ["lstm64_seq", "dropout0.2", "lstm64", "dropout0.2", "dense1"],
+}
 
-print("Total stocks:", len(stocks))
+DIRECT_PARAMS = {
+    **MODEL_PARAMS,
+    "horizon": HORIZON,
+    "targets": "offset_from_last",
+    "layers": ["lstm64_seq", "dropout0.2", "lstm64", "dropout0.2", f"dense{HORIZON}"],
+}
 
 # =========================
 # SEQUENCE BUILDER
 # =========================
 
 def create_sequences(data, lookback):
-    X, y = [], []
-    for i in range(lookback, len(data)):
-        X.append(data[i-lookback:i])
-        y.append(data[i])
-    return np.array(X), np.array(y)
+    """
+    Sliding windows as strided views of `data` — nothing is copied:
+    X[i] = data[i : i+lookback], y[i] = data[i+lookback]
+    """
+    X = sliding_window_view(data[:-1], lookback, axis=0).transpose(0, 2, 1)
+    y = data[lookback:]
+    return X, y
 
 # =========================
-# TRAIN LOOP
+# INPUT PIPELINE
 # =========================
 
-for stock in stocks:
+def make_dataset(data, lookback, batch_size, shuffle=True, horizon=1):
+    """
+    Streaming tf.data pipeline over one series. The series is held once;
+    each batch gathers its windows on the fly and prefetch overlaps that
+    with training, so memory stays near the size of the raw series.
+    Targets are the next value after each window, or for horizon > 1 the
+    next `horizon` values as offsets from the window's last value.
+    """
+    series = tf.constant(data, dtype=tf.float32)
+    n_windows = len(data) - lookback - horizon + 1
+    offsets = tf.range(lookback, dtype=tf.int64)
+    targets = tf.range(lookback, lookback + horizon, dtype=tf.int64)
 
-    print(f"\nTraining {stock}")
+    ds = tf.data.Dataset.range(n_windows)
 
-    stock_df = df[df["Stock"] == stock].sort_values("Date")
-    series = stock_df["Close"].values.reshape(-1,1)
+    # same per-epoch reshuffle model.fit applies to in-memory arrays
+    if shuffle:
+        ds = ds.shuffle(n_windows, reshuffle_each_iteration=True)
 
-    if len(series) < 200:
-        print("Skipping — not enough data")
-        continue
+    def gather(idx):
+        X = tf.gather(series, idx[:, None] + offsets)
+        y = tf.gather(series[:, 0], idx[:, None] + targets)
+        if horizon > 1:
+            y = y - X[:, -1]
+        return X, y
 
-    # -------- scale ----------
-    scaler = MinMaxScaler()
-    scaled = scaler.fit_transform(series)
+    return (
+        ds.batch(batch_size)
+        .map(gather, num_parallel_calls=tf.data.AUTOTUNE)
+        .prefetch(tf.data.AUTOTUNE)
+    )
+
+# =========================
+# MODEL
+# =========================
 
-    # -------- sequences -------
-    X, y = create_sequences(scaled, LOOKBACK)
+def build_model(outputs=1):
 
-    # -------- model -----------
     model = Sequential([
         LSTM(64, return_sequences=True, input_shape=(LOOKBACK, 1)),
         Dropout(0.2),
         LSTM(64),
         Dropout(0.2),
-        Dense(1)
+        Dense(outputs)
     ])
 
     model.compile(optimizer="adam", loss="mse")
 
+    return model
+
+# =========================
+# TRAIN ONE STOCK
+# =========================
+
+def train_single_stock(series, horizon=1):
+    """
+    Fit scaler + LSTM on one stock's Close series of shape (n, 1).
+    horizon > 1 trains a direct model predicting that many days at once.
+    Returns (model, scaler), or None when the history is too short.
+    """
+
+    if len(series) < MIN_ROWS:
+        return None
+
+    # -------- scale ----------
+    scaler = MinMaxScaler()
+    scaled = scaler.fit_transform(series)
+
+    # -------- input pipeline --
+    dataset = make_dataset(scaled, LOOKBACK, BATCH_SIZE, horizon=horizon)
+
+    # -------- model -----------
+    model = build_model(horizon)
+
     model.fit(
-        X, y,
+        dataset,
         epochs=EPOCHS,
-        batch_size=BATCH_SIZE,
         verbose=0
     )
 
-    # -------- save model -------
-    name = stock.replace(".NS","")
+    return model, scaler
+
+# =========================
+# EXPORT (TF-FREE SERVING)
+# =========================
+# Plain arrays the app's NumPy runtime (app/models/lstm_numpy.py) runs
+# without TensorFlow: kernels / recurrent kernels / biases of both LSTM
+# layers, the Dense head, the stock embedding of the global model and the
+# MinMaxScaler parameters (one row per stock).
+
+def model_name(stock, direct=False):
+    return stock.replace(".NS","") + ("_direct" if direct else "")
+
+
+def weights_path(stock, direct=False):
+    return MODEL_DIR / f"{model_name(stock, direct)}.npz"
+
+
+def export_weights(model, path, scaler_min, scaler_scale, stocks=None):
+
+    arrays = {
+        "scaler_min": np.asarray(scaler_min, dtype="float64").ravel(),
+        "scaler_scale": np.asarray(scaler_scale, dtype="float64").ravel(),
+    }
+
+    lstms = [layer for layer in model.layers if isinstance(layer, LSTM)]
+
+    for i, layer in enumerate(lstms, start=1):
+        kernel, recurrent, bias = layer.get_weights()
+        arrays[f"lstm{i}_kernel"] = kernel
+        arrays[f"lstm{i}_recurrent"] = recurrent
+        arrays[f"lstm{i}_bias"] = bias
+
+    for layer in model.layers:
+        if isinstance(layer, Dense):
+            arrays["dense_kernel"], arrays["dense_bias"] = layer.get_weights()
+        elif isinstance(layer, Embedding):
+            arrays["embedding"] = layer.get_weights()[0]
 
-    model.save(MODEL_DIR / f"{name}.keras")
-    joblib.dump(scaler, MODEL_DIR / f"{name}_scaler.pkl")
+    if stocks is not None:
+        arrays["stocks"] = np.array(stocks)
+
+    np.savez(path, **arrays)
+
+    return path
+
+
+def export_existing():
+    """
+    Write .npz weights for every saved .keras model that lacks them
+    """
+
+    exported = 0
+
+    for model_path in sorted(MODEL_DIR.glob("*.keras")):
+
+        scaler_path = MODEL_DIR / f"{model_path.stem}_scaler.pkl"
+        path = model_path.with_suffix(".npz")
+
+        if path.exists() or not scaler_path.exists():
+            continue
+
+        scaler = joblib.load(scaler_path)
+        export_weights(load_model(model_path), path, scaler.min_, scaler.scale_)
+        exported += 1
+
+    print(f"Exported {exported} LSTM weight files")
+
+    return exported
+
+
+def train_stock(stock, force=False, direct=False):
+    """
+    Load, fit and save one stock's model unless the saved one was trained
+    on the same data and parameters. Returns "trained", "cached" or "skipped".
+
+    With direct, trains the HORIZON-output model instead, saved next to
+    the one-step model as <stock>_direct.*
+    """
+
+    stock_df = read_stock("processed", stock, columns=FEATURES)
+
+    name = model_name(stock, direct)
+    paths = [MODEL_DIR / f"{name}.keras", MODEL_DIR / f"{name}_scaler.pkl"]
+
+    model_type = "lstm_direct" if direct else "lstm"
+    params = DIRECT_PARAMS if direct else MODEL_PARAMS
+
+    fp = fingerprint(stock_df[["Date"] + FEATURES], FEATURES, params)
+
+    if not force and is_fresh(model_type, stock, fp, paths):
+        if not weights_path(stock, direct).exists():
+            export_existing()
+        print("Up to date — inputs unchanged")
+        return "cached"
+
+    series = stock_df["Close"].values.reshape(-1,1)
+
+    result = train_single_stock(series, HORIZON if direct else 1)
+
+    if result is None:
+        print("Skipping — not enough data")
+        return "skipped"
+
+    model, scaler = result
+
+    # -------- save model -------
+    model.save(paths[0])
+    joblib.dump(scaler, paths[1])
+    export_weights(model, weights_path(stock, direct), scaler.min_, scaler.scale_)
+    record(model_type, stock, fp, paths + [weights_path(stock, direct)], rows=len(stock_df))
 
     print("Saved:", name)
 
-print("\nALL STOCK MODELS TRAINED")
+    return "trained"
+
+# =========================
+# TRAIN LOOP
+# =========================
+
+def run_training(force=False, direct=False):
+
+    stocks = list_stocks("processed")
+
+    print("Total stocks:", len(stocks))
+
+    for stock in stocks:
+
+        print(f"\nTraining {stock}")
+
+        train_stock(stock, force, direct)
+
+    print("\nALL STOCK MODELS TRAINED")
+
+if __name__ == "__main__":
+    run_training()
@@ -0,0 +1,313 @@
+import os
+import json
+import time
+import importlib
+import multiprocessing as mp
+from pathlib import Path
+from contextlib import contextmanager
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from src.store import list_stocks
+
+# =====================================================
+# PROJECT PATHS
+# =====================================================
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+MODELS_ROOT = PROJECT_ROOT / "models"
+
+# job state survives interruptions; a rerun only picks up unfinished jobs
+MANIFEST_PATH = MODELS_ROOT / "_training_manifest.json"
+
+# =====================================================
+# CONFIGURATION
+# =====================================================
+
+# model type -> (trainer module, dataset its stocks come from)
+TRAINERS = {
+    "prophet": ("src.train_prophet_model", "processed"),
+    "rf": ("src.train_rf_model", "technical"),
+    "lstm": ("src.train_lstm_model", "processed"),
+    "arima": ("src.models.classical.arima_search", "processed"),
+}
+
+# threads each worker may use for BLAS / OpenMP / TF / sklearn;
+# workers default to cores // threads so the machine is never oversubscribed
+THREADS_PER_WORKER = 1
+MAX_WORKERS = None
+
+THREAD_ENV_VARS = [
+    "OMP_NUM_THREADS",
+    "OPENBLAS_NUM_THREADS",
+    "MKL_NUM_THREADS",
+    "NUMEXPR_NUM_THREADS",
+    "VECLIB_MAXIMUM_THREADS",
+    "TF_NUM_INTRAOP_THREADS",
+    "TF_NUM_INTEROP_THREADS",
+]
+
+# trainers that can warm-start a stale model instead of refitting it
+INCREMENTAL_MODELS = {"rf"}
+
+DONE = ("trained", "updated", "cached", "skipped")
+
+LOG = "[ORCHESTRATOR]"
+
+# =====================================================
+# WORKER
+# =====================================================
+
+@contextmanager
+def worker_env(threads):
+    """
+    Thread caps set in this process's environment while a pool spawns its
+    workers, which inherit them. Setting them in the worker is too late:
+    unpickling the initializer already imports this module, and with it
+    pandas and numpy.
+    """
+
+    values = {var: str(threads) for var in THREAD_ENV_VARS}
+    values["TF_CPP_MIN_LOG_LEVEL"] = "2"
+
+    saved = {var: os.environ.get(var) for var in values}
+    os.environ.update(values)
+
+    try:
+        yield
+    finally:
+        for var, value in saved.items():
+            if value is None:
+                os.environ.pop(var, None)
+            else:
+                os.environ[var] = value
+
+
+def _init_worker(threads):
+    """
+    Runs once per worker process; trainers read the cap for their
+    explicit n_jobs / TF settings
+    """
+    _init_worker.threads = threads
+
+
+def _load_trainer(model_type):
+
+    module = importlib.import_module(TRAINERS[model_type][0])
+    threads = getattr(_init_worker, "threads", None)
+
+    if threads is not None:
+
+        # explicit n_jobs overrides the OpenMP env vars
+        if hasattr(module, "N_JOBS"):
+            module.N_JOBS = threads
+
+        if model_type == "lstm":
+            import tensorflow as tf
+            try:
+                tf.config.threading.set_intra_op_parallelism_threads(threads)
+                tf.config.threading.set_inter_op_parallelism_threads(threads)
+            except RuntimeError:
+                # runtime already initialised by an earlier job in this worker
+                pass
+
+    return module
+
+
+def run_job(model_type, stock, force=False, incremental=False):
+    """
+    Train one (model type, stock) job. Returns (status, seconds);
+    "cached" when the trainer found its saved model up to date.
+    """
+
+    started = time.perf_counter()
+
+    trainer = _load_trainer(model_type)
+
+    if incremental and model_type in INCREMENTAL_MODELS:
+        status = trainer.train_stock(stock, force, incremental=True)
+    else:
+        status = trainer.train_stock(stock, force)
+
+    return status, time.perf_counter() - started
+
+# =====================================================
+# MANIFEST
+# =====================================================
+
+def job_id(model_type, stock):
+    return f"{model_type}/{stock}"
+
+
+def load_manifest(path=MANIFEST_PATH) -> dict:
+
+    if not Path(path).exists():
+        return {"jobs": {}}
+
+    with open(path) as f:
+        return json.load(f)
+
+
+def save_manifest(manifest, path=MANIFEST_PATH):
+
+    path = Path(path)
+    tmp = path.with_suffix(".tmp")
+
+    with open(tmp, "w") as f:
+        json.dump(manifest, f, indent=2, sort_keys=True)
+
+    tmp.replace(path)
+
+
+def plan_jobs(model_types, manifest, stocks=None) -> list:
+    """
+    Every (model type, stock) pair not already finished in the manifest
+    """
+
+    jobs = []
+
+    for model_type in model_types:
+
+        dataset = TRAINERS[model_type][1]
+
+        for stock in stocks or list_stocks(dataset):
+            state = manifest["jobs"].get(job_id(model_type, stock), {})
+            if state.get("status") not in DONE:
+                jobs.append((model_type, stock))
+
+    return jobs
+
+# =====================================================
+# ORCHESTRATOR
+# =====================================================
+
+def run_all(
+    model_types=("prophet", "rf", "lstm"),
+    stocks=None,
+    max_workers=MAX_WORKERS,
+    threads_per_worker=THREADS_PER_WORKER,
+    fresh=False,
+    force=False,
+    incremental=False,
+    manifest_path=MANIFEST_PATH,
+):
+    """
+    Train every (model type, stock) job across a process pool.
+
+    Job status and timings are written to the manifest as each job
+    finishes; if a run is interrupted, the next one only runs the jobs it
+    left unfinished. Once a run completes, the next one starts over and
+    the trainers' content-hash cache skips models whose inputs are
+    unchanged. force=True retrains regardless of the cache;
+    incremental=True warm-starts stale models that support it.
+    """
+
+    manifest = load_manifest(manifest_path)
+
+    if fresh or manifest.get("complete"):
+        manifest = {"jobs": {}}
+
+    manifest["complete"] = False
+    jobs = plan_jobs(model_types, manifest, stocks)
+
+    cores = os.cpu_count() or 1
+    workers = max_workers or max(1, cores // threads_per_worker)
+    workers = min(workers, len(jobs)) or 1
+
+    done_before = sum(
+        1 for s in manifest["jobs"].values() if s.get("status") in DONE
+    )
+
+    print("\n==============================")
+    print("TRAINING ORCHESTRATOR")
+    print("==============================")
+    print(f"{LOG} Jobs to run: {len(jobs)} (already done: {done_before})")
+    print(f"{LOG} Workers: {workers} x {threads_per_worker} thread(s)")
+
+    started = time.perf_counter()
+
+    # spawn: TF and BLAS thread pools must not be inherited through fork;
+    # workers start with the caps in their environment
+    with worker_env(threads_per_worker), ProcessPoolExecutor(
+        max_workers=workers,
+        mp_context=mp.get_context("spawn"),
+        initializer=_init_worker,
+        initargs=(threads_per_worker,),
+    ) as pool:
+
+        futures = {}
+
+        for model_type, stock in jobs:
+            manifest["jobs"][job_id(model_type, stock)] = {
+                "model": model_type, "stock": stock, "status": "pending"
+            }
+            futures[pool.submit(run_job, model_type, stock, force, incremental)] = (model_type, stock)
+
+        save_manifest(manifest, manifest_path)
+
+        for future in as_completed(futures):
+
+            model_type, stock = futures[future]
+            state = manifest["jobs"][job_id(model_type, stock)]
+
+            try:
+                status, seconds = future.result()
+                state.update(status=status, seconds=round(seconds, 3))
+                print(f"{LOG} {job_id(model_type, stock):<28} {status:<8} {seconds:>8.2f}s")
+
+            except Exception as e:
+                state.update(status="failed", error=str(e))
+                print(f"{LOG} {job_id(model_type, stock):<28} FAILED   {e}")
+
+            state["finished"] = time.strftime("%Y-%m-%dT%H:%M:%S")
+            save_manifest(manifest, manifest_path)
+
+    wall = time.perf_counter() - started
+
+    # every job has an outcome; the next run plans from scratch
+    manifest["complete"] = True
+    save_manifest(manifest, manifest_path)
+
+    return report(manifest, jobs, wall)
+
+
+def report(manifest, jobs, wall) -> dict:
+    """
+    Per model type: jobs run, outcomes, summed job time and throughput
+    """
+
+    summary = {}
+
+    for model_type, stock in jobs:
+        state = manifest["jobs"][job_id(model_type, stock)]
+        row = summary.setdefault(model_type, {
+            "trained": 0, "updated": 0, "cached": 0, "skipped": 0, "failed": 0,
+            "job_seconds": 0.0
+        })
+        row[state["status"]] = row.get(state["status"], 0) + 1
+        row["job_seconds"] += state.get("seconds", 0.0)
+
+    job_seconds = sum(r["job_seconds"] for r in summary.values())
+
+    print("\n==============================")
+    print("TRAINING COMPLETE")
+    print("==============================")
+    print(
+        f"{'model':<10}{'trained':>9}{'updated':>9}{'cached':>8}{'skipped':>9}"
+        f"{'failed':>8}{'job s':>10}{'s/job':>8}"
+    )
+    for model_type, row in summary.items():
+        n = sum(row[k] for k in ("trained", "updated", "cached", "skipped", "failed"))
+        print(
+            f"{model_type:<10}{row['trained']:>9}{row['updated']:>9}{row['cached']:>8}"
+            f"{row['skipped']:>9}{row['failed']:>8}"
+            f"{row['job_seconds']:>10.1f}{row['job_seconds'] / max(n, 1):>8.2f}"
+        )
+    print(f"Wall time    : {wall:.1f}s")
+    print(f"Throughput   : {len(jobs) / wall * 60 if wall else 0:.1f} jobs/min")
+    print(f"Parallelism  : {job_seconds / wall if wall else 0:.1f}x (job time / wall time)")
+    print("==============================\n")
+
+    return {"models": summary, "jobs": len(jobs), "seconds": wall}
+
+
+if __name__ == "__main__":
+    run_all()
@@ -1,7 +1,11 @@
-import pandas as pd
+import copy
+import numpy as np
 import joblib
 from pathlib import Path
 from prophet import Prophet
+from prophet.serialize import model_to_json
+from src.store import list_stocks, read_stock
+from src.model_cache import fingerprint, is_fresh, record, load_artifacts, artifact_key
 
 # =========================================================
 # PROJECT PATHS (robust resolution)
@@ -21,94 +25,242 @@ MODEL_DIR.mkdir(parents=True, exist_ok=True)
 MIN_DATA_POINTS = 300        # minimum history required
 LOG_PREFIX = "[PROPHET TRAIN]"
 
+FEATURES = ["Date", "Close"]
+
+# LONG TERM OPTIMIZED MODEL
+PROPHET_PARAMS = {
+    "daily_seasonality": False,
+    "weekly_seasonality": False,
+    "yearly_seasonality": True,
+    "changepoint_prior_scale": 0.05,
+    "seasonality_mode": "multiplicative",
+}
+
+# refit from the saved model's parameters instead of a cold start
+WARM_START = True
+
+# rows of training history kept in the slim serving artifact; predict()
+# on future dates only needs the history to exist, not its contents
+SLIM_HISTORY_ROWS = 2
+
 # =========================================================
-# LOAD DATA
+# TRAIN ONE STOCK
 # =========================================================
 
-print(f"{LOG_PREFIX} Loading dataset...")
+def stan_init(model):
+    """
+    Fitted parameters of a saved model in the form Prophet.fit(init=...)
+    expects: the optimizer starts from them instead of its default guess
+    """
+
+    init = {}
+
+    for name in ["k", "m", "sigma_obs"]:
+        init[name] = float(np.mean(model.params[name]))
+
+    for name in ["delta", "beta"]:
+        init[name] = np.mean(model.params[name], axis=0)
+
+    return init
 
-df = pd.read_csv(DATA_PATH/"nifty50_processed.csv")
 
-stocks = sorted(df["Stock"].unique())
+def train_single_stock(stock_df, init=None):
+    """
+    Fit the long-term Prophet model on one stock; None if history is too short.
+    `init` (from stan_init) warm-starts the optimizer.
+    """
+
+    # -------------------------------------------------
+    # Check minimum data
+    # -------------------------------------------------
+    if len(stock_df) < MIN_DATA_POINTS:
+        return None
+
+    # -------------------------------------------------
+    # Prophet format
+    # -------------------------------------------------
+    prophet_df = stock_df[FEATURES]
+    prophet_df.columns = ["ds", "y"]
+
+    model = Prophet(**PROPHET_PARAMS)
+
+    if init is None:
+        model.fit(prophet_df)
+    else:
+        model.fit(prophet_df, init=init)
+
+    return model
 
-print(f"{LOG_PREFIX} Total stocks found: {len(stocks)}")
 
 # =========================================================
-# TRAINING LOOP
+# SLIM SERVING ARTIFACT
 # =========================================================
 
-trained = 0
-skipped = 0
-failed = 0
+def slim_path(stock):
+    return MODEL_DIR / f"{stock}.json"
+
+
+def slim_model(model):
+    """
+    Copy of a fitted model without its training history or Stan state:
+    enough to predict future dates, a fraction of the size
+    """
+
+    slim = copy.copy(model)
+
+    slim.history = model.history.tail(SLIM_HISTORY_ROWS).copy()
+    slim.history_dates = model.history_dates.tail(SLIM_HISTORY_ROWS).copy()
+    slim.stan_fit = None
+    slim.fit_kwargs = {}
+
+    return slim
+
+
+def export_slim(model, stock):
+    """
+    Write the JSON artifact the app's prophet_service loads
+    """
+
+    path = slim_path(stock)
+    path.write_text(model_to_json(slim_model(model)))
+
+    return path
+
+
+def export_existing():
+    """
+    Write slim artifacts for every saved .pkl model that lacks one
+    """
+
+    exported = 0
+
+    for model_path in sorted(MODEL_DIR.glob("*.pkl")):
+
+        stock = model_path.stem
+
+        if not slim_path(stock).exists():
+            export_slim(joblib.load(model_path), stock)
+            exported += 1
 
-for stock in stocks:
+    print(f"{LOG_PREFIX} Exported {exported} slim artifacts")
+
+    return exported
+
+
+def warm_start_init(stock, params, model_path):
+    """
+    Parameters of the saved model, if it was fitted with the same settings
+    """
+
+    entry = load_artifacts().get(artifact_key("prophet", stock))
+
+    if entry is None or entry.get("params") != params or not model_path.exists():
+        return None
 
     try:
-        print(f"\n{LOG_PREFIX} Processing {stock}")
-
-        model_path = MODEL_DIR / f"{stock}.pkl"
-
-        # -------------------------------------------------
-        # Skip already trained
-        # -------------------------------------------------
-        if model_path.exists():
-            print(f"{LOG_PREFIX} Skipped (already trained)")
-            skipped += 1
-            continue
-
-        stock_df = df[df["Stock"] == stock].copy()
-        stock_df = stock_df.sort_values("Date")
-
-        # -------------------------------------------------
-        # Check minimum data
-        # -------------------------------------------------
-        if len(stock_df) < MIN_DATA_POINTS:
-            print(f"{LOG_PREFIX} Skipped (insufficient data: {len(stock_df)})")
-            skipped += 1
-            continue
-
-        # -------------------------------------------------
-        # Prophet format
-        # -------------------------------------------------
-        prophet_df = stock_df[["Date", "Close"]]
-        prophet_df.columns = ["ds", "y"]
-
-        # -------------------------------------------------
-        # LONG TERM OPTIMIZED MODEL
-        # -------------------------------------------------
-        model = Prophet(
-            daily_seasonality=False,
-            weekly_seasonality=False,
-            yearly_seasonality=True,
-            changepoint_prior_scale=0.05,
-            seasonality_mode="multiplicative"
-        )
+        return stan_init(joblib.load(model_path))
+    except Exception as e:
+        print(f"{LOG_PREFIX} Cold start (saved model unusable: {e})")
+        return None
 
-        model.fit(prophet_df)
 
-        # -------------------------------------------------
-        # Save model
-        # -------------------------------------------------
-        joblib.dump(model, model_path)
+def train_stock(stock, force=False, warm_start=WARM_START):
+    """
+    Load, fit and save one stock's model unless the saved one was trained
+    on the same data and parameters. Returns "trained", "cached" or "skipped".
+
+    With warm_start, a stale model is refit on the full history with the
+    optimizer seeded from its previous parameters.
+    """
 
-        print(f"{LOG_PREFIX} Saved → {model_path.name}")
-        trained += 1
+    stock_df = read_stock("processed", stock, columns=["Close"])
+    model_path = MODEL_DIR / f"{stock}.pkl"
 
+    params = {**PROPHET_PARAMS, "min_data_points": MIN_DATA_POINTS}
+    fp = fingerprint(stock_df[FEATURES], FEATURES, params)
+
+    if not force and is_fresh("prophet", stock, fp, [model_path]):
+        if not slim_path(stock).exists():
+            export_slim(joblib.load(model_path), stock)
+        print(f"{LOG_PREFIX} Up to date (inputs unchanged)")
+        return "cached"
+
+    init = warm_start_init(stock, params, model_path) if warm_start and not force else None
+
+    try:
+        model = train_single_stock(stock_df, init)
     except Exception as e:
-        print(f"{LOG_PREFIX} FAILED for {stock}")
-        print("Error:", e)
-        failed += 1
+        if init is None:
+            raise
+        # e.g. a different number of changepoints than the saved fit
+        print(f"{LOG_PREFIX} Warm start failed ({e}), refitting cold")
+        init = None
+        model = train_single_stock(stock_df)
+
+    if model is None:
+        print(f"{LOG_PREFIX} Skipped (insufficient data: {len(stock_df)})")
+        return "skipped"
+
+    # full model for warm starts, slim copy for serving
+    joblib.dump(model, model_path)
+    export_slim(model, stock)
+
+    record(
+        "prophet", stock, fp, [model_path, slim_path(stock)],
+        rows=len(stock_df), params=params, warm_start=init is not None
+    )
 
+    print(f"{LOG_PREFIX} Saved → {model_path.name}")
+
+    return "trained"
 
 # =========================================================
-# SUMMARY
+# TRAINING LOOP
 # =========================================================
 
-print("\n==========================================")
-print(" PROPHET TRAINING COMPLETE")
-print("==========================================")
-print("New models trained :", trained)
-print("Skipped            :", skipped)
-print("Failed             :", failed)
-print("Saved in           :", MODEL_DIR)
-print("==========================================")
+def run_training(force=False):
+
+    print(f"{LOG_PREFIX} Loading dataset...")
+
+    stocks = list_stocks("processed")
+
+    print(f"{LOG_PREFIX} Total stocks found: {len(stocks)}")
+
+    trained = 0
+    skipped = 0
+    failed = 0
+
+    for stock in stocks:
+
+        try:
+            print(f"\n{LOG_PREFIX} Processing {stock}")
+
+            # -------------------------------------------------
+            # Retrain only when inputs or parameters changed
+            # -------------------------------------------------
+            if train_stock(stock, force) == "trained":
+                trained += 1
+            else:
+                skipped += 1
+
+        except Exception as e:
+            print(f"{LOG_PREFIX} FAILED for {stock}")
+            print("Error:", e)
+            failed += 1
+
+    # =========================================================
+    # SUMMARY
+    # =========================================================
+
+    print("\n==========================================")
+    print(" PROPHET TRAINING COMPLETE")
+    print("==========================================")
+    print("New models trained :", trained)
+    print("Skipped            :", skipped)
+    print("Failed             :", failed)
+    print("Saved in           :", MODEL_DIR)
+    print("==========================================")
+
+
+if __name__ == "__main__":
+    run_training()
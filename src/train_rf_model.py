@@ -1,8 +1,9 @@
-import pandas as pd
 import numpy as np
 import joblib
 from pathlib import Path
 from sklearn.ensemble import RandomForestRegressor
+from src.store import list_stocks, read_stock
+from src.model_cache import fingerprint, is_fresh, record, load_artifacts, artifact_key
 
 # =====================================================
 # PROJECT PATHS
@@ -10,7 +11,7 @@ from sklearn.ensemble import RandomForestRegressor
 
 PROJECT_ROOT = Path(__file__).resolve().parents[1]
 
-DATA_PATH = PROJECT_ROOT / "data" / "processed" / "nifty50_technical.csv"
+DATASET = "technical"
 MODEL_DIR = PROJECT_ROOT / "models" / "rf"
 
 MODEL_DIR.mkdir(parents=True, exist_ok=True)
@@ -29,13 +30,33 @@ FEATURES = [
 
 MIN_ROWS_REQUIRED = 200
 
+RF_PARAMS = {
+    "n_estimators": 200,
+    "max_depth": 10,
+    "random_state": 42,
+}
+
+# target is the next day's close, fitted on the first 80% of rows
+TARGET = "next_close"
+TRAIN_SPLIT = 0.8
+
+# incremental mode: grow the saved forest on recent rows instead of refitting
+INCREMENTAL_TREES = 10      # trees added per update
+RECENT_WINDOW = 1000        # latest training rows the new trees are fitted on
+TREE_BUDGET = 200           # oldest trees are retired beyond this
+FULL_REFIT_EVERY = 20       # updates before a full refit is forced
+MAX_MAE_DRIFT = 0.10        # full refit once holdout MAE is 10% worse
+
+# cores per forest; the training orchestrator lowers this per worker
+N_JOBS = -1
+
 LOG = "[ML TRAIN]"
 
 # =====================================================
 # TRAINING FUNCTION FOR ONE STOCK
 # =====================================================
 
-def train_single_stock(stock_df):
+def make_xy(stock_df):
 
     stock_df = stock_df.sort_values("Date").copy()
 
@@ -43,44 +64,183 @@ def train_single_stock(stock_df):
     stock_df["Target"] = stock_df["Close"].shift(-1)
     stock_df = stock_df.dropna()
 
-    if len(stock_df) < MIN_ROWS_REQUIRED:
-        return None
+    return stock_df[FEATURES], stock_df["Target"]
+
+
+def train_single_stock(stock_df):
+
+    X, y = make_xy(stock_df)
 
-    X = stock_df[FEATURES]
-    y = stock_df["Target"]
+    if len(X) < MIN_ROWS_REQUIRED:
+        return None
 
-    split = int(len(X) * 0.8)
+    split = int(len(X) * TRAIN_SPLIT)
 
     X_train = X[:split]
     y_train = y[:split]
 
-    model = RandomForestRegressor(
-        n_estimators=200,
-        max_depth=10,
-        random_state=42,
-        n_jobs=-1
-    )
+    model = RandomForestRegressor(**RF_PARAMS, n_jobs=N_JOBS)
 
     model.fit(X_train, y_train)
 
     return model
 
+
+def update_single_stock(model, stock_df):
+    """
+    Warm-start update of an existing forest: retire the oldest trees so the
+    forest stays within TREE_BUDGET, then grow INCREMENTAL_TREES new ones on
+    the most recent RECENT_WINDOW training rows
+    """
+
+    X, y = make_xy(stock_df)
+
+    if len(X) < MIN_ROWS_REQUIRED:
+        return None
+
+    split = int(len(X) * TRAIN_SPLIT)
+
+    X_recent = X[:split][-RECENT_WINDOW:]
+    y_recent = y[:split][-RECENT_WINDOW:]
+
+    # estimators_ is in fit order, oldest first
+    keep = max(TREE_BUDGET - INCREMENTAL_TREES, 0)
+    model.estimators_ = model.estimators_[len(model.estimators_) - keep:] if keep else []
+
+    model.set_params(
+        warm_start=True,
+        n_estimators=len(model.estimators_) + INCREMENTAL_TREES,
+        n_jobs=N_JOBS
+    )
+    model.fit(X_recent, y_recent)
+    model.set_params(warm_start=False)
+
+    return model
+
+
+def holdout_mae(model, stock_df):
+    """
+    MAE on the rows after the training split
+    """
+
+    X, y = make_xy(stock_df)
+    split = int(len(X) * TRAIN_SPLIT)
+
+    return float(np.mean(np.abs(model.predict(X[split:]) - y[split:].to_numpy())))
+
+
+def _can_update(entry, params, model_path):
+    """
+    An incremental update is allowed on top of a model fitted with the same
+    hyperparameters, until it has taken FULL_REFIT_EVERY updates or its
+    holdout error drifted more than MAX_MAE_DRIFT above the last full refit
+    """
+
+    if entry is None or entry.get("params") != params or not model_path.exists():
+        return False
+
+    if entry.get("updates", 0) >= FULL_REFIT_EVERY:
+        return False
+
+    full_mae = entry.get("full_refit_mae")
+    mae = entry.get("holdout_mae")
+
+    if full_mae is None or mae is None:
+        return False
+
+    return mae <= full_mae * (1 + MAX_MAE_DRIFT)
+
+
+def train_stock(stock, force=False, incremental=False):
+    """
+    Load, fit and save one stock's model unless the saved one was trained
+    on the same data and parameters. Returns "trained", "updated",
+    "cached" or "skipped".
+
+    With incremental=True a stale model is warm-start updated instead of
+    refit from scratch, falling back to a full refit when _can_update
+    says the forest has drifted too far, or when the update itself leaves
+    its holdout MAE more than MAX_MAE_DRIFT above the last full refit.
+    """
+
+    # only the columns the model reads take part in the fingerprint
+    stock_df = read_stock(DATASET, stock, columns=["Close"] + FEATURES)
+    model_path = MODEL_DIR / f"{stock}.pkl"
+
+    params = {**RF_PARAMS, "train_split": TRAIN_SPLIT, "min_rows": MIN_ROWS_REQUIRED}
+    fp = fingerprint(stock_df[["Date", "Close"] + FEATURES], FEATURES + [TARGET], params)
+
+    if not force and is_fresh("rf", stock, fp, [model_path]):
+        print(f"{LOG} Up to date (inputs unchanged)")
+        return "cached"
+
+    entry = load_artifacts().get(artifact_key("rf", stock))
+    model = None
+
+    if incremental and not force and _can_update(entry, params, model_path):
+
+        updated = update_single_stock(joblib.load(model_path), stock_df)
+
+        if updated is None:
+            print(f"{LOG} Skipped (insufficient data)")
+            return "skipped"
+
+        mae = holdout_mae(updated, stock_df)
+        full_mae = entry["full_refit_mae"]
+
+        print(
+            f"{LOG} Warm-start update #{entry.get('updates', 0) + 1}: "
+            f"holdout MAE {mae:.4f} (last full refit {full_mae:.4f})"
+        )
+
+        # a drifted forest is never saved; refit in the same call
+        if mae <= full_mae * (1 + MAX_MAE_DRIFT):
+            model = updated
+            status = "updated"
+            quality = {
+                "updates": entry.get("updates", 0) + 1,
+                "holdout_mae": mae,
+                "full_refit_mae": full_mae,
+            }
+        else:
+            print(f"{LOG} Drifted more than {MAX_MAE_DRIFT:.0%} — full refit")
+
+    if model is None:
+
+        model = train_single_stock(stock_df)
+        status = "trained"
+
+        if model is None:
+            print(f"{LOG} Skipped (insufficient data)")
+            return "skipped"
+
+        mae = holdout_mae(model, stock_df)
+        quality = {"updates": 0, "holdout_mae": mae, "full_refit_mae": mae}
+
+    joblib.dump(model, model_path)
+    record(
+        "rf", stock, fp, [model_path],
+        rows=len(stock_df), params=params, trees=len(model.estimators_), **quality
+    )
+
+    print(f"{LOG} Saved → {model_path.name}")
+
+    return status
+
 # =====================================================
 # MAIN TRAINING PIPELINE
 # =====================================================
 
-def run_training():
+def run_training(force=False, incremental=False):
 
     print("\n==============================")
     print("ML BATCH TRAINING STARTED")
     print("==============================")
 
-    df = pd.read_csv(DATA_PATH)
-    df["Date"] = pd.to_datetime(df["Date"])
-
-    stocks = sorted(df["Stock"].unique())
+    stocks = list_stocks(DATASET)
 
     trained = 0
+    updated = 0
     skipped = 0
     failed = 0
 
@@ -89,29 +249,17 @@ def run_training():
         try:
             print(f"\n{LOG} Processing {stock}")
 
-            model_path = MODEL_DIR / f"{stock}.pkl"
-
             # ---------------------------
-            # Skip existing model
+            # Retrain only stale models
             # ---------------------------
-            if model_path.exists():
-                print(f"{LOG} Skipped (already trained)")
-                skipped += 1
-                continue
-
-            stock_df = df[df["Stock"] == stock].copy()
+            status = train_stock(stock, force, incremental)
 
-            model = train_single_stock(stock_df)
-
-            if model is None:
-                print(f"{LOG} Skipped (insufficient data)")
+            if status == "trained":
+                trained += 1
+            elif status == "updated":
+                updated += 1
+            else:
                 skipped += 1
-                continue
-
-            joblib.dump(model, model_path)
-            print(f"{LOG} Saved → {model_path.name}")
-
-            trained += 1
 
         except Exception as e:
             print(f"{LOG} FAILED for {stock}")
@@ -122,6 +270,7 @@ def run_training():
     print("ML TRAINING COMPLETE")
     print("==============================")
     print("Trained :", trained)
+    print("Updated :", updated)
     print("Skipped :", skipped)
     print("Failed  :", failed)
     print("Saved in:", MODEL_DIR)